@@ -8,11 +8,16 @@
 
 """Openstack backend methods."""
 
-import time
+import hashlib
 import sys
 import os
-from typing import Tuple, Optional, Any
-from collections import namedtuple
+import queue
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Iterator, Tuple, Optional, Any
+from collections import deque, namedtuple
 from pathlib import Path
 
 import openstack
@@ -20,9 +25,30 @@ from openstack.config import OpenStackConfig
 from openstack.exceptions import ConfigException
 from openstack.compute.v2.server import Server
 
+from ewccli.backends.openstack.concurrency import run_concurrently
+from ewccli.backends.openstack.image_families import get_image_family
+from ewccli.backends.openstack.inventory import Inventory
+from ewccli.backends.openstack.inventory import InventoryError
+from ewccli.backends.openstack.inventory import get_inventory_file
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.backends.openstack.retry import RetryPolicy
+from ewccli.backends.openstack.retry import get_retry_policy
+from ewccli.backends.openstack.retry import retry_call
+from ewccli.backends.openstack.token_cache import get_token_cache_file
+from ewccli.backends.openstack.topology_cache import TopologyCache
+from ewccli.backends.openstack.topology_cache import get_topology_cache_file
+from ewccli.backends.openstack.waiters import wait_for_floating_ip_active
+from ewccli.backends.openstack.waiters import wait_for_floating_ip_released
+from ewccli.backends.openstack.waiters import wait_for_server_deleted
+from ewccli.backends.openstack.waiters import wait_for_volumes_deleted
+from ewccli.backends.openstack.waiters import wait_for_volumes_status
+from ewccli.backends.openstack.token_cache import load_auth_state
+from ewccli.backends.openstack.token_cache import save_auth_state
+from ewccli.backends.openstack.token_cache import save_auth_state_on_reauthentication
 from ewccli.logger import get_logger
 from ewccli.enums import Federee
 from ewccli.configuration import config as ewc_hub_config
+from ewccli.utils import get_profile_cache_path
 
 _LOGGER = get_logger(__name__)
 
@@ -38,9 +64,109 @@ AttachVolumesResult = namedtuple("ExtraVolumesResult", "success changed")
 DetachVolumesResult = namedtuple("ExtraVolumesResult", "success changed")
 ExternalIPResult = namedtuple("ExternalIPResult", "success changed")
 NetworkResult = namedtuple("NetworkResult", "success changed")
+ServerTagsResult = namedtuple("ServerTagsResult", "success changed")
+# Server inputs resolved on Openstack.
+# image            image, or None if unknown
+# flavour          flavour, or None if not requested or unknown
+# security_groups  security groups by requested name or ID
+# networks         networks in the requested order
+# errors           messages for the unknown flavour, security groups and networks
+ServerInputsResult = namedtuple(
+    "ServerInputsResult", "image flavour security_groups networks errors"
+)
 
 _MAX_CHARACTERS_SERVER_NAME_OPENSTACK = 63
 
+# Nova tag of the servers created by the ewccli, filtered on server side.
+# The servers also carry the legacy deployed=ewccli metadata.
+EWCCLI_SERVER_TAG = "ewccli"
+# Neutron tag of the floating IPs reserved in the pool of the ewccli.
+# The pool is made of the tagged floating IPs not bound to a port.
+EWCCLI_FLOATING_IP_POOL_TAG = "ewccli-pool"
+
+# Seconds after which a refresh of the inventory lists every server again,
+# catching the drift missed by the incremental refreshes (e.g. tags removed)
+_INVENTORY_FULL_REFRESH_S = 24 * 60 * 60
+# Nova statuses of the servers gone, returned by the changes-since listings
+DELETED_SERVER_STATUSES = ("DELETED", "SOFT_DELETED")
+
+
+def is_ewccli_server(server) -> bool:
+    """Whether the server was created by the ewccli (tag or legacy metadata)."""
+    return (
+        EWCCLI_SERVER_TAG in (server.get("tags") or [])
+        or (server.get("metadata") or {}).get("deployed") == "ewccli"
+    )
+
+
+def is_legacy_server(server) -> bool:
+    """Whether the server carries only the legacy deployed=ewccli metadata."""
+    return (server.get("metadata") or {}).get("deployed") == "ewccli" and (
+        EWCCLI_SERVER_TAG not in (server.get("tags") or [])
+    )
+
+
+def is_deleted_server(server) -> bool:
+    """Whether a server listed with changes-since is gone."""
+    return server.status in DELETED_SERVER_STATUSES
+
+
+def ewccli_servers_query(show_all: bool = False, legacy_servers: bool = False) -> dict:
+    """Return the filters listing the servers of the ewccli.
+
+    The servers are filtered by tag on server side, unless servers carrying only
+    the legacy metadata may remain: every server is then listed, the caller
+    filtering them with is_ewccli_server.
+
+    :param show_all: list the servers not created by the ewccli too
+    :param legacy_servers: servers without tag may remain
+    """
+    return {} if show_all or legacy_servers else {"tags": EWCCLI_SERVER_TAG}
+
+
+class ChangesSince:
+    """Watermark of the Nova changes-since listings of the servers.
+
+    The watermark is the most recent update time seen. Using the update times
+    reported by Nova rather than the client clock avoids any clock skew.
+    """
+
+    def __init__(
+        self,
+        value: Optional[str] = None,
+        show_all: bool = False,
+        legacy_servers: bool = False,
+    ):
+        """
+        Initialize the watermark.
+
+        :param value: most recent update time seen, None before the first listing
+        :param show_all: list the servers not created by the ewccli too
+        :param legacy_servers: servers without tag may remain, see legacy_servers_remain
+        """
+        self.value = value
+        self.show_all = show_all
+        self.legacy_servers = legacy_servers
+
+    def query(self) -> dict:
+        """Return the filters listing the servers changed since the watermark."""
+        if self.value is None:
+            # Nothing seen yet: the servers of the ewccli are listed
+            return ewccli_servers_query(
+                show_all=self.show_all, legacy_servers=self.legacy_servers
+            )
+
+        # Deleted servers may lose their tags, so the changes are filtered by the caller
+        return {"changes_since": self.value}
+
+    def advance(self, server) -> None:
+        """Move the watermark to the update time of the server, if more recent."""
+        updated_at = server.get("updated_at")
+
+        # Nova reports ISO 8601 UTC times, which compare as strings
+        if updated_at and (self.value is None or updated_at > self.value):
+            self.value = updated_at
+
 
 class OpenstackBackend:
     """Openstack backend class."""
@@ -50,6 +176,7 @@ class OpenstackBackend:
         application_credential_id: Optional[str] = None,
         application_credential_secret: Optional[str] = None,
         auth_url: Optional[str] = None,
+        profile: Optional[str] = None,
     ):
         """
         Initialize the OpenStack backend.
@@ -57,7 +184,9 @@ class OpenstackBackend:
         :param application_credential_id: OpenStack application credential ID.
         :param application_credential_secret: OpenStack application credential secret.
         :param auth_url: Openstack Auth URL
+        :param profile: EWC CLI profile name, used to scope the on-disk caches.
         """
+        self.profile = profile
         try:
             if application_credential_id and application_credential_secret:
                 # Try loading from parameters or fall back to env vars
@@ -129,8 +258,45 @@ class OpenstackBackend:
             app_version=app_version,
         )
 
+        if ewc_hub_config.EWC_CLI_TOKEN_CACHE and os_app_credential_id and os_auth_url:
+            self._authorize_with_token_cache(
+                conn=os_connection,
+                credential_id=os_app_credential_id,
+                auth_url=os_auth_url,
+            )
+
         return os_connection
 
+    def _authorize_with_token_cache(
+        self,
+        conn: openstack.connection.Connection,
+        credential_id: str,
+        auth_url: str,
+    ):
+        """Reuse a cached Keystone token and service catalog or cache a fresh one.
+
+        :param conn: Openstack connection
+        :param credential_id: Openstack application credential ID
+        :param auth_url: Openstack authorization URL
+        """
+        cache_file = get_token_cache_file(
+            credential_id=credential_id,
+            auth_url=auth_url,
+            profile=getattr(self, "profile", None),
+        )
+        auth_plugin = conn.session.auth
+
+        auth_state = load_auth_state(cache_file)
+        if auth_state:
+            auth_plugin.set_auth_state(auth_state)
+            _LOGGER.debug(f"Reusing cached Openstack token from {cache_file}.")
+        else:
+            # Authenticate once and persist token + service catalog for next invocations
+            conn.authorize()
+            save_auth_state(cache_file, auth_plugin.get_auth_state())
+
+        save_auth_state_on_reauthentication(auth_plugin, cache_file)
+
     def create_server(
         self,
         conn: openstack.connection.Connection,
@@ -140,11 +306,13 @@ class OpenstackBackend:
         networks: tuple,
         keypair_name: str,
         sec_groups: tuple,
-        attempts: int = 1,
-        retry_delay_s: int = 30,
+        attempts: Optional[int] = None,
+        retry_delay_s: Optional[float] = None,
         wait_time_s: int = 600,
         boot_from_volume: bool = False,
         dry_run: bool = False,
+        resolver: Optional[OpenstackResourceResolver] = None,
+        retry_policy: Optional[RetryPolicy] = None,
     ) -> Tuple[ServerResult, Optional[str], dict[Any, Any]]:
         """Create an OpenStack server.
 
@@ -164,11 +332,14 @@ class OpenstackBackend:
         :param sec_groups: list of security groups for the VM (tuple)
         :param attempts: The number of create attempts. If the server fails
                         this function uses this value to decide whether to try
-                        ans create it.
-        :param retry_delay_s: The delay between creation attempts.
+                        ans create it. Defaults to the create_server retry policy.
+        :param retry_delay_s: The initial delay between creation attempts, growing
+                        exponentially. Defaults to the create_server retry policy.
         :param wait_time_s: The maximum period to wait (for creation or deletion).
         :boot_from_volume: If root disk is required and flavour doesn't set one.
         :param dry_run: Dry run.
+        :param resolver: resolver shared by the steps of the deployment.
+        :param retry_policy: retry policy replacing the create_server one.
         """
         if len(server_name) > _MAX_CHARACTERS_SERVER_NAME_OPENSTACK:
             _LOGGER.error(
@@ -177,8 +348,10 @@ class OpenstackBackend:
             )
             sys.exit(1)
 
+        resolver = resolver or self.create_resolver(conn)
+
         # Do nothing if the server appears to exist
-        server_info = conn.get_server(name_or_id=server_name)
+        server_info = resolver.get_server(server_name)
 
         if server_info:
             # Yes!
@@ -197,197 +370,156 @@ class OpenstackBackend:
             )
 
         _LOGGER.info("⏳ This could take a few minutes, grab a coffee ☕️ meanwhile...")
-        openstack_image_name = image_name
-        image = conn.compute.find_image(openstack_image_name)
-
-        if not image:
-            return ServerResult(False, False, 0), f"Unknown image ({image_name})", {}
-
-        flavour = conn.compute.find_flavor(flavour_name)
-
-        if not flavour:
-            for flavor in conn.compute.flavors():
-                _LOGGER.info(
-                    f"Name: {flavor.name}, ID: {flavor.id}, VCPUs: {flavor.vcpus}, RAM: {flavor.ram} MB"
-                )
-
-            return (
-                ServerResult(False, False, 0),
-                f"Unknown flavour ({flavour_name}). Check list above.",
-                {},
-            )
-
-        security_group_names = []
-
-        for security_group_name in sec_groups:
-            sec_group_name = conn.get_security_group(security_group_name)
-
-            if not sec_group_name:
-                for sg in conn.network.security_groups():
-                    _LOGGER.info(
-                        f"Name: {sg.name}, ID: {sg.id}, Description: {sg.description or 'No description'}"
-                    )
-                return (
-                    ServerResult(False, False, 0),
-                    f"Unknown security group ({security_group_name}). Check list above.",
-                    {},
-                )
-
-            security_group_names.append({"name": sec_group_name.name})
-
-        network_info = []
+        server_inputs = self.resolve_server_inputs(
+            resolver=resolver,
+            image_name=image_name,
+            flavour_name=flavour_name,
+            networks=networks,
+            security_groups=sec_groups,
+        )
+        image = server_inputs.image
+        errors = list(server_inputs.errors)
 
-        if networks:
-            for network_name in networks:
-                network = conn.network.find_network(network_name)
+        if not flavour_name:
+            errors.insert(0, f"Unknown flavour ({flavour_name}).")
 
-                if not network:
-                    _LOGGER.error(f"Unknown network ({network_name})")
+        if not image:
+            errors.insert(0, f"Unknown image ({image_name})")
 
-                    for network in conn.network.networks():
-                        _LOGGER.info(f"Name: {network.name}, ID: {network.id}")
+        if errors:
+            return ServerResult(False, False, 0), "\n".join(errors), {}
 
-                    return (
-                        ServerResult(False, False, 0),
-                        f"Unknown network ({network_name})",
-                        {},
-                    )
+        flavour = server_inputs.flavour
+        security_group_names = [
+            {"name": server_inputs.security_groups[security_group_name].name}
+            for security_group_name in sec_groups
+        ]
+        network_info = [{"uuid": network.id} for network in server_inputs.networks]
 
-                network_info.append({"uuid": network.id})
+        policy = retry_policy or get_retry_policy(
+            "create_server", attempts=attempts, initial_delay_s=retry_delay_s
+        )
 
         # The number of times we had to re-create this server instance.
         num_create_failures = 0
+        attempt = 0
+        # The create request is not idempotent, a failed one may still have booted a
+        # server. Only an attempt whose server was deleted is attempted again.
+        broken_server_deleted = False
+
+        def create_and_wait():
+            nonlocal num_create_failures, attempt, broken_server_deleted
+            attempt += 1
+            broken_server_deleted = False
+            _LOGGER.info(
+                f"Creating {server_name} (attempt n.{attempt}/{policy.attempts})..."
+            )
 
-        attempt = 1
-        success = False
-        new_server: Server = {}
-        error_message = ""
-
-        while not success and attempt <= attempts:
-            _LOGGER.info(f"Creating {server_name} (attempt n.{attempt}/{attempts})...")
-
-            try:
-                # name – Something to name the server.
-                # image – Image dict, name or ID to boot with. image is required unless boot_volume is given.
-                # flavor – Flavor dict, name or ID to boot onto.
-                # auto_ip – Whether to take actions to find a routable IP for the server. (defaults to True)
-                # ips – List of IPs to attach to the server (defaults to None)
-                # ip_pool – Name of the network or floating IP pool to get an address from. (defaults to None)
-                # root_volume – Name or ID of a volume to boot from (defaults to None - deprecated,
-                #   use boot_volume)
-                # boot_volume – Name or ID of a volume to boot from (defaults to None)
-                # terminate_volume – If booting from a volume, whether it should be deleted
-                #    when the server is destroyed. (defaults to False)
-                # volumes – (optional) A list of volumes to attach to the server
-                # metadata – (optional) A dict of arbitrary key/value metadata to store for this server.
-                #   Both keys and values must be <=255 characters.
-                # files – (optional, deprecated) A dict of files to overwrite on the server upon boot.
-                #   Keys are file names (i.e. /etc/passwd) and values are the file contents
-                #   (either as a string or as a file-like object). A maximum of five entries is allowed,
-                #   and each file must be 10k or less.
-                # reservation_id – a UUID for the set of servers being requested.
-                # min_count – (optional extension) The minimum number of servers to launch.
-                # max_count – (optional extension) The maximum number of servers to launch.
-                # security_groups – A list of security group names
-                # userdata – user data to pass to be exposed by the metadata server
-                #   this can be a file type object as well or a string.
-                # key_name – (optional extension) name of previously created keypair
-                #   to inject into the instance.
-                # availability_zone – Name of the availability zone for instance placement.
-                # block_device_mapping – (optional) A dict of block device mappings for this server.
-                # block_device_mapping_v2 – (optional) A dict of block device mappings for this server.
-                # nics – (optional extension) an ordered list of nics to be added to this server,
-                #   with information about connected networks, fixed IPs, port etc.
-                # scheduler_hints – (optional extension) arbitrary key-value pairs
-                #   specified by the client to help boot an instance
-                # config_drive – (optional extension) value for config drive either boolean, or volume-id
-                # disk_config – (optional extension) control how the disk is partitioned
-                #   when the server is created. possible values are ‘AUTO’ or ‘MANUAL’.
-                # admin_pass – (optional extension) add a user supplied admin password.
-                # wait – (optional) Wait for the address to appear as assigned to the server.
-                #   Defaults to False.
-                # timeout – (optional) Seconds to wait, defaults to 60. See the wait parameter.
-                # reuse_ips – (optional) Whether to attempt to reuse pre-existing floating ips
-                #   should a floating IP be needed (defaults to True)
-                # network – (optional) Network dict or name or ID to attach the server to.
-                #   Mutually exclusive with the nics parameter. Can also be a list of network names
-                #   or IDs or network dicts.
-                # boot_from_volume – Whether to boot from volume. ‘boot_volume’ implies True,
-                #   but boot_from_volume=True with no boot_volume is valid and will create a volume
-                #   from the image and use that.
-                # volume_size – When booting an image from volume, how big should the created volume be?
-                #    Defaults to 50.
-                # nat_destination – Which network should a created floating IP be attached to,
-                #   if it’s not possible to infer from the cloud’s configuration. (Optional, defaults to None)
-                # group – ServerGroup dict, name or id to boot the server in.
-                #   If a group is provided in both scheduler_hints and in the group param,
-                #   the group param will win.
-                #   (Optional, defaults to None)
-
-                if boot_from_volume:
-                    server = conn.compute.create_server(
-                        name=server_name,
-                        image_id=image.id,
-                        flavor_id=flavour.id,
-                        security_groups=security_group_names,
-                        key_name=keypair_name,
-                        networks=network_info,
-                        # This is the key part for disk=0 flavors
-                        block_device_mapping_v2=[
-                            {
-                                "boot_index": 0,
-                                "uuid": image.id,
-                                "source_type": "image",
-                                "destination_type": "volume",
-                                "volume_size": 30,  #TODO: max(image.min_disk, 30)
-                                "delete_on_termination": True,
-                            }
-                        ],
-                        metadata={"deployed": "ewccli"},
-                    )
-                else:
-                    server = conn.compute.create_server(
-                        name=server_name,
-                        image_id=image.id,
-                        flavor_id=flavour.id,
-                        security_groups=security_group_names,
-                        key_name=keypair_name,
-                        networks=network_info,
-                        metadata={"deployed": "ewccli"},
-                    )
-
-                time.sleep(5)
-
-            except openstack.exceptions.HttpException as ex:
-                # Something wrong creating the server.
-                # Nothing we can do here.
-                return (
-                    ServerResult(False, False, 0),
-                    f"HttpException ({server_name}): {ex}",
-                    {},
+            # name – Something to name the server.
+            # image – Image dict, name or ID to boot with. image is required unless boot_volume is given.
+            # flavor – Flavor dict, name or ID to boot onto.
+            # auto_ip – Whether to take actions to find a routable IP for the server. (defaults to True)
+            # ips – List of IPs to attach to the server (defaults to None)
+            # ip_pool – Name of the network or floating IP pool to get an address from. (defaults to None)
+            # root_volume – Name or ID of a volume to boot from (defaults to None - deprecated,
+            #   use boot_volume)
+            # boot_volume – Name or ID of a volume to boot from (defaults to None)
+            # terminate_volume – If booting from a volume, whether it should be deleted
+            #    when the server is destroyed. (defaults to False)
+            # volumes – (optional) A list of volumes to attach to the server
+            # metadata – (optional) A dict of arbitrary key/value metadata to store for this server.
+            #   Both keys and values must be <=255 characters.
+            # files – (optional, deprecated) A dict of files to overwrite on the server upon boot.
+            #   Keys are file names (i.e. /etc/passwd) and values are the file contents
+            #   (either as a string or as a file-like object). A maximum of five entries is allowed,
+            #   and each file must be 10k or less.
+            # reservation_id – a UUID for the set of servers being requested.
+            # min_count – (optional extension) The minimum number of servers to launch.
+            # max_count – (optional extension) The maximum number of servers to launch.
+            # security_groups – A list of security group names
+            # userdata – user data to pass to be exposed by the metadata server
+            #   this can be a file type object as well or a string.
+            # key_name – (optional extension) name of previously created keypair
+            #   to inject into the instance.
+            # availability_zone – Name of the availability zone for instance placement.
+            # block_device_mapping – (optional) A dict of block device mappings for this server.
+            # block_device_mapping_v2 – (optional) A dict of block device mappings for this server.
+            # nics – (optional extension) an ordered list of nics to be added to this server,
+            #   with information about connected networks, fixed IPs, port etc.
+            # scheduler_hints – (optional extension) arbitrary key-value pairs
+            #   specified by the client to help boot an instance
+            # config_drive – (optional extension) value for config drive either boolean, or volume-id
+            # disk_config – (optional extension) control how the disk is partitioned
+            #   when the server is created. possible values are ‘AUTO’ or ‘MANUAL’.
+            # admin_pass – (optional extension) add a user supplied admin password.
+            # wait – (optional) Wait for the address to appear as assigned to the server.
+            #   Defaults to False.
+            # timeout – (optional) Seconds to wait, defaults to 60. See the wait parameter.
+            # reuse_ips – (optional) Whether to attempt to reuse pre-existing floating ips
+            #   should a floating IP be needed (defaults to True)
+            # network – (optional) Network dict or name or ID to attach the server to.
+            #   Mutually exclusive with the nics parameter. Can also be a list of network names
+            #   or IDs or network dicts.
+            # boot_from_volume – Whether to boot from volume. ‘boot_volume’ implies True,
+            #   but boot_from_volume=True with no boot_volume is valid and will create a volume
+            #   from the image and use that.
+            # volume_size – When booting an image from volume, how big should the created volume be?
+            #    Defaults to 50.
+            # nat_destination – Which network should a created floating IP be attached to,
+            #   if it’s not possible to infer from the cloud’s configuration. (Optional, defaults to None)
+            # group – ServerGroup dict, name or id to boot the server in.
+            #   If a group is provided in both scheduler_hints and in the group param,
+            #   the group param will win.
+            #   (Optional, defaults to None)
+
+            if boot_from_volume:
+                server = conn.compute.create_server(
+                    name=server_name,
+                    image_id=image.id,
+                    flavor_id=flavour.id,
+                    security_groups=security_group_names,
+                    key_name=keypair_name,
+                    networks=network_info,
+                    # This is the key part for disk=0 flavors
+                    block_device_mapping_v2=[
+                        {
+                            "boot_index": 0,
+                            "uuid": image.id,
+                            "source_type": "image",
+                            "destination_type": "volume",
+                            "volume_size": 30,  # TODO: max(image.min_disk, 30)
+                            "delete_on_termination": True,
+                        }
+                    ],
+                    metadata={"deployed": "ewccli"},
+                    tags=[EWCCLI_SERVER_TAG],
+                )
+            else:
+                server = conn.compute.create_server(
+                    name=server_name,
+                    image_id=image.id,
+                    flavor_id=flavour.id,
+                    security_groups=security_group_names,
+                    key_name=keypair_name,
+                    networks=network_info,
+                    metadata={"deployed": "ewccli"},
+                    tags=[EWCCLI_SERVER_TAG],
                 )
 
             try:
                 _LOGGER.info(f"Waiting for {server_name}...")
-                new_server = conn.compute.wait_for_server(server, wait=wait_time_s)
+                return conn.compute.wait_for_server(server, wait=wait_time_s)
 
-            except openstack.exceptions.ResourceFailure:
-                error_message = f"ResourceFailure ({server_name})"
-            except openstack.exceptions.ResourceTimeout:
-                error_message = f"ResourceTimeout/create ({server_name})"
-
-            if new_server:
-                success = True
-            else:
+            except Exception:
                 # Failed to create a server.
                 # Count it.
                 num_create_failures += 1
 
                 _LOGGER.error(f"Failed ({server_name}) attempt no {attempt}.")
 
-                # Delete the instance
+                # Delete the instance, so that a retry doesn't create a second one
                 # (unless this is our last attempt)
-                if attempt < attempts:
+                if attempt < policy.attempts:
                     _LOGGER.info(f"Deleting... ({server_name})")
                     # Delete the instance
                     # and wait for it...
@@ -395,28 +527,51 @@ class OpenstackBackend:
 
                     try:
                         conn.compute.wait_for_delete(server, wait=wait_time_s)
+                        broken_server_deleted = True
                     except openstack.exceptions.ResourceTimeout:
-                        error_message = f"ResourceTimeout/delete ({server_name})"
+                        _LOGGER.error(f"ResourceTimeout/delete ({server_name})")
+
+                raise
 
-                    _LOGGER.info(f"Pausing {retry_delay_s} seconds before retrying...")
-                    time.sleep(retry_delay_s)
-                attempt += 1
+        try:
+            new_server = retry_call(
+                create_and_wait,
+                policy=policy,
+                description=f"Creating {server_name}",
+                is_retryable=lambda error: broken_server_deleted,
+            )
 
-        # Set 'changed'.
-        # If not successful this is ignored.
-        if success:
+        except openstack.exceptions.ResourceFailure:
             return (
-                ServerResult(success, True, num_create_failures),
-                f"Successfully created server {server_name}.",
-                new_server,
+                ServerResult(False, True, num_create_failures),
+                f"ResourceFailure ({server_name})",
+                {},
             )
-        else:
+        except openstack.exceptions.ResourceTimeout:
             return (
-                ServerResult(success, True, num_create_failures),
-                error_message,
-                new_server,
+                ServerResult(False, True, num_create_failures),
+                f"ResourceTimeout/create ({server_name})",
+                {},
+            )
+        except openstack.exceptions.HttpException as ex:
+            # Something wrong creating the server.
+            # Cached network, flavour or security group might be stale.
+            resolver.invalidate()
+            return (
+                ServerResult(False, False, num_create_failures),
+                f"HttpException ({server_name}): {ex}",
+                {},
             )
 
+        # Later lookups of the server fetch it by ID
+        resolver.remember_server(new_server)
+
+        return (
+            ServerResult(True, True, num_create_failures),
+            f"Successfully created server {server_name}.",
+            new_server,
+        )
+
 
     def create_volumes(
         self,
@@ -424,23 +579,29 @@ class OpenstackBackend:
         base_name: str,
         volume_sizes: tuple[int, ...],
         volume_type: str | None = None,
-        attempts: int = 1,
-        retry_delay_s: int = 30,
+        attempts: int | None = None,
+        retry_delay_s: float | None = None,
         wait_time_s: int = 600,
         dry_run: bool = False,
         metadata=None,
+        retry_policy: RetryPolicy | None = None,
     ) -> tuple[ExtraVolumesResult, list[openstack.block_storage.v3.volume.Volume], str]:
         """
         Create multiple Cinder volumes with retry and wait logic.
 
+        The volumes are created concurrently and their availability is polled
+        with a single listing by metadata. After a partial failure, only the
+        volumes which failed are deleted and created again.
+
         :param conn: OpenStack connection
         :param base_name: Base name for volumes (e.g. server name)
         :param volume_sizes: Tuple of sizes in GB
         :param volume_type: Optional Cinder volume type
-        :param attempts: Retry attempts
-        :param retry_delay_s: Delay between attempts
+        :param attempts: Retry attempts, defaults to the create_volumes retry policy
+        :param retry_delay_s: Initial delay between attempts, defaults to the retry policy
         :param wait_time_s: Max wait time for volume creation
         :param dry_run: Do not create anything
+        :param retry_policy: Retry policy replacing the create_volumes one
         :return: (ExtraVolumesResult, list of created volumes, message)
         """
         if dry_run:
@@ -451,74 +612,107 @@ class OpenstackBackend:
                 f"[Dry Run] Would create extra volumes with sizes: {volume_sizes}",
             )
 
-        attempt = 1
-        error_message = ""
+        policy = retry_policy or get_retry_policy(
+            "create_volumes", attempts=attempts, initial_delay_s=retry_delay_s
+        )
         final_metadata = {
             "ewccli": "true",
             "server_name": base_name,
-            **metadata,
+            **(metadata or {}),
         }
-        created_volumes = []
+        # Available volumes, by position in volume_sizes
+        ready_volumes: dict[int, Any] = {}
 
-        while attempt <= attempts:
-            _LOGGER.info(f"Creating volumes (attempt {attempt}/{attempts})")
-            created_volumes = []
+        def create_volume(idx):
+            # Random suffix, volumes created in the same second must not collide
+            vol_name = f"{base_name}-vol-{idx+1}-{uuid.uuid4().hex[:8]}"
+            _LOGGER.info(f"Creating volume {vol_name} ({volume_sizes[idx]} GB)")
 
             try:
-                # Create all volumes
-                for idx, size in enumerate(volume_sizes):
-                    suffix = int(time.time())
-                    vol_name = f"{base_name}-vol-{idx+1}-{suffix}"
-                    _LOGGER.info(f"Creating volume {vol_name} ({size} GB)")
-
-                    vol = conn.block_storage.create_volume(
-                        size=size,
-                        name=vol_name,
-                        volume_type=volume_type,
-                        metadata=final_metadata
-                    )
-                    created_volumes.append(vol)
-
-                # Wait for all volumes to become available
-                ready_volumes = []
-                for vol in created_volumes:
-                    _LOGGER.info(f"Waiting for volume {vol.name} to become available")
-                    vol = conn.block_storage.wait_for_status(
-                        vol,
-                        status="available",
-                        failures=["error"],
-                        wait=wait_time_s,
-                    )
-                    ready_volumes.append(vol)
-
-                return (
-                    ExtraVolumesResult(True, True),
-                    ready_volumes,
-                    "Successfully created volumes.",
+                return conn.block_storage.create_volume(
+                    size=volume_sizes[idx],
+                    name=vol_name,
+                    volume_type=volume_type,
+                    metadata=final_metadata,
                 )
-
             except Exception as ex:
-                error_message = f"Volume creation failed: {ex}"
-                _LOGGER.error(error_message)
+                return ex
 
-                # Cleanup failed volumes
-                for vol in created_volumes:
-                    try:
-                        _LOGGER.warning(f"Deleting failed volume {vol.name}")
-                        conn.block_storage.delete_volume(vol, ignore_missing=True)
-                    except Exception as cleanup_ex:
-                        _LOGGER.error(f"Failed to delete volume {vol.name}: {cleanup_ex}")
+        def cleanup(volumes):
+            for vol in volumes:
+                try:
+                    _LOGGER.warning(f"Deleting failed volume {vol.name}")
+                    conn.block_storage.delete_volume(vol, ignore_missing=True)
+                except Exception as cleanup_ex:
+                    _LOGGER.error(f"Failed to delete volume {vol.name}: {cleanup_ex}")
+
+        def create_and_wait():
+            missing = [
+                idx for idx in range(len(volume_sizes)) if idx not in ready_volumes
+            ]
+            results = run_concurrently(
+                {idx: partial(create_volume, idx) for idx in missing}
+            )
 
-                if attempt < attempts:
-                    _LOGGER.info(f"Retrying in {retry_delay_s} seconds…")
-                    time.sleep(retry_delay_s)
-                attempt += 1
+            created = {
+                idx: vol
+                for idx, vol in results.items()
+                if not isinstance(vol, Exception)
+            }
+            errors = [ex for ex in results.values() if isinstance(ex, Exception)]
 
+            _LOGGER.info(f"Waiting for {len(created)} volumes to become available")
+            ready, failed, pending = wait_for_volumes_status(
+                conn,
+                volume_ids=[vol.id for vol in created.values()],
+                metadata=final_metadata,
+                status="available",
+                failures=["error"],
+                timeout_s=wait_time_s,
+            )
+
+            for idx, vol in created.items():
+                if vol.id in ready:
+                    ready_volumes[idx] = ready[vol.id]
+
+            # Only the volumes which failed are cleaned up, the available ones are kept
+            cleanup([vol for vol in created.values() if vol.id not in ready])
+
+            if errors:
+                raise errors[0]
+
+            if failed:
+                raise openstack.exceptions.ResourceFailure(
+                    f"Volumes {', '.join(v.name for v in failed.values())} went to error status"
+                )
+
+            if pending:
+                raise openstack.exceptions.ResourceTimeout(
+                    f"Timeout waiting for {len(pending)} volumes to become available"
+                )
+
+            return [ready_volumes[idx] for idx in range(len(volume_sizes))]
+
+        try:
+            volumes = retry_call(
+                create_and_wait,
+                policy=policy,
+                description="Creating volumes",
+            )
+        except Exception as ex:
+            _LOGGER.error(f"Volume creation failed: {ex}")
+            # The volumes are only returned together, so the available ones would leak
+            cleanup(list(ready_volumes.values()))
+            return (
+                ExtraVolumesResult(False, False),
+                [],
+                f"Volume creation failed: {ex}",
+            )
 
         return (
-            ExtraVolumesResult(False, False),
-            [],
-            error_message,
+            ExtraVolumesResult(True, True),
+            volumes,
+            "Successfully created volumes.",
         )
 
 
@@ -565,21 +759,28 @@ class OpenstackBackend:
         conn: openstack.connection.Connection,
         base_name: str | None = None,
         metadata: dict[str, str] | None = None,
-        attempts: int = 1,
-        retry_delay_s: int = 30,
+        attempts: int | None = None,
+        retry_delay_s: float | None = None,
         wait_time_s: int = 600,
         dry_run: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        volumes: list[openstack.block_storage.v3.volume.Volume] | None = None,
     ) -> tuple[ExtraVolumesResult, list[openstack.block_storage.v3.volume.Volume], str]:
         """
         Delete Cinder volumes filtered by metadata (default: ewccli=true).
 
+        The deletes are issued concurrently, each one retried with backoff, and
+        the disappearance of the volumes is tracked with a single listing per poll.
+
         :param conn: OpenStack connection
         :param base_name: Optional base name (e.g. server name)
         :param metadata: Extra metadata filters
-        :param attempts: Retry attempts
-        :param retry_delay_s: Delay between attempts
+        :param attempts: Retry attempts, defaults to the delete_volumes retry policy
+        :param retry_delay_s: Initial delay between attempts, defaults to the retry policy
         :param wait_time_s: Max wait time for deletion
         :param dry_run: Do not delete anything
+        :param retry_policy: Retry policy replacing the delete_volumes one
+        :param volumes: Volumes to delete, already selected by the caller (no filtering)
         :return: (ExtraVolumesResult, list of deleted volumes, message)
         """
         # Default metadata filter
@@ -594,7 +795,14 @@ class OpenstackBackend:
             base_metadata.update(metadata)
 
         # Find volumes
-        volumes = list(conn.block_storage.volumes(details=True, metadata=base_metadata))
+        if volumes is None:
+            volumes = list(
+                conn.block_storage.volumes(details=True, metadata=base_metadata)
+            )
+            poll_metadata = base_metadata
+        else:
+            # Volumes selected by the caller may not share the metadata
+            poll_metadata = None
 
         if not volumes:
             return ExtraVolumesResult(True, False), [], "No volumes matched the filters."
@@ -607,25 +815,55 @@ class OpenstackBackend:
                 f"[Dry Run] Would delete {len(volumes)} volumes",
             )
 
-        deleted = []
+        policy = retry_policy or get_retry_policy(
+            "delete_volumes", attempts=attempts, initial_delay_s=retry_delay_s
+        )
         errors = []
 
+        def request_delete(vol):
+            try:
+                retry_call(
+                    lambda: conn.block_storage.delete_volume(vol, ignore_missing=True),
+                    policy=policy,
+                    description=f"Deleting volume {vol.name}",
+                )
+            except Exception as exc:
+                return exc
+
+            return None
+
+        # Issue all the deletes up front
+        delete_errors = run_concurrently(
+            {vol.id: partial(request_delete, vol) for vol in volumes}
+        )
+
         for vol in volumes:
-            for attempt in range(1, attempts + 1):
-                try:
-                    conn.block_storage.delete_volume(vol, ignore_missing=True)
-                    conn.block_storage.wait_for_delete(vol, wait=wait_time_s)
-                    deleted.append(vol)
-                    break
-                except Exception as exc:
-                    _LOGGER.warning(
-                        f"Failed to delete volume {vol.name} (attempt {attempt}/{attempts}): {exc}"
-                    )
-                    if attempt < attempts:
-                        time.sleep(retry_delay_s)
-                    else:
-                        errors.append((vol, str(exc)))
+            if delete_errors[vol.id] is not None:
+                _LOGGER.warning(
+                    f"Failed to delete volume {vol.name}: {delete_errors[vol.id]}"
+                )
+                errors.append((vol, str(delete_errors[vol.id])))
+
+        deleted_ids, failed, pending = wait_for_volumes_deleted(
+            conn,
+            volume_ids=[vol.id for vol in volumes if delete_errors[vol.id] is None],
+            metadata=poll_metadata,
+            timeout_s=wait_time_s,
+        )
+
+        for vol in volumes:
+            if vol.id in failed:
+                _LOGGER.warning(
+                    f"Failed to delete volume {vol.name}: status error_deleting"
+                )
+                errors.append((vol, "error_deleting"))
+            elif vol.id in pending:
+                _LOGGER.warning(
+                    f"Failed to delete volume {vol.name}: timeout after {wait_time_s} seconds"
+                )
+                errors.append((vol, "timeout"))
 
+        deleted = [vol for vol in volumes if vol.id in deleted_ids]
         success = len(errors) == 0
 
         msg = (
@@ -645,14 +883,18 @@ class OpenstackBackend:
         conn: openstack.connection.Connection,
         server_id: str,
         volumes: list[openstack.block_storage.v3.volume.Volume],
-        attempts: int = 1,
-        retry_delay_s: int = 30,
+        attempts: int | None = None,
+        retry_delay_s: float | None = None,
         wait_time_s: int = 600,
         dry_run: bool = False,
+        retry_policy: RetryPolicy | None = None,
     ) -> tuple[AttachVolumesResult, list, str]:
         """
         Attach multiple volumes to a server with retry and wait logic.
 
+        Transient failures are retried with the attach_volumes retry policy,
+        unless attempts, retry_delay_s or retry_policy are given.
+
         :return: (AttachVolumesResult, list of attachments, message)
         """
 
@@ -664,70 +906,72 @@ class OpenstackBackend:
                 f"[Dry Run] Would attach {len(volumes)} volumes to server {server_id}",
             )
 
-        attempt = 1
-        error_message = ""
+        policy = retry_policy or get_retry_policy(
+            "attach_volumes", attempts=attempts, initial_delay_s=retry_delay_s
+        )
         attachments = []
 
-        while attempt <= attempts:
-            _LOGGER.info(f"Attaching volumes to server {server_id} (attempt {attempt}/{attempts})")
-            attachments = []
+        def attach_and_wait():
+            attachments.clear()
 
-            try:
-                # Create attachments
-                for vol in volumes:
-                    _LOGGER.info(f"Creating attachment for volume {vol.name} ({vol.id})")
-                    attachment = conn.compute.create_volume_attachment(
+            # Create attachments
+            for vol in volumes:
+                _LOGGER.info(f"Creating attachment for volume {vol.name} ({vol.id})")
+                attachment = conn.compute.create_volume_attachment(
+                    server=server_id,
+                    volumeId=vol.id,
+                )
+                attachments.append(attachment)
+
+            # Wait for all volumes to become in-use
+            for vol in volumes:
+                _LOGGER.info(f"Waiting for volume {vol.name} to become in-use")
+                conn.block_storage.wait_for_status(
+                    vol,
+                    status="in-use",
+                    failures=["error"],
+                    wait=wait_time_s,
+                )
+
+        def cleanup(ex):
+            _LOGGER.error(f"Volume attachment failed: {ex}")
+
+            # Cleanup attachments
+            for attachment in attachments:
+                try:
+                    _LOGGER.warning(
+                        f"Deleting failed attachment {attachment.id} for server {server_id}"
+                    )
+                    conn.compute.delete_volume_attachment(
+                        attachment=attachment.id,
                         server=server_id,
-                        volumeId=vol.id,
+                        ignore_missing=True,
                     )
-                    attachments.append(attachment)
-
-                # Wait for all volumes to become in-use
-                for vol in volumes:
-                    _LOGGER.info(f"Waiting for volume {vol.name} to become in-use")
-                    conn.block_storage.wait_for_status(
-                        vol,
-                        status="in-use",
-                        failures=["error"],
-                        wait=wait_time_s,
+                except Exception as cleanup_ex:
+                    _LOGGER.error(
+                        f"Failed to delete attachment {attachment.id}: {cleanup_ex}"
                     )
 
-                return (
-                    AttachVolumesResult(True, True),
-                    attachments,
-                    f"Successfully attached {len(volumes)} volumes to server {server_id}.",
-                )
-
-            except Exception as ex:
-                error_message = f"Volume attachment failed: {ex}"
-                _LOGGER.error(error_message)
+        _LOGGER.info(f"Attaching volumes to server {server_id}")
 
-                # Cleanup attachments
-                for attachment in attachments:
-                    try:
-                        _LOGGER.warning(
-                            f"Deleting failed attachment {attachment.id} for server {server_id}"
-                        )
-                        conn.compute.delete_volume_attachment(
-                            attachment=attachment.id,
-                            server=server_id,
-                            ignore_missing=True,
-                        )
-                    except Exception as cleanup_ex:
-                        _LOGGER.error(
-                            f"Failed to delete attachment {attachment.id}: {cleanup_ex}"
-                        )
-
-                if attempt < attempts:
-                    _LOGGER.info(f"Retrying in {retry_delay_s} seconds…")
-                    time.sleep(retry_delay_s)
-
-                attempt += 1
+        try:
+            retry_call(
+                attach_and_wait,
+                policy=policy,
+                description=f"Attaching volumes to server {server_id}",
+                on_failure=cleanup,
+            )
+        except Exception as ex:
+            return (
+                AttachVolumesResult(False, False),
+                [],
+                f"Volume attachment failed: {ex}",
+            )
 
         return (
-            AttachVolumesResult(False, False),
-            [],
-            error_message,
+            AttachVolumesResult(True, True),
+            attachments,
+            f"Successfully attached {len(volumes)} volumes to server {server_id}.",
         )
 
 
@@ -736,15 +980,23 @@ class OpenstackBackend:
         conn: openstack.connection.Connection,
         server_id: str,
         volumes: list[openstack.block_storage.v3.volume.Volume],
-        attempts: int = 1,
-        retry_delay_s: int = 30,
+        attempts: int | None = None,
+        retry_delay_s: float | None = None,
         wait_time_s: int = 600,
         dry_run: bool = False,
+        retry_policy: RetryPolicy | None = None,
+        delete: bool = True,
     ) -> tuple[DetachVolumesResult, list[str], str]:
         """
         Detach volumes from a server and delete them, with retry and wait logic.
 
-        :return: (DetachVolumesResult, list of deleted volume IDs, message)
+        The volumes are detached concurrently. With delete disabled, they are
+        only detached, e.g. to delete them once the server is gone.
+
+        Transient failures are retried with the detach_volumes retry policy,
+        unless attempts, retry_delay_s or retry_policy are given.
+
+        :return: (DetachVolumesResult, list of detached (and deleted) volume IDs, message)
         """
 
         if dry_run:
@@ -755,68 +1007,80 @@ class OpenstackBackend:
                 f"[Dry Run] Would detach and delete {len(volumes)} volumes from server {server_id}",
             )
 
-        attempt = 1
-        error_message = ""
+        policy = retry_policy or get_retry_policy(
+            "detach_volumes", attempts=attempts, initial_delay_s=retry_delay_s
+        )
         deleted_volume_ids: list[str] = []
 
-        while attempt <= attempts:
-            _LOGGER.info(f"Detaching volumes from server {server_id} (attempt {attempt}/{attempts})")
-            deleted_volume_ids = []
+        def detach_and_delete():
+            # Volumes deleted by a previous attempt are skipped
+            pending = [vol for vol in volumes if vol.id not in deleted_volume_ids]
 
-            try:
-                # 1. DETACH
-                for vol in volumes:
-                    _LOGGER.info(f"Detaching volume {vol.name} ({vol.id}) from server {server_id}")
-
-                    # Find attachment
-                    attachments = conn.compute.volume_attachments(server_id)
-                    attachment = next((a for a in attachments if a.volume_id == vol.id), None)
-
-                    if attachment:
-                        conn.compute.delete_volume_attachment(
-                            server_id,
-                            attachment.id,
-                            ignore_missing=True,
-                        )
-
-                    # Wait for detachment
-                    _LOGGER.info(f"Waiting for volume {vol.name} to return to 'available'")
-                    conn.block_storage.wait_for_status(
-                        vol,
-                        status="available",
-                        failures=["error"],
-                        wait=wait_time_s,
-                    )
+            # 1. DETACH
+            # One attachments listing for all the volumes
+            attachments = {
+                a.volume_id: a for a in conn.compute.volume_attachments(server_id)
+            }
 
-                # 2. DELETE
-                for vol in volumes:
-                    _LOGGER.info(f"Deleting volume {vol.name} ({vol.id})")
-                    conn.block_storage.delete_volume(vol, ignore_missing=True)
+            def detach(vol):
+                _LOGGER.info(
+                    f"Detaching volume {vol.name} ({vol.id}) from server {server_id}"
+                )
 
-                    # Wait for deletion
-                    conn.block_storage.wait_for_delete(vol, wait=wait_time_s)
-                    deleted_volume_ids.append(vol.id)
+                attachment = attachments.get(vol.id)
 
-                return (
-                    DetachVolumesResult(True, True),
-                    deleted_volume_ids,
-                    f"Successfully detached and deleted {len(deleted_volume_ids)} volumes.",
+                if attachment:
+                    conn.compute.delete_volume_attachment(
+                        server_id,
+                        attachment.id,
+                        ignore_missing=True,
+                    )
+
+                # Wait for detachment
+                _LOGGER.info(f"Waiting for volume {vol.name} to return to 'available'")
+                conn.block_storage.wait_for_status(
+                    vol,
+                    status="available",
+                    failures=["error"],
+                    wait=wait_time_s,
                 )
 
-            except Exception as ex:
-                error_message = f"Volume detach/delete failed: {ex}"
-                _LOGGER.error(error_message)
+            run_concurrently({vol.id: lambda vol=vol: detach(vol) for vol in pending})
 
-                if attempt < attempts:
-                    _LOGGER.info(f"Retrying in {retry_delay_s} seconds…")
-                    time.sleep(retry_delay_s)
+            if not delete:
+                deleted_volume_ids.extend(vol.id for vol in pending)
+                return
 
-                attempt += 1
+            # 2. DELETE
+            for vol in pending:
+                _LOGGER.info(f"Deleting volume {vol.name} ({vol.id})")
+                conn.block_storage.delete_volume(vol, ignore_missing=True)
+
+                # Wait for deletion
+                conn.block_storage.wait_for_delete(vol, wait=wait_time_s)
+                deleted_volume_ids.append(vol.id)
+
+        _LOGGER.info(f"Detaching volumes from server {server_id}")
+
+        try:
+            retry_call(
+                detach_and_delete,
+                policy=policy,
+                description=f"Detaching volumes from server {server_id}",
+            )
+        except Exception as ex:
+            error_message = f"Volume detach/delete failed: {ex}"
+            _LOGGER.error(error_message)
+            return (
+                DetachVolumesResult(False, False),
+                [],
+                error_message,
+            )
 
         return (
-            DetachVolumesResult(False, False),
-            [],
-            error_message,
+            DetachVolumesResult(True, True),
+            deleted_volume_ids,
+            f"Successfully detached{' and deleted' if delete else ''} {len(deleted_volume_ids)} volumes.",
         )
 
 
@@ -825,77 +1089,155 @@ class OpenstackBackend:
         conn: openstack.connection.Connection,
         prefix: str,
         federee: str,
-        region: str
+        region: str,
+        resolver: Optional[OpenstackResourceResolver] = None,
     ):
         """
         Select the latest image for CPU or GPU families with special rules.
+
+        Glance filters on status and exact name and sorts by creation date, so the
+        listing stops at the newest image of the family. Glance cannot filter on a name
+        prefix: timestamped families are matched client-side on the sorted listing.
+        A family without image is not found. Only if Glance rejects the filters or
+        the sort are all images scanned, the scan being shared with the other steps
+        of the deployment when a resolver is given.
         """
-        import re
-        TIMESTAMP_RE = r"\d{14}"
-
-        def is_cpu_image(prefix: str, name: str):
-            # Rocky-8 → Rocky-8.<minor>-<timestamp>
-            if prefix.lower().startswith("rocky-8"):
-                return re.match(rf"^Rocky-8\.\d+-{TIMESTAMP_RE}$", name, re.IGNORECASE)
-
-            # Rocky-9 → Rocky-9.<minor>-<timestamp>
-            if prefix.lower().startswith("rocky-9"):
-                return re.match(rf"^Rocky-9\.\d+-{TIMESTAMP_RE}$", name, re.IGNORECASE)
-
-            # Ubuntu-22.04 → Ubuntu-22.04-<timestamp>
-            if prefix.lower() == "ubuntu-22.04":
-                return re.match(rf"^Ubuntu-22\.04-{TIMESTAMP_RE}$", name, re.IGNORECASE)
-
-            # Ubuntu-24.04 → Ubuntu-24.04-<timestamp>
-            if prefix.lower() == "ubuntu-24.04":
-                return re.match(rf"^Ubuntu-24\.04-{TIMESTAMP_RE}$", name, re.IGNORECASE)
-
-        def is_gpu_rocky(name: str):
-            # Prefix: Rocky-9-GPU
-            # Match: Rocky-9.<minor>-GPU-<timestamp>
-            return bool(re.match(
-                rf"^Rocky-9\.\d+-GPU-{TIMESTAMP_RE}$",
-                name,
-                re.IGNORECASE,
-            ))
-
-        def is_gpu_ubuntu(name: str):
-            # Prefix: Ubuntu 22.04 NVIDIA_AI
-            # Match: Ubuntu 22.04 NVIDIA_AI
-            if name == ewc_hub_config.EWC_CLI_OS_GPU_IMAGES_SITE_MAP[federee][region]:
-                return True
-
-        def image_matches(name: str, prefix: str):
+        exact_name = None
+        family = None
+
+        # Ubuntu 22.04 NVIDIA_AI / Ubuntu 24.04 NV_GRID_Open (EUMETSAT)
+        if prefix in ("Ubuntu 22.04 NVIDIA_AI", "Ubuntu 24.04 NV_GRID_Open"):
+            exact_name = ewc_hub_config.EWC_CLI_OS_GPU_IMAGES_SITE_MAP[federee][region]
+        # Rocky-9-GPU (ECMWF) and CPU images
+        elif prefix == "Rocky-9.6-GPU" or prefix in ewc_hub_config.EWC_CLI_CPU_IMAGES:
+            family = get_image_family(prefix)
+
+        if not exact_name and not family:
+            return None
+
+        def image_matches(name: str):
             if not name:
                 return False
 
-            # Rocky-9-GPU
-            if prefix == "Rocky-9.6-GPU":
-                return is_gpu_rocky(name)
+            if exact_name:
+                return name == exact_name
 
-            # Ubuntu 22.04 NVIDIA_AI (EUMETSAT)
-            if prefix == "Ubuntu 22.04 NVIDIA_AI":
-                return is_gpu_ubuntu(name)
+            return bool(family.pattern.match(name))
 
-            # Ubuntu 24.04 NV_GRID_Open (EUMETSAT)
-            if prefix == "Ubuntu 24.04 NV_GRID_Open":
-                return is_gpu_ubuntu(name)
+        latest_image = None
+        query: dict[str, Any] = {"status": "active", "sort": "created_at:desc"}
 
-            # CPU images
-            if prefix in ewc_hub_config.EWC_CLI_CPU_IMAGES:
-                return is_cpu_image(prefix=prefix, name=name)
+        if exact_name:
+            query.update(name=exact_name, limit=1)
 
-            return False
+        try:
+            latest_image = next(
+                (img for img in conn.image.images(**query) if image_matches(img.name)),
+                None,
+            )
+        except openstack.exceptions.SDKException as e:
+            _LOGGER.debug(
+                f"Images of {prefix} could not be filtered by the image service: {e}"
+            )
+            images = resolver.images() if resolver else conn.compute.images()
+            matches = [img for img in images if image_matches(img.name)]
 
-        matches = [img for img in conn.compute.images() if image_matches(name=img.name, prefix=prefix)]
+            if matches:
+                # Sort by created_at
+                matches.sort(key=lambda img: img.created_at, reverse=True)
+                latest_image = matches[0]
 
-        if not matches:
-            return None
+        if latest_image is not None and resolver:
+            resolver.remember("image", latest_image)
 
-        # Sort by created_at
-        matches.sort(key=lambda img: img.created_at, reverse=True)
-        return matches[0]
+        return latest_image
 
+    def _log_security_groups(self, resolver: OpenstackResourceResolver) -> None:
+        """Log the available security groups."""
+        for sg in resolver.security_groups():
+            _LOGGER.info(
+                f"Name: {sg.name}, ID: {sg.id}, Description: {sg.description or 'No description'}"
+            )
+
+    def resolve_server_inputs(
+        self,
+        resolver: OpenstackResourceResolver,
+        image_name: Optional[str] = None,
+        flavour_name: Optional[str] = None,
+        networks: Optional[tuple] = None,
+        security_groups: Optional[tuple] = None,
+    ) -> ServerInputsResult:
+        """Resolve the server inputs concurrently, reporting every unknown input.
+
+        The image, flavour, security groups and each network are looked up on a
+        bounded thread pool sharing the connection of the resolver.
+
+        :param resolver: resolver shared by the steps of the deployment.
+        :param image_name: image name or ID.
+        :param flavour_name: flavour name or ID, not checked if not given.
+        :param networks: network names or IDs.
+        :param security_groups: security group names or IDs, not checked if not given.
+        :return: the resolved inputs and the error messages.
+        """
+        networks = tuple(dict.fromkeys(networks or ()))
+        lookups = {"image": lambda: resolver.find_image(image_name)}
+
+        if flavour_name:
+            lookups["flavour"] = lambda: resolver.find_flavor(flavour_name)
+
+        if security_groups is not None:
+            lookups["security_groups"] = lambda: resolver.find_security_groups(
+                security_groups
+            )
+
+        for network_name in networks:
+            lookups[("network", network_name)] = (
+                lambda network_name=network_name: resolver.find_network(network_name)
+            )
+
+        resolved = run_concurrently(lookups)
+        errors = []
+
+        flavour = resolved.get("flavour")
+        if flavour_name and not flavour:
+            for flavor in resolver.flavors():
+                _LOGGER.info(
+                    f"Name: {flavor.name}, ID: {flavor.id}, VCPUs: {flavor.vcpus}, RAM: {flavor.ram} MB"
+                )
+
+            errors.append(f"Unknown flavour ({flavour_name}). Check list above.")
+
+        security_groups_found, missing_security_groups = resolved.get(
+            "security_groups", ({}, [])
+        )
+        if missing_security_groups:
+            self._log_security_groups(resolver)
+            errors.append(
+                f"Unknown security groups ({', '.join(missing_security_groups)}). Check list above."
+            )
+
+        missing_networks = [
+            network_name
+            for network_name in networks
+            if not resolved[("network", network_name)]
+        ]
+        if missing_networks:
+            _LOGGER.error(f"Unknown networks ({', '.join(missing_networks)})")
+
+            for network in resolver.networks():
+                _LOGGER.info(f"Name: {network.name}, ID: {network.id}")
+
+            errors.extend(
+                f"Unknown network ({network_name})" for network_name in missing_networks
+            )
+
+        return ServerInputsResult(
+            image=resolved["image"],
+            flavour=flavour,
+            security_groups=security_groups_found,
+            networks=[resolved[("network", network_name)] for network_name in networks],
+            errors=errors,
+        )
 
     def check_server_inputs(
         self,
@@ -905,139 +1247,221 @@ class OpenstackBackend:
         flavour_name: Optional[str] = None,
         networks: Optional[tuple] = None,
         security_groups: Optional[tuple] = None,
+        resolver: Optional[OpenstackResourceResolver] = None,
     ) -> Tuple[bool, str]:
-        """Check server inputs before creating the server."""
-        image = conn.compute.find_image(image_name)
+        """Check server inputs before creating the server.
 
-        if not image:
-            total_images = ewc_hub_config.EWC_CLI_CPU_IMAGES + [ewc_hub_config.EWC_CLI_GPU_IMAGES_SITE_MAP[federee]]
+        All the inputs are checked concurrently and every invalid one is reported.
+        """
+        resolver = resolver or self.create_resolver(conn)
+        server_inputs = self.resolve_server_inputs(
+            resolver=resolver,
+            image_name=image_name,
+            flavour_name=flavour_name,
+            networks=networks,
+            security_groups=security_groups,
+        )
+        errors = list(server_inputs.errors)
+
+        if not server_inputs.image:
+            total_images = ewc_hub_config.EWC_CLI_CPU_IMAGES + list(
+                dict.fromkeys(
+                    ewc_hub_config.EWC_CLI_GPU_IMAGES_SITE_MAP[federee].values()
+                )
+            )
             error_message = (
                 f"❌ Unsupported OS image for the EWC CLI: {image_name}\n\n"
                 f"🖥️ EWC Supported images (short names): [bold green]{', '.join(total_images)}[/bold green]\n"
                 "➡️ Please choose one of the supported OS images in short names or full name for similar OS.\n"
                 "You can find the full names here: [link=https://confluence.ecmwf.int/display/EWCLOUDKB/EWC+Virtual+Images+Available]https://confluence.ecmwf.int/display/EWCLOUDKB/EWC+Virtual+Images+Available[/link]"
             )
+            errors.insert(0, error_message)
 
-            return False, error_message
+        if errors:
+            return False, "\n".join(errors)
 
-        if flavour_name:
-            flavour = conn.compute.find_flavor(flavour_name)
+        return True, ""
 
-            if not flavour:
-                for flavor in conn.compute.flavors():
-                    _LOGGER.info(
-                        f"Name: {flavor.name}, ID: {flavor.id}, VCPUs: {flavor.vcpus}, RAM: {flavor.ram} MB"
-                    )
+    def iter_servers(
+        self,
+        conn: openstack.connection.Connection,
+        show_all: bool = False,
+        federee: Optional[str] = None,
+        max_workers: Optional[int] = None,
+    ) -> Iterator[dict]:
+        """Yield a row per OpenStack server, as the pages of servers arrive.
 
-                return False, f"Unknown flavour ({flavour_name}). Check list above."
+        The servers are listed in background while the images referenced by the
+        servers are resolved concurrently, each image once, instead of listing
+        every image first. Rows are yielded in the listing order.
 
-        if security_groups is not None:
-            for security_group_name in security_groups:
-                sec_group_name = conn.get_security_group(security_group_name)
-
-                if not sec_group_name:
-                    for sg in conn.network.security_groups():
-                        _LOGGER.info(
-                            f"Name: {sg.name}, ID: {sg.id}, Description: {sg.description or 'No description'}"
-                        )
-                    return (
-                        False,
-                        f"Unknown security group ({security_group_name}). Check list above.",
-                    )
+        :param conn: The OpenStack connection
+        :param show_all: list the servers not created by the ewccli too
+        :param federee: federee of the servers, to name their networks
+        :param max_workers: Maximum number of concurrent requests
+        """
+        legacy_servers = not show_all and self.legacy_servers_remain()
+        query = ewccli_servers_query(show_all=show_all, legacy_servers=legacy_servers)
+        legacy = []
+        listed: queue.Queue = queue.Queue()
+        end = object()
 
-        selected_networks = []
+        def list_servers():
+            try:
+                for server in conn.compute.servers(**query):
+                    listed.put(server)
+            except Exception as e:
+                listed.put(e)
+            finally:
+                listed.put(end)
+
+        images: dict = {}
+        pending: deque = deque()
+        finished = False
+
+        with ThreadPoolExecutor(
+            max_workers=(max_workers or ewc_hub_config.EWC_CLI_MAX_WORKERS) + 1
+        ) as executor:
+            executor.submit(list_servers)
+
+            while not finished or pending:
+                # Take every server listed so far, starting the lookup of their images
+                block = not pending
+                while not finished:
+                    try:
+                        server = listed.get(block=block)
+                    except queue.Empty:
+                        break
+
+                    block = False
+
+                    if server is end:
+                        finished = True
+                    elif isinstance(server, Exception):
+                        raise server
+                    # Clouds ignoring the tags filter list every server
+                    elif show_all or is_ewccli_server(server):
+                        if is_legacy_server(server):
+                            legacy.append(server.name)
+                        image_id = server.image.get("id") if server.image else None
+                        if image_id and image_id not in images:
+                            images[image_id] = executor.submit(
+                                self._image_name, conn, image_id
+                            )
+                        pending.append((server, images.get(image_id)))
+
+                if pending:
+                    server, image = pending.popleft()
+                    yield self._server_row(
+                        server, image.result() if image else "N/A", federee=federee
+                    )
 
-        if networks:
-            for network in networks:
-                selected_networks.append(network)
+        if legacy_servers:
+            self.record_legacy_servers(legacy)
 
-        for network_selected in selected_networks:
-            network = conn.network.find_network(network_selected)
+    def _image_name(self, conn: openstack.connection.Connection, image_id: str) -> str:
+        """Return the name of an image, N/A if gone."""
+        try:
+            image = conn.image.get_image(image_id)
+        except openstack.exceptions.NotFoundException:
+            return "N/A"
+
+        return getattr(image, "name", None) or "N/A"
+
+    def _server_row(
+        self, server, image_name: str, federee: Optional[str] = None
+    ) -> dict:
+        """Return the row of a server, as yielded by iter_servers."""
+        addresses = server.get("addresses") or {}
+        network_ip = {}
+
+        if federee == Federee.EUMETSAT.value:
+            if "private" in addresses:
+                for c in addresses.get("private"):
+                    if c.get("OS-EXT-IPS:type"):
+                        ip_type = c["OS-EXT-IPS:type"]
+                        network_ip[f"private-{ip_type}"] = c.get("addr")
+
+            if "manila-network" in addresses:
+                for c in addresses.get("manila-network"):
+                    network_ip["sfs-manila-network"] = c.get("addr")
 
-            if not network:
-                _LOGGER.error(f"Unknown network ({network_selected})")
+        if federee == Federee.ECMWF.value:
+            for address, address_v in addresses.items():
+                network_ip[f"{address}"] = [v.get("addr") for v in address_v]
 
-                for network in conn.network.networks():
-                    _LOGGER.info(f"Name: {network.name}, ID: {network.id}")
+        if federee:
+            networks = "\n".join([f"{n} ({v})" for n, v in network_ip.items()])
+        else:
+            networks = "\n".join([n for n in server.addresses])
 
-                return False, f"Unknown network ({network_selected})"
+        sec_groups = getattr(server, "security_groups") or []
 
-        return True, ""
+        _LOGGER.debug(f"{server.name} ({server.status}) - {server.id}")
 
+        return {
+            "name": server.name,
+            "status": server.status,
+            "flavor": server.flavor["original_name"],
+            "image": image_name,
+            "networks": networks,
+            "security-groups": ",".join(sg.get("name") for sg in sec_groups),
+            "keypair": server.key_name,
+            "id": server.id,
+        }
 
-    def list_servers(
+    def tag_legacy_servers(
         self,
         conn: openstack.connection.Connection,
-        show_all: bool = False,
-        federee: Optional[str] = None,
-    ):
-        """List all OpenStack servers."""
-        if show_all:
-            _LOGGER.info("--show-all is enabled.")
-        else:
-            _LOGGER.info(
-                "Listing only VMs created with EWC CLI. If you want to see all VMs, use --show-all flag."
-            )
-
-        # List all servers
-        servers = {}
-
-        # Build a dict of image IDs to image names
-        image_map = {image.id: image.name for image in conn.compute.images()}
-
-        for server in conn.compute.servers():
+        dry_run: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> tuple[ServerTagsResult, list[str], str]:
+        """Tag the servers carrying only the legacy deployed=ewccli metadata.
 
-            if (
-                not (
-                    server.metadata.get("deployed")
-                    and server.metadata.get("deployed") == "ewccli"
-                )
-                and not show_all
-            ):
-                continue
+        :param conn: The OpenStack connection
+        :param dry_run: Do not tag anything
+        :param max_workers: Maximum number of servers tagged concurrently
+        :return: (ServerTagsResult, names of the servers tagged, message)
+        """
+        legacy = [
+            server
+            for server in conn.compute.servers(details=True)
+            if is_legacy_server(server)
+        ]
 
-            image_id = server.image.get("id") if server.image else None
-            image_name = image_map.get(image_id, "N/A") if image_id else "N/A"
+        if not legacy:
+            self.record_legacy_servers([])
+            return ServerTagsResult(True, False), [], "No servers to tag."
 
-            addresses = server.get("addresses") or {}
-            network_ip = {}
+        if dry_run:
+            return (
+                ServerTagsResult(True, False),
+                [],
+                f"[Dry Run] Would tag {len(legacy)} servers: {', '.join(s.name for s in legacy)}",
+            )
 
-            if federee == Federee.EUMETSAT.value:
-                if "private" in addresses:
-                    for c in addresses.get("private"):
-                        if c.get("OS-EXT-IPS:type"):
-                            ip_type = c["OS-EXT-IPS:type"]
-                            network_ip[f"private-{ip_type}"] = c.get("addr")
+        def tag(server):
+            try:
+                conn.compute.add_tag_to_server(server, EWCCLI_SERVER_TAG)
+            except Exception as exc:
+                _LOGGER.warning(f"Failed to tag server {server.name}: {exc}")
+                return False
 
-                if "manila-network" in addresses:
-                    for c in addresses.get("manila-network"):
-                        network_ip["sfs-manila-network"] = c.get("addr")
+            return True
 
-            if federee == Federee.ECMWF.value:
-                for address, address_v in addresses.items():
-                    network_ip[f"{address}"] = [v.get("addr") for v in address_v]
+        results = run_concurrently(
+            {server.id: partial(tag, server) for server in legacy},
+            max_workers=max_workers,
+        )
+        tagged = [server.name for server in legacy if results[server.id]]
+        failed = len(legacy) - len(tagged)
 
-            if federee:
-                networks = "\n".join([f"{n} ({v})" for n, v in network_ip.items()])
-            else:
-                networks = "\n".join([n for n in server.addresses])
-
-            sec_groups = getattr(server, "security_groups") or []
-
-            servers[server.id] = {
-                "name": server.name,
-                "status": server.status,
-                "flavor": server.flavor["original_name"],
-                "image": image_name,
-                "networks": networks,
-                "security-groups": ",".join(sg.get("name") for sg in sec_groups),
-                "keypair": server.key_name,
-                "id": server.id,
-            }
+        msg = f"Tagged {len(tagged)} servers" + (f", {failed} failed" if failed else "")
 
-            _LOGGER.debug(f"{server.name} ({server.status}) - {server.id}")
+        if not failed:
+            self.record_legacy_servers([])
 
-        return servers
+        return ServerTagsResult(failed == 0, bool(tagged)), tagged, msg
 
     def delete_server(
         self,
@@ -1046,13 +1470,16 @@ class OpenstackBackend:
         force: bool = False,
         wait_time_s: int = 600,
         dry_run: bool = False,
+        resolver: Optional[OpenstackResourceResolver] = None,
     ) -> Tuple[ServerResult, str]:
         """Delete an OpenStack server.
 
         :param conn: The OpenStack connection
-        :param server_name: The server name
+        :param server_name: The server name or ID
         :param force: if enabled, also machine not created with the CLI will be deleted.
         :param wait_time_s: The maximum period to wait (for creation or deletion).
+        :param dry_run: Dry run.
+        :param resolver: resolver shared by the steps of the command.
         :returns: False on failure
         """
         if dry_run:
@@ -1067,8 +1494,10 @@ class OpenstackBackend:
 
         _LOGGER.info(f"Deleting... ({server_name})")
 
+        resolver = resolver or self.create_resolver(conn)
+
         # Verify if the server exists
-        server_info = conn.get_server(name_or_id=server_name)
+        server_info = resolver.get_server(server_name)
 
         if not server_info:
             return (
@@ -1087,18 +1516,21 @@ class OpenstackBackend:
         # and wait for it...
         conn.compute.delete_server(server_info)
 
-        time.sleep(10)
-        # # Verify if the server exists
-        # server_info = conn.get_server(name_or_id=server_name)
+        try:
+            wait_for_server_deleted(
+                conn, server_id=server_info.id, timeout_s=wait_time_s
+            )
+        except openstack.exceptions.ResourceTimeout:
+            return (
+                ServerResult(False, False, 1),
+                f"ResourceTimeout/delete ({server_name})",
+            )
+
+        resolver.forget_server(server_info.id)
 
-        # if not server_info:
-        #     try:
-        #         conn.compute.wait_for_delete(
-        #             server_info,
-        #             wait=wait_time_s
-        #         )
-        #     except openstack.exceptions.ResourceTimeout:
-        #         return ServerResult(False, False, 1), f"ResourceTimeout/delete ({server_name})"
+        inventory = self.open_inventory()
+        if inventory:
+            inventory.remove_server(server_info.id)
 
         return ServerResult(True, True, 0), f"({server_name}) deleted successfully."
 
@@ -1126,8 +1558,27 @@ class OpenstackBackend:
                 f"Floating IP ({fip.floating_ip_address}) detached from the machine."
             )
 
-            # 2. Release (delete) the floating IP
+            # 2. Keep the floating IP in the pool, if not full
+            pool_size = ewc_hub_config.EWC_CLI_FLOATING_IP_POOL_SIZE
+
+            if (
+                pool_size
+                and len(self._floating_ip_pool(conn, fip.floating_network_id))
+                < pool_size
+            ):
+                if EWCCLI_FLOATING_IP_POOL_TAG not in (fip.tags or []):
+                    conn.network.add_tag(fip, EWCCLI_FLOATING_IP_POOL_TAG)
+                _LOGGER.info(
+                    f"Floating IP ({fip.floating_ip_address}) kept in the ewccli pool."
+                )
+                return (
+                    ExternalIPResult(True, True),
+                    f"Finished detaching {external_ip} successfully.",
+                )
+
+            # 3. Release (delete) the floating IP
             conn.network.delete_ip(fip, ignore_missing=True)
+            wait_for_floating_ip_released(conn, floating_ip_id=fip.id)
             _LOGGER.info(
                 f"Floating IP ({fip.floating_ip_address}) released back to the pool."
             )
@@ -1146,11 +1597,20 @@ class OpenstackBackend:
         server: Server,
         federee: str,
         dry_run: bool = False,
+        resolver: Optional[OpenstackResourceResolver] = None,
     ) -> Tuple[ExternalIPResult, str, Optional[str]]:
         """Add external IP to the machine.
 
+        Only the floating IPs of the external network of the federee are reused,
+        the ones of the ewccli pool first. The pool is not filled again here, to
+        keep the attachment a single port update: it is refilled by
+        `ewc infra fip-pool`.
+
         :param conn: The OpenStack connection
         :param server: Server object
+        :param federee: federee of the server
+        :param dry_run: Dry run.
+        :param resolver: resolver shared by the steps of the deployment.
         """
         # Check if the VM has already a floating IP
         networks_ips = {}
@@ -1169,16 +1629,18 @@ class OpenstackBackend:
                 None,
             )
 
+        resolver = resolver or self.create_resolver(conn)
         default_network = ewc_hub_config.DEFAULT_NETWORK_MAP.get(federee)
         if federee == Federee.ECMWF.value:
-            networks_identified = [n.name for n in self.list_networks(conn=conn)]
-            private_network_name = [
-                n for n in networks_identified if default_network in n
-            ][0]
+            # The private network name has a suffix, found among the server addresses
+            private_network_name = next(
+                (n for n in server["addresses"] if default_network in n),
+                default_network,
+            )
         else:
             private_network_name = default_network
 
-        for c in server["addresses"][private_network_name]:
+        for c in server["addresses"].get(private_network_name) or []:
             if c.get("OS-EXT-IPS:type"):
                 networks_ips[c["OS-EXT-IPS:type"]] = c.get("addr")
 
@@ -1191,22 +1653,23 @@ class OpenstackBackend:
             )
 
         try:
-            network = conn.network.find_network(
+            network = resolver.find_network(
                 ewc_hub_config.DEFAULT_EXTERNAL_NETWORK_MAP.get(federee)
             )
-            floating_ips = list(conn.network.ips(status="DOWN"))
-
-            if floating_ips:
-                floating_ip = floating_ips[0]
-            else:
-                floating_ip = conn.network.create_ip(floating_network_id=network.id)
 
             ports = list(conn.network.ports(device_id=server.id))
             server_port = ports[0]
 
-            conn.network.update_ip(floating_ip, port_id=server_port.id)
+            floating_ip = self._bind_floating_ip(
+                conn, network_id=network.id, port_id=server_port.id
+            )
+            floating_ip = wait_for_floating_ip_active(
+                conn, floating_ip_id=floating_ip.id, port_id=server_port.id
+            )
 
         except Exception as e:
+            # The cached external network might be stale
+            resolver.invalidate("network")
             return (
                 ExternalIPResult(False, False),
                 f"Floating IP was not attached to VM {server.name} due to: {e}",
@@ -1219,6 +1682,444 @@ class OpenstackBackend:
             floating_ip,
         )
 
+    def _bind_floating_ip(
+        self,
+        conn: openstack.connection.Connection,
+        network_id: str,
+        port_id: str,
+    ):
+        """Bind an unbound floating IP of the network to the port, or a new one.
+
+        Each floating IP is bound with a single conditional update, on its revision,
+        so a floating IP taken meanwhile (e.g. by a replica deployed concurrently)
+        is skipped.
+
+        :param conn: The OpenStack connection
+        :param network_id: ID of the external network
+        :param port_id: ID of the server port
+        :return: the floating IP.
+        """
+        # Unbound floating IPs of the external network, the ones of the pool first
+        candidates = sorted(
+            (
+                ip
+                for ip in conn.network.ips(
+                    floating_network_id=network_id, status="DOWN"
+                )
+                if not ip.port_id
+            ),
+            key=lambda ip: EWCCLI_FLOATING_IP_POOL_TAG not in (ip.tags or []),
+        )
+
+        for candidate in candidates:
+            try:
+                return conn.network.update_ip(
+                    candidate,
+                    if_revision=getattr(candidate, "revision_number", None),
+                    port_id=port_id,
+                )
+            except (
+                openstack.exceptions.PreconditionFailedException,
+                openstack.exceptions.ConflictException,
+            ):
+                _LOGGER.debug(
+                    f"Floating IP {candidate.floating_ip_address} taken meanwhile."
+                )
+
+        return conn.network.create_ip(floating_network_id=network_id, port_id=port_id)
+
+    def _floating_ip_pool(
+        self, conn: openstack.connection.Connection, network_id: str
+    ) -> list:
+        """List the floating IPs of the ewccli pool on the external network."""
+        return [
+            ip
+            for ip in conn.network.ips(
+                floating_network_id=network_id, tags=EWCCLI_FLOATING_IP_POOL_TAG
+            )
+            if not ip.port_id
+        ]
+
+    def fill_floating_ip_pool(
+        self,
+        conn: openstack.connection.Connection,
+        federee: str,
+        size: Optional[int] = None,
+        resolver: Optional[OpenstackResourceResolver] = None,
+    ) -> Tuple[ExternalIPResult, str]:
+        """Reserve tagged floating IPs on the external network, up to the pool size.
+
+        Attaching an external IP then only binds a floating IP of the pool to the
+        server port.
+
+        :param conn: The OpenStack connection
+        :param federee: federee of the external network
+        :param size: size of the pool, defaults to EWC_CLI_FLOATING_IP_POOL_SIZE
+        :param resolver: resolver shared by the steps of the command.
+        :return: (ExternalIPResult, message)
+        """
+        size = ewc_hub_config.EWC_CLI_FLOATING_IP_POOL_SIZE if size is None else size
+        resolver = resolver or self.create_resolver(conn)
+
+        try:
+            network = resolver.find_network(
+                ewc_hub_config.DEFAULT_EXTERNAL_NETWORK_MAP.get(federee)
+            )
+            missing = size - len(self._floating_ip_pool(conn, network.id))
+
+            if missing <= 0:
+                return (
+                    ExternalIPResult(True, False),
+                    f"Floating IP pool is full ({size}).",
+                )
+
+            def reserve():
+                floating_ip = conn.network.create_ip(floating_network_id=network.id)
+                try:
+                    conn.network.set_tags(floating_ip, [EWCCLI_FLOATING_IP_POOL_TAG])
+                except Exception:
+                    # Untagged, the floating IP would never be reused nor released by the pool
+                    conn.network.delete_ip(floating_ip, ignore_missing=True)
+                    raise
+
+            run_concurrently({idx: reserve for idx in range(missing)})
+
+        except Exception as e:
+            return (
+                ExternalIPResult(False, False),
+                f"Floating IP pool was not filled due to: {e}",
+            )
+
+        return (
+            ExternalIPResult(True, True),
+            f"Reserved {missing} floating IPs in the pool.",
+        )
+
+    def create_resolver(
+        self, conn: openstack.connection.Connection, refresh_cache: bool = False
+    ) -> OpenstackResourceResolver:
+        """
+        Create a resolver memoising image, flavor, network and security group lookups.
+
+        Networks, subnets, security groups and flavours are cached on disk per profile
+        and tenant, unless EWC_CLI_TOPOLOGY_CACHE is disabled.
+
+        :param conn: The OpenStack connection
+        :param refresh_cache: list the tenant topology again instead of using the cache
+        """
+        topology = None
+        credential_id = getattr(self, "credential_id", None)
+        auth_url = getattr(self, "auth_url", None)
+
+        if ewc_hub_config.EWC_CLI_TOPOLOGY_CACHE and credential_id and auth_url:
+            topology = TopologyCache(
+                cache_file=get_topology_cache_file(
+                    credential_id=credential_id,
+                    auth_url=auth_url,
+                    profile=getattr(self, "profile", None),
+                ),
+                ttl_s=ewc_hub_config.EWC_CLI_TOPOLOGY_CACHE_TTL,
+                refresh=refresh_cache,
+            )
+
+        return OpenstackResourceResolver(conn, topology=topology)
+
+    def open_inventory(self) -> Optional[Inventory]:
+        """
+        Open the local inventory of the resources managed by the ewccli.
+
+        The inventory is kept per profile and tenant, unless EWC_CLI_INVENTORY is
+        disabled, and shared by the steps of the command.
+
+        :return: the inventory, or None if disabled or unavailable.
+        """
+        inventory = getattr(self, "_inventory", None)
+        credential_id = getattr(self, "credential_id", None)
+        auth_url = getattr(self, "auth_url", None)
+
+        if inventory or not (
+            ewc_hub_config.EWC_CLI_INVENTORY and credential_id and auth_url
+        ):
+            return inventory
+
+        try:
+            self._inventory = Inventory(
+                get_inventory_file(
+                    credential_id=credential_id,
+                    auth_url=auth_url,
+                    profile=getattr(self, "profile", None),
+                )
+            )
+        except (OSError, InventoryError) as inventory_error:
+            _LOGGER.debug(f"Could not open the inventory: {inventory_error}")
+            return None
+
+        return self._inventory
+
+    def _legacy_servers_marker_file(self) -> Optional[Path]:
+        """Return the file recording that no legacy server remains, if credentials."""
+        credential_id = getattr(self, "credential_id", None)
+        auth_url = getattr(self, "auth_url", None)
+
+        if not (credential_id and auth_url):
+            return None
+
+        cache_key = hashlib.sha256(
+            f"{credential_id}|{auth_url.rstrip('/')}".encode("utf-8")
+        ).hexdigest()
+
+        return (
+            get_profile_cache_path(profile=getattr(self, "profile", None))
+            / "legacy_servers"
+            / f"{cache_key}.migrated"
+        )
+
+    def legacy_servers_remain(self) -> bool:
+        """
+        Whether servers created by older ewccli versions, without tag, may remain.
+
+        Such servers are missed by the tags filter, so the servers are listed in
+        full until a listing finds none of them or `ewc infra migrate-tags` tags
+        them. The outcome is remembered per profile and tenant.
+        """
+        marker_file = self._legacy_servers_marker_file()
+
+        return marker_file is not None and not marker_file.exists()
+
+    def record_legacy_servers(self, names: list) -> None:
+        """
+        Record the legacy servers found by a full listing of the servers of the ewccli.
+
+        :param names: names of the servers carrying only the legacy metadata
+        """
+        if names:
+            _LOGGER.warning(
+                f"{len(names)} VMs created by older EWC CLI versions are not tagged:"
+                f" {', '.join(names)}."
+                " Run `ewc infra migrate-tags` to tag them and list the VMs faster."
+            )
+            return
+
+        marker_file = self._legacy_servers_marker_file()
+
+        if marker_file is None:
+            return
+
+        try:
+            marker_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+            marker_file.touch(mode=0o600)
+        except OSError as marker_error:
+            _LOGGER.debug(
+                f"Could not record the migration of the legacy servers: {marker_error}"
+            )
+
+    def record_server(
+        self,
+        conn: openstack.connection.Connection,
+        server: Server,
+        federee: Optional[str] = None,
+        volumes: tuple = (),
+    ) -> None:
+        """
+        Record a server deployed by the ewccli in the inventory, with its floating IPs and volumes.
+
+        :param conn: The OpenStack connection
+        :param server: The server, with its addresses
+        :param federee: federee of the server, to name its networks
+        :param volumes: volumes attached to the server by the ewccli
+        """
+        inventory = self.open_inventory()
+
+        if inventory is None:
+            return
+
+        image_id = (server.get("image") or {}).get("id")
+        image_name = inventory.image_names().get(image_id) or "N/A"
+
+        if image_id and image_name == "N/A":
+            try:
+                image_name = self._image_name(conn, image_id)
+            except openstack.exceptions.SDKException as e:
+                _LOGGER.debug(f"Could not resolve image {image_id}: {e}")
+
+        floating_ips = [
+            {"address": address.get("addr"), "status": "ACTIVE", "server_id": server.id}
+            for addresses in (server.get("addresses") or {}).values()
+            for address in addresses
+            if address.get("OS-EXT-IPS:type") == "floating"
+        ]
+
+        inventory.put_server(
+            self._inventory_server(server, image_name, federee=federee),
+            volumes=[
+                self._inventory_volume(volume, server_id=server.id)
+                for volume in volumes
+            ],
+            floating_ips=floating_ips,
+        )
+
+    def refresh_inventory(
+        self,
+        conn: openstack.connection.Connection,
+        inventory: Inventory,
+        federee: Optional[str] = None,
+        full: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> bool:
+        """
+        Reconcile the inventory with Openstack.
+
+        Servers are refreshed incrementally with the Nova changes-since filter,
+        which also returns the servers deleted meanwhile, and listed again once a
+        day. Neutron and Cinder have no equivalent filter, so the volumes of the
+        ewccli, the floating IPs and the keypairs are listed in full at every
+        refresh, concurrently with the servers.
+
+        :param conn: The OpenStack connection
+        :param inventory: The inventory to refresh
+        :param federee: federee of the servers, to name their networks
+        :param full: list every server instead of the changes only
+        :param max_workers: Maximum number of concurrent requests
+        :return: True if the inventory was updated.
+        """
+        full_refreshed_at = inventory.get_meta("full_refreshed_at")
+        changes_since = inventory.get_meta("changes_since")
+
+        if (
+            full
+            or not full_refreshed_at
+            or time.time() - float(full_refreshed_at) > _INVENTORY_FULL_REFRESH_S
+        ):
+            changes_since = None
+
+        watermark = ChangesSince(
+            changes_since,
+            legacy_servers=changes_since is None and self.legacy_servers_remain(),
+        )
+        full = watermark.value is None
+        query = watermark.query()
+
+        listings = run_concurrently(
+            {
+                "servers": lambda: list(conn.compute.servers(**query)),
+                "volumes": lambda: list(self.list_volumes(conn)),
+                "floating_ips": lambda: list(conn.network.ips()),
+                "keypairs": lambda: list(conn.compute.keypairs()),
+            },
+            max_workers=max_workers,
+        )
+
+        servers = []
+        removed = []
+
+        for server in listings["servers"]:
+            watermark.advance(server)
+
+            if is_deleted_server(server) or not is_ewccli_server(server):
+                removed.append(server.id)
+            else:
+                servers.append(server)
+
+        if watermark.legacy_servers:
+            self.record_legacy_servers(
+                [server.name for server in servers if is_legacy_server(server)]
+            )
+
+        # Images of the servers already inventoried are not resolved again
+        image_names = inventory.image_names()
+        missing_images = {
+            image_id
+            for server in servers
+            if (image_id := (server.get("image") or {}).get("id"))
+            and image_id not in image_names
+        }
+        image_names.update(
+            run_concurrently(
+                {
+                    image_id: partial(self._image_name, conn, image_id)
+                    for image_id in missing_images
+                },
+                max_workers=max_workers,
+            )
+        )
+
+        # Keypairs of the servers inventoried once refreshed, by server ID
+        inventoried = (
+            {} if full else {row["id"]: row["keypair"] for row in inventory.servers()}
+        )
+        for server_id in removed:
+            inventoried.pop(server_id, None)
+        inventoried.update({server.id: server.key_name for server in servers})
+
+        return inventory.sync(
+            servers=[
+                self._inventory_server(
+                    server,
+                    image_names.get((server.get("image") or {}).get("id"), "N/A"),
+                    federee=federee,
+                )
+                for server in servers
+            ],
+            removed=removed,
+            volumes=[
+                self._inventory_volume(
+                    volume,
+                    server_id=next(
+                        (
+                            a.get("server_id")
+                            for a in getattr(volume, "attachments", None) or []
+                        ),
+                        None,
+                    ),
+                )
+                for volume in listings["volumes"]
+            ],
+            floating_ips=[
+                {
+                    "address": fip.floating_ip_address,
+                    "id": fip.id,
+                    "status": fip.status,
+                    "server_id": device_id,
+                }
+                for fip in listings["floating_ips"]
+                # Floating IPs of the inventoried servers, and the pool
+                if (
+                    device_id := (getattr(fip, "port_details", None) or {}).get(
+                        "device_id"
+                    )
+                )
+                in inventoried
+                or EWCCLI_FLOATING_IP_POOL_TAG in (fip.tags or [])
+            ],
+            keypairs=[
+                {"name": keypair.name, "fingerprint": keypair.fingerprint}
+                for keypair in listings["keypairs"]
+                if keypair.name in inventoried.values()
+            ],
+            full=full,
+            changes_since=watermark.value,
+        )
+
+    def _inventory_server(
+        self, server, image_name: str, federee: Optional[str] = None
+    ) -> dict:
+        """Return the inventory record of a server: its row, image ID and update time."""
+        return {
+            **self._server_row(server, image_name, federee=federee),
+            "image_id": (server.get("image") or {}).get("id"),
+            "updated_at": server.get("updated_at"),
+        }
+
+    def _inventory_volume(self, volume, server_id: Optional[str] = None) -> dict:
+        """Return the inventory record of a volume."""
+        return {
+            "id": volume.id,
+            "name": volume.name,
+            "size": getattr(volume, "size", None),
+            "status": volume.status,
+            "server_id": server_id,
+        }
+
     def list_networks(
         self,
         conn: openstack.connection.Connection,
@@ -1232,22 +2133,23 @@ class OpenstackBackend:
     def remove_network(
         self, conn: openstack.connection.Connection, server: Server, network_name: str
     ):
-        """Add network to the machine.
+        """Remove network from the machine.
 
         :param conn: The OpenStack connection
         :param server: Server object
         :param network_name: name of the network
         """
-        # Get the network object
+        # Get the network objects, with one listing
+        networks = {net.id: net for net in conn.network.networks(name=network_name)}
         # List all interfaces (ports) attached to the server
         interfaces = list(conn.compute.server_interfaces(server))
         # Iterate over interfaces and detach the one you want
         detached = False
 
         for iface in interfaces:
-            network = conn.network.get_network(iface.net_id)
+            network = networks.get(iface.net_id)
 
-            if network.name == network_name:
+            if network is not None:
                 try:
                     conn.compute.delete_server_interface(server, iface.port_id)
                     _LOGGER.info(
@@ -0,0 +1,130 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Concurrent Openstack requests."""
+
+from collections import namedtuple
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional
+
+from ewccli.configuration import config as ewc_hub_config
+
+
+def run_concurrently(
+    tasks: Dict[Hashable, Callable[[], Any]],
+    max_workers: Optional[int] = None,
+) -> Dict[Hashable, Any]:
+    """Run independent calls on a bounded thread pool.
+
+    The calls share the Openstack connection, which is safe as long as they don't
+    modify the same resources. The first exception raised by a call is re-raised
+    once every call has finished.
+
+    :param tasks: calls without arguments, by key.
+    :param max_workers: maximum number of concurrent calls, EWC_CLI_MAX_WORKERS by default.
+    :return: results of the calls, by key.
+    """
+    if len(tasks) <= 1:
+        return {key: task() for key, task in tasks.items()}
+
+    max_workers = max(
+        1, min(len(tasks), max_workers or ewc_hub_config.EWC_CLI_MAX_WORKERS)
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ewccli"
+    ) as executor:
+        futures = {key: executor.submit(task) for key, task in tasks.items()}
+
+    return {key: future.result() for key, future in futures.items()}
+
+
+# Outcome of a task of a graph.
+# status  done, failed or skipped (a dependency did not succeed)
+# result  value returned by the task
+# error   exception raised by the task
+TaskResult = namedtuple("TaskResult", "status result error", defaults=(None, None))
+
+
+def run_task_graph(
+    tasks: Dict[Hashable, Callable[[], Any]],
+    dependencies: Optional[Dict[Hashable, Iterable[Hashable]]] = None,
+    succeeded: Callable[[Any], bool] = lambda result: True,
+    max_workers: Optional[int] = None,
+) -> Dict[Hashable, TaskResult]:
+    """Run tasks on a bounded thread pool, each one once its dependencies succeeded.
+
+    A task fails if it raises or if its result does not satisfy ``succeeded``.
+    Tasks depending on a failed or skipped task are skipped.
+
+    :param tasks: calls without arguments, by key.
+    :param dependencies: keys of the tasks each task waits for.
+    :param succeeded: whether the result of a task is a success.
+    :param max_workers: maximum number of concurrent calls, EWC_CLI_MAX_WORKERS by default.
+    :return: outcome of each task, by key.
+    """
+    dependencies = {
+        key: set(dependencies.get(key, ())) if dependencies else set() for key in tasks
+    }
+    unknown = {dep for deps in dependencies.values() for dep in deps} - set(tasks)
+    if unknown:
+        raise ValueError(f"Unknown task dependencies: {', '.join(map(str, unknown))}")
+
+    outcomes: Dict[Hashable, TaskResult] = {}
+    max_workers = max(
+        1, min(len(tasks) or 1, max_workers or ewc_hub_config.EWC_CLI_MAX_WORKERS)
+    )
+
+    with ThreadPoolExecutor(
+        max_workers=max_workers, thread_name_prefix="ewccli"
+    ) as executor:
+        running: Dict[Future, Hashable] = {}
+        started = set()
+
+        while len(outcomes) < len(tasks):
+            # Skips cascade through the whole graph, whatever the order of the tasks
+            skipping = True
+            while skipping:
+                skipping = False
+                for key in tasks:
+                    if key in started or key in outcomes:
+                        continue
+
+                    deps = dependencies[key]
+                    if any(
+                        dep in outcomes and outcomes[dep].status != "done"
+                        for dep in deps
+                    ):
+                        outcomes[key] = TaskResult("skipped")
+                        skipping = True
+
+            for key in tasks:
+                if key not in started and key not in outcomes:
+                    if all(dep in outcomes for dep in dependencies[key]):
+                        running[executor.submit(tasks[key])] = key
+                        started.add(key)
+
+            if not running:
+                if len(outcomes) < len(tasks):
+                    raise ValueError("Task dependencies contain a cycle.")
+                break
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+
+            for future in done:
+                key = running.pop(future)
+                try:
+                    result = future.result()
+                except Exception as error:
+                    outcomes[key] = TaskResult("failed", error=error)
+                else:
+                    outcomes[key] = TaskResult(
+                        "done" if succeeded(result) else "failed", result
+                    )
+
+    return outcomes
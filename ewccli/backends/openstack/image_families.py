@@ -0,0 +1,64 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Openstack image families supported by the EWC CLI."""
+
+import re
+from collections import namedtuple
+from typing import Optional
+
+TIMESTAMP_RE = r"\d{14}"
+
+# name     short name of the family, e.g. Rocky-9
+# pattern  compiled regex matching the Openstack names of the family images
+ImageFamily = namedtuple("ImageFamily", "name pattern")
+
+# Images published with a timestamp, the latest one is selected at deploy time.
+IMAGE_FAMILIES = {
+    family.name.lower(): family
+    for family in (
+        # Rocky-8 → Rocky-8.<minor>-<timestamp>
+        ImageFamily(
+            "Rocky-8", re.compile(rf"^Rocky-8\.\d+-{TIMESTAMP_RE}$", re.IGNORECASE)
+        ),
+        # Rocky-9 → Rocky-9.<minor>-<timestamp>
+        ImageFamily(
+            "Rocky-9", re.compile(rf"^Rocky-9\.\d+-{TIMESTAMP_RE}$", re.IGNORECASE)
+        ),
+        # Ubuntu-22.04 → Ubuntu-22.04-<timestamp>
+        ImageFamily(
+            "Ubuntu-22.04",
+            re.compile(rf"^Ubuntu-22\.04-{TIMESTAMP_RE}$", re.IGNORECASE),
+        ),
+        # Ubuntu-24.04 → Ubuntu-24.04-<timestamp>
+        ImageFamily(
+            "Ubuntu-24.04",
+            re.compile(rf"^Ubuntu-24\.04-{TIMESTAMP_RE}$", re.IGNORECASE),
+        ),
+        # Rocky-9.6-GPU → Rocky-9.<minor>-GPU-<timestamp> (ECMWF)
+        ImageFamily(
+            "Rocky-9.6-GPU",
+            re.compile(rf"^Rocky-9\.\d+-GPU-{TIMESTAMP_RE}$", re.IGNORECASE),
+        ),
+    )
+}
+
+# Normalization of Openstack image names to the family short names
+# Rocky-9.6-GPU-20251107150148 → Rocky-9.6-GPU (site GPU image)
+ROCKY_GPU_NAME_PATTERN = re.compile(r"^Rocky-(\d+)(?:\.\d+)?-GPU(?:-.+)?$")
+# Rocky-9.6-20251107141503 → Rocky-9
+ROCKY_NAME_PATTERN = re.compile(
+    rf"^(Rocky)-(\d+)(?:\.\d+)?-{TIMESTAMP_RE}$", re.IGNORECASE
+)
+# Ubuntu-24.04-20251107141503 → Ubuntu-24.04
+UBUNTU_NAME_PATTERN = re.compile(rf"^(Ubuntu-\d+\.\d+)-{TIMESTAMP_RE}$")
+
+
+def get_image_family(name: str) -> Optional[ImageFamily]:
+    """Return the family of a short image name, if any."""
+    return IMAGE_FAMILIES.get(name.lower())
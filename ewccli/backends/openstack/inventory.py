@@ -0,0 +1,313 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Local SQLite inventory of the Openstack resources managed by the ewccli."""
+
+import hashlib
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+from ewccli.logger import get_logger
+from ewccli.utils import get_profile_cache_path
+
+_LOGGER = get_logger(__name__)
+
+# Bump when the schema changes, the inventory is then rebuilt
+_INVENTORY_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS servers (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    status TEXT,
+    image TEXT,
+    image_id TEXT,
+    flavor TEXT,
+    networks TEXT,
+    security_groups TEXT,
+    keypair TEXT,
+    updated_at TEXT
+);
+CREATE TABLE IF NOT EXISTS volumes (
+    id TEXT PRIMARY KEY,
+    name TEXT,
+    size INTEGER,
+    status TEXT,
+    server_id TEXT
+);
+CREATE TABLE IF NOT EXISTS floating_ips (
+    address TEXT PRIMARY KEY,
+    id TEXT,
+    status TEXT,
+    server_id TEXT
+);
+CREATE TABLE IF NOT EXISTS keypairs (
+    name TEXT PRIMARY KEY,
+    fingerprint TEXT
+);
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT
+);
+"""
+
+# Columns of the servers table, by field of the server rows
+_SERVER_COLUMNS = {
+    "id": "id",
+    "name": "name",
+    "status": "status",
+    "image": "image",
+    "image_id": "image_id",
+    "flavor": "flavor",
+    "networks": "networks",
+    "security-groups": "security_groups",
+    "keypair": "keypair",
+    "updated_at": "updated_at",
+}
+
+_RESOURCE_COLUMNS = {
+    "volumes": ("id", "name", "size", "status", "server_id"),
+    "floating_ips": ("address", "id", "status", "server_id"),
+    "keypairs": ("name", "fingerprint"),
+}
+
+
+class InventoryError(Exception):
+    """The inventory database cannot be opened."""
+
+
+def get_inventory_file(
+    credential_id: str,
+    auth_url: str,
+    profile: Optional[str] = None,
+    cache_path: Optional[Path] = None,
+) -> Path:
+    """Return the inventory file for an application credential and auth URL.
+
+    :param credential_id: Openstack application credential ID.
+    :param auth_url: Openstack authorization URL.
+    :param profile: EWC CLI profile name.
+    :param cache_path: Root of the EWC CLI caches.
+    :return: path of the inventory file.
+    """
+    cache_key = hashlib.sha256(
+        f"{credential_id}|{auth_url.rstrip('/')}".encode("utf-8")
+    ).hexdigest()
+
+    return (
+        get_profile_cache_path(profile=profile, cache_path=cache_path)
+        / "inventory"
+        / f"{cache_key}.sqlite"
+    )
+
+
+class Inventory:
+    """SQLite snapshot of the servers, volumes, floating IPs and keypairs of the ewccli.
+
+    The snapshot is synchronised by the refreshes and updated right away by the
+    ewccli creating or deleting servers. Every update is a single transaction, so
+    readers never see a half-applied refresh. Failures to read or write the
+    inventory are logged and ignored, the inventory being only a cache.
+    """
+
+    def __init__(self, inventory_file: Path):
+        """
+        Initialize the inventory, creating the database if missing.
+
+        :param inventory_file: inventory file.
+        :raises InventoryError: if the database cannot be opened, e.g. corrupted.
+        """
+        self.inventory_file = inventory_file
+        self._lock = threading.RLock()
+        self.inventory_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        self.inventory_file.touch(mode=0o600, exist_ok=True)
+
+        try:
+            # Shared by the threads of a command, the lock serialising the accesses
+            self._db = sqlite3.connect(
+                str(inventory_file), timeout=10, check_same_thread=False
+            )
+            self._db.row_factory = sqlite3.Row
+
+            with self._lock, self._db:
+                if (
+                    self._db.execute("PRAGMA user_version").fetchone()[0]
+                    != _INVENTORY_VERSION
+                ):
+                    for table in ("servers", *_RESOURCE_COLUMNS, "meta"):
+                        self._db.execute(f"DROP TABLE IF EXISTS {table}")
+                    self._db.execute(f"PRAGMA user_version = {_INVENTORY_VERSION}")
+                self._db.executescript(_SCHEMA)
+        except sqlite3.Error as inventory_error:
+            raise InventoryError(
+                f"Could not open inventory {inventory_file}: {inventory_error}"
+            )
+
+    def close(self) -> None:
+        """Close the database."""
+        with self._lock:
+            self._db.close()
+
+    def servers(self) -> List[dict]:
+        """Return the rows of the servers, by name, as yielded by iter_servers."""
+        with self._lock:
+            records = self._db.execute("SELECT * FROM servers ORDER BY name").fetchall()
+
+        return [
+            {field: record[column] for field, column in _SERVER_COLUMNS.items()}
+            for record in records
+        ]
+
+    def resources(self, kind: str) -> List[dict]:
+        """Return the volumes, floating_ips or keypairs."""
+        with self._lock:
+            records = self._db.execute(f"SELECT * FROM {kind}").fetchall()
+
+        return [dict(record) for record in records]
+
+    def image_names(self) -> Dict[str, str]:
+        """Return the names of the images of the servers, by ID."""
+        with self._lock:
+            records = self._db.execute(
+                "SELECT DISTINCT image_id, image FROM servers WHERE image_id IS NOT NULL"
+            ).fetchall()
+
+        return {record["image_id"]: record["image"] for record in records}
+
+    def get_meta(self, key: str) -> Optional[str]:
+        """Return a value of the inventory metadata, e.g. changes_since."""
+        with self._lock:
+            record = self._db.execute(
+                "SELECT value FROM meta WHERE key = ?", (key,)
+            ).fetchone()
+
+        return record["value"] if record else None
+
+    def age_s(self) -> Optional[float]:
+        """Return the seconds since the last refresh, None if never refreshed."""
+        refreshed_at = self.get_meta("refreshed_at")
+
+        return time.time() - float(refreshed_at) if refreshed_at else None
+
+    def sync(
+        self,
+        servers: Iterable[dict],
+        removed: Iterable[str] = (),
+        volumes: Optional[Iterable[dict]] = None,
+        floating_ips: Optional[Iterable[dict]] = None,
+        keypairs: Optional[Iterable[dict]] = None,
+        full: bool = False,
+        changes_since: Optional[str] = None,
+    ) -> bool:
+        """Apply a refresh in a single transaction.
+
+        :param servers: rows of the servers listed.
+        :param removed: IDs of the servers gone.
+        :param volumes: volumes replacing the inventoried ones, if listed.
+        :param floating_ips: floating IPs replacing the inventoried ones, if listed.
+        :param keypairs: keypairs replacing the inventoried ones, if listed.
+        :param full: the servers listed replace the inventoried ones.
+        :param changes_since: watermark of the next incremental refresh.
+        :return: True if the inventory was updated.
+        """
+        now = str(time.time())
+
+        try:
+            with self._lock, self._db:
+                if full:
+                    self._db.execute("DELETE FROM servers")
+                    self._set_meta("full_refreshed_at", now)
+
+                self._db.executemany(
+                    "DELETE FROM servers WHERE id = ?",
+                    [(server_id,) for server_id in removed],
+                )
+                self._put_servers(servers)
+
+                for kind, records in (
+                    ("volumes", volumes),
+                    ("floating_ips", floating_ips),
+                    ("keypairs", keypairs),
+                ):
+                    if records is not None:
+                        self._db.execute(f"DELETE FROM {kind}")
+                        self._put(kind, records)
+
+                if changes_since:
+                    self._set_meta("changes_since", changes_since)
+
+                self._set_meta("refreshed_at", now)
+        except sqlite3.Error as inventory_error:
+            _LOGGER.debug(
+                f"Could not update inventory {self.inventory_file}: {inventory_error}"
+            )
+            return False
+
+        return True
+
+    def put_server(
+        self,
+        server: dict,
+        volumes: Iterable[dict] = (),
+        floating_ips: Iterable[dict] = (),
+    ) -> None:
+        """Record a server created or changed by the ewccli, with its volumes and floating IPs."""
+        try:
+            with self._lock, self._db:
+                self._put_servers([server])
+                self._put("volumes", volumes)
+                self._put("floating_ips", floating_ips)
+        except sqlite3.Error as inventory_error:
+            _LOGGER.debug(
+                f"Could not update inventory {self.inventory_file}: {inventory_error}"
+            )
+
+    def remove_server(self, server_id: str) -> None:
+        """Forget a server deleted by the ewccli, with its volumes and floating IPs."""
+        try:
+            with self._lock, self._db:
+                self._db.execute("DELETE FROM servers WHERE id = ?", (server_id,))
+                self._db.execute(
+                    "DELETE FROM volumes WHERE server_id = ?", (server_id,)
+                )
+                self._db.execute(
+                    "DELETE FROM floating_ips WHERE server_id = ?", (server_id,)
+                )
+        except sqlite3.Error as inventory_error:
+            _LOGGER.debug(
+                f"Could not update inventory {self.inventory_file}: {inventory_error}"
+            )
+
+    def _put_servers(self, servers: Iterable[dict]) -> None:
+        columns = ", ".join(_SERVER_COLUMNS.values())
+        placeholders = ", ".join("?" for _ in _SERVER_COLUMNS)
+
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO servers ({columns}) VALUES ({placeholders})",
+            [
+                tuple(server.get(field) for field in _SERVER_COLUMNS)
+                for server in servers
+            ],
+        )
+
+    def _put(self, kind: str, records: Iterable[dict]) -> None:
+        columns = _RESOURCE_COLUMNS[kind]
+
+        self._db.executemany(
+            f"INSERT OR REPLACE INTO {kind} ({', '.join(columns)})"
+            f" VALUES ({', '.join('?' for _ in columns)})",
+            [tuple(record.get(column) for column in columns) for record in records],
+        )
+
+    def _set_meta(self, key: str, value: str) -> None:
+        self._db.execute(
+            "INSERT OR REPLACE INTO meta (key, value) VALUES (?, ?)", (key, value)
+        )
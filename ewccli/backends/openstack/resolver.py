@@ -0,0 +1,368 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Openstack resource resolver memoising lookups for the duration of a command."""
+
+import re
+import threading
+import uuid
+from typing import Any, Callable, Dict, Hashable, Iterable, List, Optional, Tuple
+
+import openstack
+
+from ewccli.backends.openstack.topology_cache import TOPOLOGY_FIELDS
+from ewccli.backends.openstack.topology_cache import TopologyCache
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Characters of the Nova name filter regular expression to escape
+_NOVA_NAME_REGEX_SPECIAL = re.compile(r"([.^$*+?{}\[\]\\|()])")
+
+
+def exact_name_filter(name: str) -> str:
+    """Return the Nova name filter matching exactly the name.
+
+    Nova filters server names with a regular expression evaluated by its database,
+    so only the characters special to every regular expression dialect are escaped.
+    """
+    escaped = _NOVA_NAME_REGEX_SPECIAL.sub(r"\\\1", name)
+    return f"^{escaped}$"
+
+
+class OpenstackResourceResolver:
+    """Request-scoped memoising resolver of Openstack resources.
+
+    Each name or ID is looked up at most once against Nova/Glance/Neutron. Listings
+    also resolve the names and IDs they contain, so a lookup following a listing is free.
+    A resolver must not outlive the command it was created for.
+
+    With a topology cache, networks, subnets, security groups and flavours are resolved
+    from the on-disk listings. A name missing from a cached listing invalidates it once.
+
+    The resolver can be shared by threads: each kind of resource is listed by one thread at a time.
+    """
+
+    def __init__(
+        self,
+        conn: openstack.connection.Connection,
+        topology: Optional[TopologyCache] = None,
+    ):
+        """
+        Initialize the resolver.
+
+        :param conn: Openstack connection
+        :param topology: on-disk cache of the tenant topology
+        """
+        self.conn = conn
+        self.topology = topology
+        self._resources: Dict[Tuple[str, Hashable], Any] = {}
+        self._listings: Dict[str, List[Any]] = {}
+        # Kinds listed from the API during this command
+        self._listed: set = set()
+        self._lock = threading.Lock()
+        self._kind_locks: Dict[str, threading.RLock] = {}
+        # Server IDs by name and ID. Servers change state, so only their IDs are cached
+        self._server_ids: Dict[str, str] = {}
+
+    def _kind_lock(self, kind: str) -> threading.RLock:
+        """Return the lock serialising the listings of a kind of resource."""
+        with self._lock:
+            return self._kind_locks.setdefault(kind, threading.RLock())
+
+    def _memoize(self, kind: str, key: Hashable, lookup: Callable[[], Any]):
+        """Return the memoised resource or look it up once."""
+        if (kind, key) not in self._resources:
+            resource = lookup()
+            self._resources[(kind, key)] = resource
+            if resource is not None:
+                self.remember(kind, resource)
+
+        return self._resources[(kind, key)]
+
+    def _find(
+        self,
+        kind: str,
+        key: Hashable,
+        lookup: Callable[[], Any],
+        listing: Callable[[], Iterable[Any]],
+    ):
+        """Find a resource of the topology, from the cached listing when available."""
+        if self.topology is not None and (kind, key) not in self._resources:
+            with self._kind_lock(kind):
+                self._list(kind, listing)
+
+                if (kind, key) not in self._resources and kind not in self._listed:
+                    # The cached listing may predate the resource
+                    self.invalidate(kind)
+                    self._list(kind, listing)
+
+        # Ambiguous names and resources missing from the listing are left to the API
+        return self._memoize(kind, key, lookup)
+
+    def _list(self, kind: str, listing: Callable[[], Iterable[Any]]) -> List[Any]:
+        """Return the memoised listing or list once, resolving the names it contains."""
+        with self._kind_lock(kind):
+            if kind not in self._listings:
+                self._listings[kind] = self._index(kind, self._fetch(kind, listing))
+
+        return self._listings[kind]
+
+    def _fetch(self, kind: str, listing: Callable[[], Iterable[Any]]) -> List[Any]:
+        """Return the resources of a kind from the topology cache or the API."""
+        resources = None
+        cacheable = self.topology is not None and kind in TOPOLOGY_FIELDS
+
+        if cacheable:
+            resources = self.topology.get(kind)
+
+        if resources is None:
+            resources = list(listing())
+            self._listed.add(kind)
+            if cacheable:
+                self.topology.put(kind, resources)
+
+        return resources
+
+    def _index(self, kind: str, resources: List[Any]) -> List[Any]:
+        """Memoise the resources of a listing under their ID and unique names."""
+        names_count: Dict[str, int] = {}
+        for resource in resources:
+            name = getattr(resource, "name", None)
+            names_count[name] = names_count.get(name, 0) + 1
+
+        for resource in resources:
+            resource_id = getattr(resource, "id", None)
+            if resource_id is not None:
+                self._resources.setdefault((kind, resource_id), resource)
+
+            # Ambiguous names are left to the API, which reports the duplicates
+            name = getattr(resource, "name", None)
+            if name is not None and names_count[name] == 1:
+                self._resources.setdefault((kind, name), resource)
+
+        return resources
+
+    def remember(self, kind: str, resource: Any) -> None:
+        """Memoise a resource under its name and ID."""
+        for key in (getattr(resource, "id", None), getattr(resource, "name", None)):
+            if key is not None:
+                self._resources.setdefault((kind, key), resource)
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """Drop a kind of the topology, or the whole topology, from memory and disk."""
+        for topology_kind in [kind] if kind else TOPOLOGY_FIELDS:
+            self.forget(topology_kind)
+
+        if self.topology is not None:
+            self.topology.invalidate(kind)
+
+    def forget(self, kind: str, key: Optional[Hashable] = None) -> None:
+        """Drop a memoised resource, or every resource of a kind if no key is given."""
+        if key is None:
+            self._listings.pop(kind, None)
+            for resource_key in [k for k in list(self._resources) if k[0] == kind]:
+                self._resources.pop(resource_key, None)
+        else:
+            self._resources.pop((kind, key), None)
+
+    def find_image(self, name_or_id: Optional[str]):
+        """Find an image by name or ID."""
+        return self._memoize(
+            "image", name_or_id, lambda: self.conn.compute.find_image(name_or_id)
+        )
+
+    def find_flavor(self, name_or_id: Optional[str]):
+        """Find a flavor by name or ID."""
+        return self._find(
+            "flavor",
+            name_or_id,
+            lambda: self.conn.compute.find_flavor(name_or_id),
+            self.conn.compute.flavors,
+        )
+
+    def find_network(self, name_or_id: Optional[str]):
+        """Find a network by name or ID."""
+        return self._find(
+            "network",
+            name_or_id,
+            lambda: self.conn.network.find_network(name_or_id),
+            self.conn.network.networks,
+        )
+
+    def get_security_group(self, name_or_id: Optional[str]):
+        """Find a security group by name or ID."""
+        return self._find(
+            "security_group",
+            name_or_id,
+            lambda: self.conn.get_security_group(name_or_id),
+            self.conn.network.security_groups,
+        )
+
+    def find_security_groups(
+        self, names_or_ids: Iterable[str]
+    ) -> Tuple[Dict[str, Any], List[str]]:
+        """Find several security groups with a single listing.
+
+        Without a topology cache the listing is filtered on the requested names,
+        and on the requested IDs for those not found by name.
+
+        :param names_or_ids: security group names or IDs.
+        :return: security groups by requested name or ID, and the ones not found.
+        """
+        names_or_ids = list(dict.fromkeys(names_or_ids))
+        listed: Dict[Hashable, Any] = {}
+
+        def pending() -> List[str]:
+            return [
+                key
+                for key in names_or_ids
+                if ("security_group", key) not in self._resources and key not in listed
+            ]
+
+        def index(security_groups: Iterable[Any]) -> None:
+            for security_group in security_groups:
+                listed.setdefault(security_group.id, security_group)
+                listed.setdefault(security_group.name, security_group)
+
+        with self._kind_lock("security_group"):
+            if pending():
+                if self.topology is not None:
+                    index(self.security_groups())
+
+                    if pending() and "security_group" not in self._listed:
+                        # The cached listing may predate the security groups
+                        self.invalidate("security_group")
+                        index(self.security_groups())
+                else:
+                    for query in ("name", "id"):
+                        if pending():
+                            index(
+                                self.conn.network.security_groups(**{query: pending()})
+                            )
+
+        found: Dict[str, Any] = {}
+        for key in names_or_ids:
+            security_group = self._resources.get(("security_group", key)) or listed.get(
+                key
+            )
+            if security_group is not None:
+                found[key] = security_group
+                self._resources[("security_group", key)] = security_group
+
+        return found, [key for key in names_or_ids if key not in found]
+
+    def get_server(self, name_or_id: str):
+        """Get a server by name or ID, with details.
+
+        A server already resolved during the command is fetched by ID. Otherwise
+        IDs are fetched directly and names are listed with an exact name filter on
+        Nova side, instead of listing every server of the tenant.
+
+        :param name_or_id: server name or ID.
+        :return: the server, or None if not found.
+        :raises openstack.exceptions.SDKException: if several servers have the name.
+        """
+        server_id = self._server_ids.get(name_or_id)
+
+        if server_id is None and _is_uuid(name_or_id):
+            server_id = name_or_id
+
+        if server_id is not None:
+            try:
+                server = self.conn.compute.get_server(server_id)
+            except openstack.exceptions.NotFoundException:
+                server = None
+
+            if server is not None:
+                self.remember_server(server)
+                return server
+
+            self.forget_server(name_or_id)
+
+            if server_id == name_or_id:
+                return None
+
+        # The filter is a regular expression matched by the database, check it exactly
+        servers = [
+            server
+            for server in self.conn.compute.servers(
+                details=True, name=exact_name_filter(name_or_id)
+            )
+            if server.name == name_or_id
+        ]
+
+        if len(servers) > 1:
+            raise openstack.exceptions.SDKException(
+                f"Multiple matches found for {name_or_id}"
+            )
+
+        if not servers:
+            return None
+
+        self.remember_server(servers[0])
+        return servers[0]
+
+    def remember_server(self, server: Any) -> None:
+        """Memoise the ID of a server, e.g. once created, under its name and ID."""
+        server_id, name = (_server_field(server, "id"), _server_field(server, "name"))
+
+        with self._lock:
+            for key in (server_id, name):
+                if key is not None:
+                    self._server_ids[key] = server_id
+
+    def forget_server(self, name_or_id: str) -> None:
+        """Drop the ID of a server, e.g. once deleted."""
+        with self._lock:
+            server_id = self._server_ids.pop(name_or_id, name_or_id)
+            for key in [k for k, v in self._server_ids.items() if v == server_id]:
+                self._server_ids.pop(key, None)
+
+    def images(self) -> List[Any]:
+        """List images."""
+        return self._list("image", self.conn.compute.images)
+
+    def flavors(self) -> List[Any]:
+        """List flavors."""
+        return self._list("flavor", self.conn.compute.flavors)
+
+    def networks(self) -> List[Any]:
+        """List networks."""
+        return self._list("network", self.conn.network.networks)
+
+    def security_groups(self) -> List[Any]:
+        """List security groups."""
+        return self._list("security_group", self.conn.network.security_groups)
+
+    def subnets(self, network_id: Optional[str] = None) -> List[Any]:
+        """List subnets, optionally of a single network."""
+        subnets = self._list("subnet", self.conn.network.subnets)
+
+        if network_id is None:
+            return subnets
+
+        return [subnet for subnet in subnets if subnet.network_id == network_id]
+
+
+def _is_uuid(value: str) -> bool:
+    """Whether the value is a UUID, e.g. an Openstack server ID."""
+    try:
+        uuid.UUID(str(value))
+    except ValueError:
+        return False
+
+    return True
+
+
+def _server_field(server: Any, key: str) -> Any:
+    """Return a field of a server resource, or of a server listed as a dict."""
+    if isinstance(server, dict):
+        return server.get(key)
+
+    return getattr(server, key, None)
@@ -0,0 +1,142 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Retry of Openstack operations with jittered exponential backoff."""
+
+import random
+import time
+from collections import namedtuple
+from typing import Any, Callable, Optional
+
+import openstack
+from keystoneauth1 import exceptions as keystone_exceptions
+
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Retry policy of an operation.
+# attempts         maximum number of attempts
+# initial_delay_s  seconds before the second attempt
+# max_delay_s      maximum seconds between two attempts
+# backoff_factor   factor applied to the delay after each attempt
+# jitter           fraction of the delay randomly added or removed
+# deadline_s       seconds after which no new attempt is started
+RetryPolicy = namedtuple(
+    "RetryPolicy",
+    "attempts initial_delay_s max_delay_s backoff_factor jitter deadline_s",
+    defaults=(3, 2, 30, 2, 0.25, 900),
+)
+
+RETRY_POLICIES = {
+    # A failed server is deleted before the next attempt
+    "create_server": RetryPolicy(attempts=2, initial_delay_s=5, deadline_s=1800),
+    "create_volumes": RetryPolicy(),
+    "attach_volumes": RetryPolicy(),
+    "detach_volumes": RetryPolicy(),
+    "delete_volumes": RetryPolicy(),
+}
+
+# Conflict, rate limit and server side errors usually go away
+_TRANSIENT_STATUS_CODES = {408, 409, 429, 500, 502, 503, 504}
+
+
+def get_retry_policy(operation: str, **overrides: Any) -> RetryPolicy:
+    """Return the retry policy of an operation, with the given fields overridden.
+
+    :param operation: operation name, e.g. create_volumes.
+    :param overrides: policy fields, ignored when None.
+    :return: the retry policy.
+    """
+    policy = RETRY_POLICIES.get(operation, RetryPolicy())
+
+    return policy._replace(
+        **{field: value for field, value in overrides.items() if value is not None}
+    )
+
+
+def is_transient_error(error: BaseException) -> bool:
+    """Whether a failed operation may succeed if attempted again.
+
+    Timeouts, resources ending in error state, connection failures and HTTP
+    errors with a transient status code (408, 409, 429, 5xx) are transient.
+    Other errors, e.g. invalid requests, quotas or missing resources, are fatal.
+    """
+    if isinstance(
+        error,
+        (openstack.exceptions.ResourceTimeout, openstack.exceptions.ResourceFailure),
+    ):
+        return True
+
+    if isinstance(error, openstack.exceptions.HttpException):
+        return getattr(error, "status_code", None) in _TRANSIENT_STATUS_CODES
+
+    return isinstance(
+        error,
+        (
+            keystone_exceptions.RetriableConnectionFailure,
+            keystone_exceptions.ConnectionError,
+            ConnectionError,
+            TimeoutError,
+        ),
+    )
+
+
+def retry_call(
+    operation: Callable[[], Any],
+    policy: RetryPolicy,
+    description: str,
+    is_retryable: Callable[[BaseException], bool] = is_transient_error,
+    on_failure: Optional[Callable[[BaseException], None]] = None,
+) -> Any:
+    """Call an operation, attempting it again after transient failures.
+
+    The delay between attempts grows exponentially with random jitter, until
+    the attempts are exhausted or the next attempt would start after the deadline.
+
+    :param operation: call without arguments.
+    :param policy: retry policy of the operation.
+    :param description: what is attempted, used in the messages.
+    :param is_retryable: whether an error is worth another attempt.
+    :param on_failure: cleanup called with the error after each failed attempt.
+    :return: the value returned by the operation.
+    :raises: the error of the last attempt.
+    """
+    deadline = time.monotonic() + policy.deadline_s
+    delay = policy.initial_delay_s
+    attempt = 1
+
+    while True:
+        try:
+            return operation()
+        except Exception as error:
+            if on_failure is not None:
+                on_failure(error)
+
+            if attempt >= policy.attempts or not is_retryable(error):
+                raise
+
+            pause_s = min(delay, policy.max_delay_s)
+            pause_s = max(
+                0.0, pause_s * (1 + random.uniform(-policy.jitter, policy.jitter))
+            )
+
+            if time.monotonic() + pause_s > deadline:
+                _LOGGER.error(
+                    f"{description}: deadline of {policy.deadline_s} seconds reached."
+                )
+                raise
+
+            _LOGGER.warning(
+                f"{description} failed (attempt {attempt}/{policy.attempts}): {error}."
+                f" Retrying in {pause_s:.1f} seconds..."
+            )
+            time.sleep(pause_s)
+
+            delay *= policy.backoff_factor
+            attempt += 1
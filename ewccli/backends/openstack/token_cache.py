@@ -0,0 +1,126 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Openstack Keystone token and service catalog cache shared across CLI invocations."""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+from typing import Optional
+
+from keystoneauth1 import access
+
+from ewccli.logger import get_logger
+from ewccli.utils import get_profile_cache_path
+
+_LOGGER = get_logger(__name__)
+
+# Tokens expiring within this window are considered stale and renewed
+_TOKEN_EXPIRY_MARGIN_S = 300
+
+
+def get_token_cache_file(
+    credential_id: str,
+    auth_url: str,
+    profile: Optional[str] = None,
+    cache_path: Optional[Path] = None,
+) -> Path:
+    """Return the token cache file for an application credential and auth URL.
+
+    :param credential_id: Openstack application credential ID.
+    :param auth_url: Openstack authorization URL.
+    :param profile: EWC CLI profile name.
+    :param cache_path: Root of the EWC CLI caches.
+    :return: path of the token cache file.
+    """
+    cache_key = hashlib.sha256(
+        f"{credential_id}|{auth_url.rstrip('/')}".encode("utf-8")
+    ).hexdigest()
+
+    return (
+        get_profile_cache_path(profile=profile, cache_path=cache_path)
+        / "tokens"
+        / f"{cache_key}.json"
+    )
+
+
+def load_auth_state(
+    cache_file: Path, expiry_margin_s: int = _TOKEN_EXPIRY_MARGIN_S
+) -> Optional[str]:
+    """Load a cached Keystone auth state if it exists and is not about to expire.
+
+    :param cache_file: token cache file.
+    :param expiry_margin_s: seconds before expiry after which the token is discarded.
+    :return: auth state as accepted by keystoneauth ``set_auth_state`` or None.
+    """
+    if not cache_file.exists():
+        return None
+
+    try:
+        auth_state = cache_file.read_text(encoding="utf-8")
+        auth_data = json.loads(auth_state)
+        auth_ref = access.create(
+            body=auth_data["body"], auth_token=auth_data["auth_token"]
+        )
+    except (OSError, ValueError, KeyError, TypeError) as cache_error:
+        _LOGGER.debug(f"Ignoring unreadable token cache {cache_file}: {cache_error}")
+        return None
+
+    if auth_ref.will_expire_soon(stale_duration=expiry_margin_s):
+        _LOGGER.debug(f"Cached token in {cache_file} is expired or about to expire.")
+        return None
+
+    return auth_state
+
+
+def save_auth_state(cache_file: Path, auth_state: Optional[str]) -> None:
+    """Persist a Keystone auth state readable only by the current user.
+
+    :param cache_file: token cache file.
+    :param auth_state: auth state returned by keystoneauth ``get_auth_state``.
+    """
+    if not auth_state:
+        return
+
+    cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+    tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+    try:
+        file_descriptor = os.open(
+            tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+        )
+        with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+            f.write(auth_state)
+        os.replace(tmp_file, cache_file)
+    except OSError as cache_error:
+        _LOGGER.debug(f"Could not write token cache {cache_file}: {cache_error}")
+        tmp_file.unlink(missing_ok=True)
+
+
+def save_auth_state_on_reauthentication(auth_plugin, cache_file: Path) -> None:
+    """Persist the auth state again whenever keystoneauth renews the token.
+
+    keystoneauth re-authenticates transparently when the token expires during a
+    long command, the renewed token is then cached for the next invocations.
+
+    :param auth_plugin: keystoneauth identity plugin of the connection.
+    :param cache_file: token cache file.
+    """
+    get_access = auth_plugin.get_access
+
+    def get_access_and_save(session, **kwargs):
+        auth_ref = auth_plugin.auth_ref
+        access_info = get_access(session, **kwargs)
+        if access_info is not auth_ref:
+            _LOGGER.debug(f"Openstack token renewed, updating {cache_file}.")
+            save_auth_state(cache_file, auth_plugin.get_auth_state())
+
+        return access_info
+
+    auth_plugin.get_access = get_access_and_save
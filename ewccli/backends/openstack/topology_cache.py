@@ -0,0 +1,156 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Openstack tenant topology (networks, subnets, security groups, flavours) cache."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any, Dict, Iterable, List, Optional
+
+from ewccli.logger import get_logger
+from ewccli.utils import get_profile_cache_path
+
+_LOGGER = get_logger(__name__)
+
+# Bump when the layout of the cache changes
+_TOPOLOGY_CACHE_VERSION = 1
+
+# Attributes cached for each kind of resource
+TOPOLOGY_FIELDS = {
+    "network": ("id", "name"),
+    "subnet": ("id", "name", "network_id"),
+    "security_group": ("id", "name", "description"),
+    "flavor": ("id", "name", "vcpus", "ram", "disk"),
+}
+
+
+def get_topology_cache_file(
+    credential_id: str,
+    auth_url: str,
+    profile: Optional[str] = None,
+    cache_path: Optional[Path] = None,
+) -> Path:
+    """Return the topology cache file for an application credential and auth URL.
+
+    :param credential_id: Openstack application credential ID.
+    :param auth_url: Openstack authorization URL.
+    :param profile: EWC CLI profile name.
+    :param cache_path: Root of the EWC CLI caches.
+    :return: path of the topology cache file.
+    """
+    cache_key = hashlib.sha256(
+        f"{credential_id}|{auth_url.rstrip('/')}".encode("utf-8")
+    ).hexdigest()
+
+    return (
+        get_profile_cache_path(profile=profile, cache_path=cache_path)
+        / "topology"
+        / f"{cache_key}.json"
+    )
+
+
+class TopologyCache:
+    """On-disk cache of the tenant resources which rarely change.
+
+    Each kind of resource is listed and cached on its own, and expires after the TTL.
+    Updates are serialised, so the cache can be shared by the threads of a command.
+    """
+
+    def __init__(self, cache_file: Path, ttl_s: int, refresh: bool = False):
+        """
+        Initialize the cache.
+
+        :param cache_file: topology cache file.
+        :param ttl_s: seconds after which a cached listing is stale.
+        :param refresh: ignore the cached listings, e.g. with --refresh-cache.
+        """
+        self.cache_file = cache_file
+        self.ttl_s = ttl_s
+        self._lock = threading.RLock()
+        self._topology: Dict[str, Any] = {} if refresh else self._load()
+
+    def _load(self) -> Dict[str, Any]:
+        if not self.cache_file.exists():
+            return {}
+
+        try:
+            topology = json.loads(self.cache_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as cache_error:
+            _LOGGER.debug(
+                f"Ignoring unreadable topology cache {self.cache_file}: {cache_error}"
+            )
+            return {}
+
+        if (
+            not isinstance(topology, dict)
+            or topology.get("version") != _TOPOLOGY_CACHE_VERSION
+        ):
+            return {}
+
+        return topology.get("resources") or {}
+
+    def _save(self) -> None:
+        self.cache_file.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        tmp_file = self.cache_file.with_suffix(f".{os.getpid()}.tmp")
+
+        try:
+            file_descriptor = os.open(
+                tmp_file, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600
+            )
+            with os.fdopen(file_descriptor, "w", encoding="utf-8") as f:
+                json.dump(
+                    {"version": _TOPOLOGY_CACHE_VERSION, "resources": self._topology}, f
+                )
+            os.replace(tmp_file, self.cache_file)
+        except (OSError, TypeError, ValueError) as cache_error:
+            _LOGGER.debug(
+                f"Could not write topology cache {self.cache_file}: {cache_error}"
+            )
+            tmp_file.unlink(missing_ok=True)
+
+    def get(self, kind: str) -> Optional[List[SimpleNamespace]]:
+        """Return the cached resources of a kind, or None if missing or stale."""
+        entry = self._topology.get(kind)
+
+        if not entry or time.time() - entry.get("cached_at", 0) > self.ttl_s:
+            return None
+
+        return [SimpleNamespace(**record) for record in entry.get("items", [])]
+
+    def put(self, kind: str, resources: Iterable[Any]) -> None:
+        """Cache the resources of a kind."""
+        with self._lock:
+            self._topology[kind] = {
+                "cached_at": time.time(),
+                "items": [
+                    {
+                        field: getattr(resource, field, None)
+                        for field in TOPOLOGY_FIELDS[kind]
+                    }
+                    for resource in resources
+                ],
+            }
+            self._save()
+
+    def invalidate(self, kind: Optional[str] = None) -> None:
+        """Drop the cached resources of a kind, or the whole topology."""
+        with self._lock:
+            if kind is None:
+                self._topology = {}
+            else:
+                self._topology.pop(kind, None)
+
+            _LOGGER.debug(
+                f"Invalidated topology cache ({kind or 'all'}) {self.cache_file}."
+            )
+            self._save()
@@ -0,0 +1,292 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Waiters polling the state of Openstack resources."""
+
+import time
+from typing import Any, Callable, Iterable, Optional, Tuple
+
+import openstack
+
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Delays between two polls: 1s, 2s, 4s, 8s, 10s, 10s, ...
+_INITIAL_DELAY_S = 1
+_MAX_DELAY_S = 10
+_BACKOFF_FACTOR = 2
+
+
+def wait_for(
+    condition: Callable[[], Any],
+    description: str,
+    timeout_s: float,
+    initial_delay_s: float = _INITIAL_DELAY_S,
+    max_delay_s: float = _MAX_DELAY_S,
+    backoff_factor: float = _BACKOFF_FACTOR,
+) -> Any:
+    """Poll a condition with exponential backoff until it holds or the deadline passes.
+
+    The condition is checked right away, so a resource already in the expected
+    state costs a single request.
+
+    :param condition: call returning a truthy value once the condition holds.
+    :param description: what is waited for, used in the messages.
+    :param timeout_s: seconds after which the wait fails.
+    :param initial_delay_s: seconds before the second poll.
+    :param max_delay_s: maximum seconds between two polls.
+    :param backoff_factor: factor applied to the delay after each poll.
+    :return: the value returned by the condition.
+    :raises TimeoutError: if the deadline passes.
+    """
+    deadline = time.monotonic() + timeout_s
+    delay = initial_delay_s
+
+    while True:
+        result = condition()
+
+        if result:
+            return result
+
+        remaining = deadline - time.monotonic()
+
+        if remaining <= 0:
+            raise TimeoutError(
+                f"Timeout waiting for {description} after {timeout_s} seconds."
+            )
+
+        _LOGGER.debug(
+            f"Waiting for {description}, next check in {min(delay, remaining):.0f}s..."
+        )
+        time.sleep(min(delay, remaining))
+        delay = min(delay * backoff_factor, max_delay_s)
+
+
+def wait_for_resource(
+    condition: Callable[[], Any], description: str, timeout_s: float
+) -> Any:
+    """Wait for an Openstack resource, failing as the openstacksdk waiters do.
+
+    :param condition: call returning a truthy value once the resource is ready.
+    :param description: what is waited for, used in the messages.
+    :param timeout_s: seconds after which the wait fails.
+    :return: the value returned by the condition.
+    :raises openstack.exceptions.ResourceTimeout: if the deadline passes.
+    """
+    try:
+        return wait_for(condition, description=description, timeout_s=timeout_s)
+    except TimeoutError as e:
+        raise openstack.exceptions.ResourceTimeout(str(e)) from e
+
+
+def wait_for_server_deleted(
+    conn: openstack.connection.Connection,
+    server_id: str,
+    timeout_s: float = 600,
+) -> bool:
+    """Wait until the server is gone from Nova.
+
+    :param conn: The OpenStack connection
+    :param server_id: ID of the deleted server
+    :param timeout_s: The maximum period to wait
+    """
+    return wait_for_resource(
+        lambda: conn.compute.find_server(server_id, ignore_missing=True) is None,
+        description=f"server {server_id} deletion",
+        timeout_s=timeout_s,
+    )
+
+
+def wait_for_floating_ip_active(
+    conn: openstack.connection.Connection,
+    floating_ip_id: str,
+    port_id: str,
+    timeout_s: float = 300,
+):
+    """Wait until the floating IP is bound to the port and both are ACTIVE.
+
+    :param conn: The OpenStack connection
+    :param floating_ip_id: ID of the floating IP
+    :param port_id: ID of the server port
+    :param timeout_s: The maximum period to wait
+    :return: the floating IP.
+    """
+
+    def is_active():
+        floating_ip = conn.network.get_ip(floating_ip_id)
+
+        if floating_ip.port_id != port_id or floating_ip.status != "ACTIVE":
+            return None
+
+        if conn.network.get_port(port_id).status != "ACTIVE":
+            return None
+
+        return floating_ip
+
+    return wait_for_resource(
+        is_active,
+        description=f"floating IP {floating_ip_id} on port {port_id}",
+        timeout_s=timeout_s,
+    )
+
+
+def wait_for_floating_ip_released(
+    conn: openstack.connection.Connection,
+    floating_ip_id: str,
+    timeout_s: float = 300,
+) -> bool:
+    """Wait until the floating IP is released back to the pool.
+
+    :param conn: The OpenStack connection
+    :param floating_ip_id: ID of the released floating IP
+    :param timeout_s: The maximum period to wait
+    """
+    return wait_for_resource(
+        lambda: conn.network.find_ip(floating_ip_id, ignore_missing=True) is None,
+        description=f"floating IP {floating_ip_id} release",
+        timeout_s=timeout_s,
+    )
+
+
+def wait_for_server_address(
+    conn: openstack.connection.Connection,
+    server_id: str,
+    address: Optional[str],
+    timeout_s: float = 120,
+):
+    """Wait until Nova reports the address among the server addresses.
+
+    Nova updates the server addresses asynchronously after Neutron changes.
+    The server is fetched by ID, without listing the servers.
+
+    :param conn: The OpenStack connection
+    :param server_id: The server ID
+    :param address: IP address expected on the server
+    :param timeout_s: The maximum period to wait
+    :return: the server.
+    """
+
+    def has_address():
+        server = conn.compute.get_server(server_id)
+
+        if not server:
+            return None
+
+        addresses = server.get("addresses") or {}
+        if any(
+            a.get("addr") == address for values in addresses.values() for a in values
+        ):
+            return server
+
+        return None
+
+    return wait_for_resource(
+        has_address,
+        description=f"address {address} on server {server_id}",
+        timeout_s=timeout_s,
+    )
+
+
+def wait_for_volumes_status(
+    conn: openstack.connection.Connection,
+    volume_ids: Iterable[str],
+    metadata: dict,
+    status: str = "available",
+    failures: Iterable[str] = ("error",),
+    timeout_s: float = 600,
+) -> Tuple[dict, dict, set]:
+    """Wait until the volumes reach the status, with a single listing per poll.
+
+    The volumes are listed by metadata rather than polled one by one, so waiting
+    for N volumes costs the same requests as waiting for one.
+
+    :param conn: The OpenStack connection
+    :param volume_ids: IDs of the volumes
+    :param metadata: metadata shared by the volumes, filtering the listing
+    :param status: The expected status
+    :param failures: Statuses in which the volumes will not reach the status
+    :param timeout_s: The maximum period to wait
+    :return: the volumes in the status and the failed volumes, by ID, and the IDs
+        of the volumes still pending at the deadline.
+    """
+    pending = set(volume_ids)
+    ready: dict = {}
+    failed: dict = {}
+
+    def settled():
+        for volume in conn.block_storage.volumes(details=True, metadata=metadata):
+            if volume.id not in pending:
+                continue
+
+            if volume.status == status:
+                ready[volume.id] = volume
+                pending.discard(volume.id)
+            elif volume.status in failures:
+                failed[volume.id] = volume
+                pending.discard(volume.id)
+
+        return not pending
+
+    try:
+        wait_for(
+            settled, description=f"{len(pending)} volumes {status}", timeout_s=timeout_s
+        )
+    except TimeoutError as e:
+        _LOGGER.warning(str(e))
+
+    return ready, failed, pending
+
+
+def wait_for_volumes_deleted(
+    conn: openstack.connection.Connection,
+    volume_ids: Iterable[str],
+    metadata: Optional[dict] = None,
+    timeout_s: float = 600,
+) -> Tuple[set, dict, set]:
+    """Wait until the volumes are gone, with a single listing per poll.
+
+    :param conn: The OpenStack connection
+    :param volume_ids: IDs of the deleted volumes
+    :param metadata: metadata shared by the volumes, filtering the listing
+    :param timeout_s: The maximum period to wait
+    :return: the IDs of the deleted volumes, the volumes which failed to
+        delete (error_deleting) by ID, and the IDs of the volumes still
+        pending at the deadline.
+    """
+    pending = set(volume_ids)
+    deleted: set = set()
+    failed: dict = {}
+    filters = {"metadata": metadata} if metadata else {}
+
+    def gone():
+        listed = {
+            volume.id: volume
+            for volume in conn.block_storage.volumes(details=True, **filters)
+        }
+
+        for volume_id in list(pending):
+            volume = listed.get(volume_id)
+
+            if volume is None:
+                deleted.add(volume_id)
+                pending.discard(volume_id)
+            elif volume.status == "error_deleting":
+                failed[volume_id] = volume
+                pending.discard(volume_id)
+
+        return not pending
+
+    try:
+        wait_for(
+            gone, description=f"{len(pending)} volumes deletion", timeout_s=timeout_s
+        )
+    except TimeoutError as e:
+        _LOGGER.warning(str(e))
+
+    return deleted, failed, pending
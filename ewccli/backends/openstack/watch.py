@@ -0,0 +1,100 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Incremental watch of the Openstack servers with Nova changes-since."""
+
+from collections import namedtuple
+from typing import Dict, List, Optional
+
+import openstack
+
+from ewccli.backends.openstack.backend_ostack import ChangesSince
+from ewccli.backends.openstack.backend_ostack import is_deleted_server
+from ewccli.backends.openstack.backend_ostack import is_ewccli_server
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Status transition of a server.
+# server_id  ID of the server
+# name       name of the server
+# previous   previous status, None for a server appearing
+# status     new status, DELETED for a server gone
+ServerEvent = namedtuple("ServerEvent", "server_id name previous status")
+
+
+class ServerWatcher:
+    """Track the status of the servers, polling Nova for the changes only.
+
+    The first poll lists the servers. The next ones only list the servers changed
+    since the most recent update seen, with the Nova changes-since filter, which
+    also returns the servers deleted meanwhile. Using the update times reported by
+    Nova as watermark avoids any clock skew with the client.
+    """
+
+    def __init__(
+        self,
+        conn: openstack.connection.Connection,
+        show_all: bool = False,
+        legacy_servers: bool = False,
+    ):
+        """
+        Initialize the watcher.
+
+        :param conn: Openstack connection
+        :param show_all: watch the servers not created by the ewccli too
+        :param legacy_servers: servers of older ewccli versions, without tag, may remain
+        """
+        self.conn = conn
+        self.show_all = show_all
+        # Name and status of the servers watched, by ID
+        self.servers: Dict[str, tuple] = {}
+        self.watermark = ChangesSince(show_all=show_all, legacy_servers=legacy_servers)
+
+    @property
+    def changes_since(self) -> Optional[str]:
+        """Most recent update time seen, the watermark of the next poll."""
+        return self.watermark.value
+
+    def snapshot(self) -> int:
+        """List the servers to watch, returning their number."""
+        for server in self.conn.compute.servers(details=True, **self.watermark.query()):
+            if self.show_all or is_ewccli_server(server):
+                self.servers[server.id] = (server.name, server.status)
+                self.watermark.advance(server)
+
+        return len(self.servers)
+
+    def poll(self) -> List[ServerEvent]:
+        """Apply the changes since the last poll, returning the status transitions."""
+        # Listed before any change, so a failed poll can be retried from the same watermark
+        changed = list(
+            self.conn.compute.servers(details=True, **self.watermark.query())
+        )
+        events = []
+
+        for server in changed:
+            self.watermark.advance(server)
+            known = self.servers.get(server.id)
+            deleted = is_deleted_server(server)
+
+            if known is None:
+                if deleted or not (self.show_all or is_ewccli_server(server)):
+                    continue
+                self.servers[server.id] = (server.name, server.status)
+                events.append(ServerEvent(server.id, server.name, None, server.status))
+            elif deleted:
+                del self.servers[server.id]
+                events.append(ServerEvent(server.id, known[0], known[1], "DELETED"))
+            elif known[1] != server.status:
+                self.servers[server.id] = (server.name, server.status)
+                events.append(
+                    ServerEvent(server.id, server.name, known[1], server.status)
+                )
+
+        return events
@@ -17,7 +17,6 @@ from pathlib import Path
 from typing import Optional
 from datetime import datetime, timezone
 
-import yaml
 import rich_click as click
 from rich.console import Console
 from rich.table import Table
@@ -29,6 +28,8 @@ from ewccli.backends.kubernetes.utils import get_reason_from_conditions
 from ewccli.enums import HubItemOherAnnotation, HubItemCLIKeys
 from ewccli.configuration import config as ewc_hub_config
 from ewccli.utils import download_items
+from ewccli.commands.hub.hub_catalog import HubItemsCatalog
+from ewccli.commands.hub.hub_catalog import load_hub_catalog
 from ewccli.logger import get_logger
 
 _LOGGER = get_logger(__name__)
@@ -94,29 +95,16 @@ def default_username():
     return f"{username}"
 
 
-def load_hub_items(path_to_catalog: str = ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH) -> dict:
+def load_hub_items(
+    path_to_catalog: str = ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH,
+) -> HubItemsCatalog:
     """Load EWC Hub Items from file."""
     download_items()
-    with open(path_to_catalog, "r") as file:
-        items_file = yaml.safe_load(file)
-
-        if not items_file:
-            _LOGGER.error("items.yaml is empty.")
-            sys.exit(1)
-
-        items_spec = items_file.get("spec")
-
-        if not items_spec:
-            _LOGGER.error("spec key is missing from items.yaml.")
-            sys.exit(1)
-
-        items = items_spec.get("items")
-
-        if not items:
-            _LOGGER.error("items key is missing from spec key in items.yaml.")
-            sys.exit(1)
-
-        return items
+    try:
+        return load_hub_catalog(path_to_catalog=path_to_catalog)
+    except ValueError as catalog_error:
+        _LOGGER.error(str(catalog_error))
+        sys.exit(1)
 
 
 def split_config_name(config_name: str) -> tuple[str, str]:
@@ -270,6 +258,13 @@ def openstack_optional_options(func):
         multiple=True,
         help="Attach an extra volume of the given size in GB. Can be used multiple times.",
     )(func)
+    func = click.option(
+        "--refresh-cache",
+        is_flag=True,
+        default=False,
+        envvar="EWC_CLI_REFRESH_CACHE",
+        help="List networks, subnets, security groups and flavours again instead of using the cache.",
+    )(func)
 
     return func
 
@@ -344,12 +339,16 @@ def ssh_options(func):
     return func
 
 
-def list_items_table(hub_items: dict):
+def list_items_table(
+    hub_items: dict,
+    ewccli_compatible_only: bool = True,
+    title: str = "EWC HUB Items",
+):
     """List items in table."""
     table = Table(
         show_header=True,
         header_style="bold green",
-        title="EWC HUB Items",
+        title=title,
         box=box.MINIMAL_DOUBLE_HEAD,
     )
     table.add_column("Item", overflow="fold")
@@ -360,14 +359,17 @@ def list_items_table(hub_items: dict):
 
     for item, item_v in hub_items.items():
         annotations = item_v.get("annotations")
-        if not annotations:
+        if not annotations and ewccli_compatible_only:
             _LOGGER.warning(f"Filtering {item} as it doesn't contain annotations.")
             continue
 
-        others_annotations = annotations.get("others", "").split(",")
+        others_annotations = (annotations or {}).get("others", "").split(",")
 
         # Filter items not EWCCLI compatible
-        if HubItemOherAnnotation.EWCCLI_COMPATIBLE.value not in others_annotations:
+        if (
+            ewccli_compatible_only
+            and HubItemOherAnnotation.EWCCLI_COMPATIBLE.value not in others_annotations
+        ):
             _LOGGER.warning(
                 f"Filtering {item} as this is not compatible with the EWCCLI according to the catalog:"
                 f"\n`{HubItemOherAnnotation.EWCCLI_COMPATIBLE.value}` annotation is not in `others` annotations list."
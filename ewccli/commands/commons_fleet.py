@@ -0,0 +1,563 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+"""Fleet manifests: servers, DNS records and hub items applied as one plan.
+
+A manifest looks like:
+
+    servers:
+      - name: db
+        image: Ubuntu-22.04
+        flavour: eo2.large
+        extra_volumes: [50]
+      - name: web
+        image: Ubuntu-22.04
+        external_ip: true
+        depends_on: [db]
+    dns:
+      - name: web-dns
+        server: web
+    items:
+      - name: web-app
+        item: nginx
+        server: web
+        inputs:
+          nginx_port: 8080
+        depends_on: [web-dns]
+
+DNS records and items implicitly depend on their server.
+"""
+
+import threading
+from collections import defaultdict
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+import yaml
+from pydantic import BaseModel, ValidationError, validator
+from rich.console import Console
+from rich.table import Table
+from rich import box
+from openstack import connection
+
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.concurrency import TaskResult, run_task_graph
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.commands.commons import build_dns_record_name
+from ewccli.commands.commons import wait_for_dns_record
+from ewccli.commands.commons_infra import CreateServerInputs
+from ewccli.commands.commons_infra import deploy_server
+from ewccli.commands.commons_infra import identify_server_reconfiguration
+from ewccli.commands.commons_infra import post_deploy_server_setup
+from ewccli.commands.commons_infra import pre_deploy_server_setup
+from ewccli.commands.commons_infra import resolve_machine_ip
+from ewccli.commands.commons_infra import setup_keypair
+from ewccli.commands.hub.hub_command import check_missing_required_inputs
+from ewccli.commands.hub.hub_command import fill_default_item_inputs
+from ewccli.commands.hub.hub_command import prepare_item_working_directory
+from ewccli.commands.hub.hub_command import run_item_playbook
+from ewccli.commands.hub.hub_command import split_item_inputs
+from ewccli.commands.hub.hub_command import validate_item_input_types
+from ewccli.commands.hub.hub_utils import extract_annotations
+from ewccli.commands.hub.hub_utils import verify_item_is_deployable
+from ewccli.configuration import config as ewc_hub_config
+from ewccli.enums import HubItemCLIKeys, HubItemTechnologyAnnotation, Region
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+console = Console()
+
+
+def _as_tuple(v):
+    if v is None:
+        return ()
+    if isinstance(v, (list, tuple)):
+        return tuple(v)
+    return (v,)
+
+
+class FleetResource(BaseModel):
+    name: str
+
+    depends_on: Tuple[str, ...] = ()
+
+    @validator("depends_on", pre=True)
+    def normalize_depends_on(cls, v):
+        return _as_tuple(v)
+
+
+class FleetServer(FleetResource):
+    image: Optional[str] = None
+    flavour: Optional[str] = None
+    external_ip: bool = False
+    is_gpu: bool = False
+
+    networks: Optional[Tuple[str, ...]] = None
+    security_groups: Optional[Tuple[str, ...]] = None
+    extra_volumes: Optional[Tuple[int, ...]] = None
+
+    @validator("networks", "security_groups", "extra_volumes", pre=True)
+    def normalize_tuple(cls, v):
+        return _as_tuple(v)
+
+    def server_inputs(
+        self, keypair_name: str, federee: Optional[str] = None
+    ) -> CreateServerInputs:
+        """Inputs of the server, validated as for `ewc infra create`.
+
+        With the federee, the default security groups are added as by `ewc infra create`.
+        """
+        return CreateServerInputs(
+            server_name=self.name,
+            keypair_name=keypair_name,
+            external_ip=self.external_ip,
+            is_gpu=self.is_gpu,
+            image_name=self.image,
+            flavour_name=self.flavour,
+            networks=self.networks,
+            security_groups=self.security_groups,
+            item_default_security_groups=ewc_hub_config.DEFAULT_SECURITY_GROUP_MAP.get(
+                federee
+            ),
+            extra_volume=self.extra_volumes,
+        )
+
+
+class FleetDNS(FleetResource):
+    server: str
+
+
+class FleetItem(FleetResource):
+    item: str
+    server: str
+    inputs: Dict[str, Any] = {}
+
+
+class FleetManifest(BaseModel):
+    servers: List[FleetServer] = []
+    dns: List[FleetDNS] = []
+    items: List[FleetItem] = []
+
+    def resources(self) -> Dict[str, FleetResource]:
+        """Resources of the manifest, by name."""
+        return {r.name: r for r in [*self.servers, *self.dns, *self.items]}
+
+    def kind(self, name: str) -> str:
+        """Kind of a resource: server, dns or item."""
+        resource = self.resources()[name]
+        return {FleetServer: "server", FleetDNS: "dns", FleetItem: "item"}[
+            type(resource)
+        ]
+
+    def dependencies(self) -> Dict[str, Tuple[str, ...]]:
+        """Dependencies of each resource, including the server of DNS records and items."""
+        dependencies = {}
+
+        for resource in self.resources().values():
+            server = getattr(resource, "server", None)
+            implicit = (server,) if server and server not in resource.depends_on else ()
+            dependencies[resource.name] = tuple(resource.depends_on) + implicit
+
+        return dependencies
+
+
+def load_fleet_manifest(path: Path, keypair_name: str) -> FleetManifest:
+    """Load and validate a fleet manifest.
+
+    Args:
+        path: path to the YAML manifest.
+        keypair_name: keypair of the servers, used to validate their inputs.
+
+    Returns:
+        the manifest.
+
+    Raises:
+        ValueError: if the manifest is invalid.
+    """
+    with open(path, "r") as manifest_file:
+        content = yaml.safe_load(manifest_file) or {}
+
+    if not isinstance(content, dict):
+        raise ValueError(f"{path} must contain a mapping with servers, dns and items.")
+
+    try:
+        manifest = FleetManifest(**content)
+
+        for server in manifest.servers:
+            server.server_inputs(keypair_name=keypair_name)
+
+    except ValidationError as e:
+        err = e.errors()[0]
+        loc = ".".join(str(x) for x in err["loc"])
+        raise ValueError(f"Invalid fleet manifest: {loc} → {err['msg']}")
+
+    names = [r.name for r in [*manifest.servers, *manifest.dns, *manifest.items]]
+    duplicates = sorted({name for name in names if names.count(name) > 1})
+    if duplicates:
+        raise ValueError(
+            f"Invalid fleet manifest: duplicated names {', '.join(duplicates)}"
+        )
+
+    server_names = {server.name for server in manifest.servers}
+    for resource in [*manifest.dns, *manifest.items]:
+        if resource.server not in server_names:
+            raise ValueError(
+                f"Invalid fleet manifest: {resource.name} refers to unknown server {resource.server}"
+            )
+
+    plan_fleet(manifest)
+
+    return manifest
+
+
+def plan_fleet(manifest: FleetManifest) -> List[List[str]]:
+    """Order the resources in stages, each stage only depending on the previous ones.
+
+    Resources of a stage are independent and applied concurrently.
+
+    Raises:
+        ValueError: on unknown dependencies or dependency cycles.
+    """
+    dependencies = {name: set(deps) for name, deps in manifest.dependencies().items()}
+
+    for name, deps in dependencies.items():
+        unknown = deps - set(dependencies)
+        if unknown:
+            raise ValueError(
+                f"Invalid fleet manifest: {name} depends on unknown {', '.join(sorted(unknown))}"
+            )
+
+    stages: List[List[str]] = []
+    planned: set = set()
+
+    while len(planned) < len(dependencies):
+        stage = [
+            name
+            for name, deps in dependencies.items()
+            if name not in planned and deps <= planned
+        ]
+        if not stage:
+            cycle = sorted(set(dependencies) - planned)
+            raise ValueError(
+                f"Invalid fleet manifest: dependency cycle between {', '.join(cycle)}"
+            )
+
+        stages.append(stage)
+        planned.update(stage)
+
+    return stages
+
+
+def show_fleet_plan(manifest: FleetManifest, stages: List[List[str]]):
+    """Print the plan of the fleet in a table."""
+    dependencies = manifest.dependencies()
+
+    table = Table(
+        show_header=True,
+        header_style="bold green",
+        title="[Dry Run] Fleet plan",
+        box=box.MINIMAL_DOUBLE_HEAD,
+    )
+
+    table.add_column("Stage", style="white")
+    table.add_column("Resource", style="cyan", no_wrap=True)
+    table.add_column("Kind", style="magenta")
+    table.add_column("Depends on", style="yellow")
+
+    for index, stage in enumerate(stages, start=1):
+        for name in stage:
+            table.add_row(
+                str(index), name, manifest.kind(name), ", ".join(dependencies[name])
+            )
+
+    console.print(table)
+
+
+def show_fleet_summary(manifest: FleetManifest, outcomes: Dict[str, TaskResult]):
+    """Print the outcome of each resource of the fleet in a table."""
+    table = Table(
+        show_header=True,
+        header_style="bold green",
+        title="Fleet summary",
+        box=box.MINIMAL_DOUBLE_HEAD,
+    )
+
+    table.add_column("Resource", style="cyan", no_wrap=True)
+    table.add_column("Kind", style="magenta")
+    table.add_column("Result", style="white")
+    table.add_column("Message", style="white")
+
+    styles = {
+        "created": "green",
+        "unchanged": "blue",
+        "done": "green",
+        "failed": "red",
+        "skipped": "yellow",
+    }
+
+    for name, outcome in outcomes.items():
+        if outcome.status == "done":
+            _, message, outputs = outcome.result
+            result = outputs.get("result", "done")
+        elif outcome.status == "failed":
+            result = "failed"
+            message = str(outcome.error) if outcome.error else outcome.result[1]
+        else:
+            result, message = "skipped", "A dependency failed."
+
+        table.add_row(
+            name,
+            manifest.kind(name),
+            f"[{styles[result]}]{result}[/{styles[result]}]",
+            message,
+        )
+
+    console.print(table)
+
+
+def apply_fleet(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    federee: str,
+    region: str,
+    tenancy_name: str,
+    manifest: FleetManifest,
+    keypair_name: str,
+    ssh_public_key_path: str,
+    ssh_private_key_path: str,
+    hub_items: Optional[dict] = None,
+    resolver: Optional[OpenstackResourceResolver] = None,
+    max_workers: Optional[int] = None,
+) -> Dict[str, TaskResult]:
+    """Apply a fleet manifest with a dependency graph.
+
+    Independent resources are applied concurrently, at most max_workers at a time.
+    Servers go through the pre deploy, deploy and post deploy phases of
+    `ewc infra create`, existing servers matching their inputs are left unchanged.
+    Resources depending on a failed resource are skipped.
+
+    Args:
+        openstack_backend: the Openstack backend.
+        openstack_api: the Openstack connection, shared by the resources.
+        federee: federee of the tenancy.
+        region: region of the tenancy.
+        tenancy_name: name of the tenancy, used for the DNS records.
+        manifest: the fleet manifest.
+        keypair_name: keypair of the servers.
+        ssh_public_key_path: path to the SSH public key of the keypair.
+        ssh_private_key_path: path to the SSH private key of the keypair.
+        hub_items: the hub catalog, required by items.
+        resolver: resolver shared by the servers.
+        max_workers: maximum number of resources applied concurrently.
+
+    Returns:
+        outcome of each resource, by name. The result of applied resources is
+        (status code, message, outputs).
+    """
+    resolver = resolver or openstack_backend.create_resolver(openstack_api)
+    boot_from_volume = region in [Region.R1.value, Region.R2.value]
+
+    # The keypair is shared by the servers, so it is set up once before they run concurrently
+    keypair_ready, keypair_message = setup_keypair(
+        openstack_backend=openstack_backend,
+        openstack_api=openstack_api,
+        keypair_name=keypair_name,
+        ssh_public_key_path=ssh_public_key_path,
+    )
+    if not keypair_ready:
+        raise ValueError(keypair_message)
+
+    servers: Dict[str, dict] = {}
+    item_locks: Dict[str, threading.Lock] = defaultdict(threading.Lock)
+
+    def apply_server(server: FleetServer):
+        server_inputs = server.server_inputs(
+            keypair_name=keypair_name, federee=federee
+        ).model_dump()
+
+        sc, message, pre_deploy_server_outputs = pre_deploy_server_setup(
+            openstack_backend=openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            region=region,
+            server_inputs=server_inputs,
+            ssh_public_key_path=ssh_public_key_path,
+            ssh_private_key_path=ssh_private_key_path,
+            resolver=resolver,
+        )
+        if sc != 0:
+            return sc, message, {}
+
+        if "networks" in pre_deploy_server_outputs:
+            server_inputs["networks"] = pre_deploy_server_outputs["networks"]
+        server_inputs["security_groups"] = pre_deploy_server_outputs["security_groups"]
+
+        outputs = {
+            "normalized_image_name": pre_deploy_server_outputs["normalized_image_name"]
+        }
+        existing_server_info = resolver.get_server(server.name)
+
+        if existing_server_info:
+            sc, message, _ = identify_server_reconfiguration(
+                openstack_api=openstack_api,
+                server_inputs=server_inputs,
+                pre_deploy_server_outputs=pre_deploy_server_outputs,
+                resolver=resolver,
+                openstack_backend=openstack_backend,
+            )
+            if sc != 0:
+                return sc, message, {}
+
+            sc, message, ip_outputs = resolve_machine_ip(
+                federee=federee, server_info=existing_server_info
+            )
+            if sc != 0 or not ip_outputs:
+                return 1, message, {}
+
+            outputs.update(ip_outputs, result="unchanged")
+            servers[server.name] = outputs
+            return 0, f"Server {server.name} already matches the manifest.", outputs
+
+        sc, message, deploy_server_outputs = deploy_server(
+            openstack_backend=openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            server_inputs=server_inputs,
+            pre_deploy_server_outputs=pre_deploy_server_outputs,
+            boot_from_volume=boot_from_volume,
+            resolver=resolver,
+            show_summary=False,
+        )
+        if sc != 0 or not deploy_server_outputs:
+            return 1, message, {}
+
+        sc, message, post_deploy_server_outputs = post_deploy_server_setup(
+            openstack_backend=openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            server_inputs=server_inputs,
+            server_info=deploy_server_outputs["server_info"],
+            resolver=resolver,
+        )
+        if sc != 0:
+            return sc, message, {}
+
+        outputs.update(
+            internal_ip_machine=post_deploy_server_outputs.get("internal_ip_machine"),
+            external_ip_machine=post_deploy_server_outputs.get("external_ip_machine"),
+            result="created",
+        )
+        servers[server.name] = outputs
+        return 0, f"Server {server.name} created.", outputs
+
+    def apply_dns(dns: FleetDNS):
+        external_ip_machine = servers[dns.server].get("external_ip_machine")
+        if not external_ip_machine:
+            return (
+                1,
+                f"DNS record of {dns.server} requires an external IP, set external_ip: true.",
+                {},
+            )
+
+        dns_record_name = build_dns_record_name(
+            server_name=dns.server,
+            tenancy_name=tenancy_name,
+            hosting_location=ewc_hub_config.FEDEREE_DNS_MAPPING[federee],
+        )
+        if not wait_for_dns_record(
+            dns_record_name=dns_record_name,
+            expected_ip=external_ip_machine,
+            timeout_minutes=ewc_hub_config.DNS_CHECK_TIMEOUT_MINUTES,
+        ):
+            return 1, f"{dns_record_name} not found in DNS records.", {}
+
+        return 0, f"{dns_record_name} resolves to {external_ip_machine}.", {}
+
+    def apply_item(item: FleetItem):
+        item_info = (hub_items or {}).get(item.item)
+        if not item_info:
+            return 1, f"{item.item} is not available in the EWC Hub.", {}
+
+        if not verify_item_is_deployable(item_info):
+            return 1, f"Item {item.item} is not deployable.", {}
+
+        _, annotations_technology = extract_annotations(
+            annotations=item_info.get("annotations")
+        )
+        if annotations_technology != [HubItemTechnologyAnnotation.ANSIBLE.value]:
+            return (
+                1,
+                f"EWC CLI can only apply {HubItemTechnologyAnnotation.ANSIBLE.value} items.",
+                {},
+            )
+
+        item_info_inputs = item_info.get(HubItemCLIKeys.ROOT.value, {}).get(
+            HubItemCLIKeys.INPUTS.value, []
+        )
+        required_item_inputs, default_item_inputs = split_item_inputs(item_info_inputs)
+
+        missing_keys = check_missing_required_inputs(
+            parsed_inputs=item.inputs, required_item_inputs=required_item_inputs
+        )
+        if missing_keys:
+            return 1, f"Missing inputs for {item.item}: {', '.join(missing_keys)}", {}
+
+        item_inputs = fill_default_item_inputs(
+            item_inputs=dict(item.inputs),
+            default_item_inputs=default_item_inputs,
+            federee=federee,
+            tenancy_name=tenancy_name,
+            openstack_api=openstack_api,
+            resolver=resolver,
+            openstack_backend=openstack_backend,
+        )
+
+        validation_message = validate_item_input_types(
+            parsed_inputs=item_inputs, item_info_inputs=item_info_inputs
+        )
+        if validation_message:
+            return 1, validation_message, {}
+
+        server = servers[item.server]
+
+        # Items sharing a hub item share its working directory, so they are run one at a time
+        with item_locks[item.item]:
+            sc, message, working_directory_path = prepare_item_working_directory(
+                item=item.item, item_info=item_info
+            )
+            if sc != 0:
+                return sc, message, {}
+
+            sc, message = run_item_playbook(
+                item=item.item,
+                item_info=item_info,
+                item_inputs=item_inputs,
+                server_name=item.server,
+                working_directory_path=working_directory_path,
+                normalized_image_name=server.get("normalized_image_name"),
+                ip_machine=server.get("external_ip_machine")
+                or server.get("internal_ip_machine"),
+                ssh_private_key_path=str(ssh_private_key_path),
+            )
+
+        return sc, message, {}
+
+    tasks = {}
+    for server in manifest.servers:
+        tasks[server.name] = lambda server=server: apply_server(server)
+    for dns in manifest.dns:
+        tasks[dns.name] = lambda dns=dns: apply_dns(dns)
+    for item in manifest.items:
+        tasks[item.name] = lambda item=item: apply_item(item)
+
+    return run_task_graph(
+        tasks,
+        dependencies=manifest.dependencies(),
+        succeeded=lambda result: result[0] == 0,
+        max_workers=max_workers,
+    )
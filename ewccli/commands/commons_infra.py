@@ -7,9 +7,11 @@
 
 """Common methods for commands using infrastructure."""
 
+import fnmatch
 import re
 import sys
-import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Optional, Tuple, Dict, List
 from pydantic import BaseModel, validator
@@ -20,17 +22,23 @@ from rich.table import Table
 from rich.panel import Panel
 from rich import box
 
+import openstack
 from click import ClickException
 from openstack import connection
 
 from ewccli.utils import save_encoded_ssh_keys, check_ssh_keys_match
 from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.concurrency import run_concurrently
+from ewccli.backends.openstack.image_families import ROCKY_GPU_NAME_PATTERN
+from ewccli.backends.openstack.image_families import ROCKY_NAME_PATTERN
+from ewccli.backends.openstack.image_families import UBUNTU_NAME_PATTERN
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.backends.openstack.waiters import wait_for_server_address
 from ewccli.enums import Federee, Region
 from ewccli.configuration import config as ewc_hub_config
 from ewccli.logger import get_logger
 
 _LOGGER = get_logger(__name__)
-_EWC_CLI_SLEEP_TIME = 30  # seconds
 
 console = Console()
 
@@ -202,7 +210,8 @@ def show_server_input_requested_summary(
     image_name: Optional[str] = None,
     flavour_name: Optional[str] = None,
     keypair_name: Optional[str] = None,
-    extra_volumes: Optional[tuple] = None
+    extra_volumes: Optional[tuple] = None,
+    replicas: Optional[List[str]] = None,
 ):
     """Print table with inputs for the server."""
     table = Table(
@@ -221,6 +230,9 @@ def show_server_input_requested_summary(
     if extra_volumes:
         table.add_row("Extra Volumes [GB]", ", ".join(str(v) for v in extra_volumes))
 
+    if replicas:
+        table.add_row("Replicas", "\n".join(replicas))
+
     console.print(table)
 
 
@@ -343,7 +355,7 @@ def normalize_os_image(
             return ewc_hub_config.EWC_CLI_OS_GPU_IMAGES_SITE_MAP[federee][region], True
 
         # 2. ECMWF GPU CASE: Rocky-9.6-GPU-<timestamp> → Rocky-9-GPU
-        m = re.match(r"^Rocky-(\d+)(?:\.\d+)?-GPU(?:-.+)?$", image_name)
+        m = ROCKY_GPU_NAME_PATTERN.match(image_name)
         if m:
             normalized = ewc_hub_config.EWC_CLI_OS_GPU_IMAGES_SITE_MAP[federee][region]
             return normalized, (normalized == value_original)
@@ -352,7 +364,7 @@ def normalize_os_image(
     # 3. Rocky standard normalization
     # Rocky-9.6-20251107141503 → Rocky-9
     # ----------------------------------------
-    m = re.match(r"^(Rocky)-(\d+)(?:\.\d+)?-\d{14}$", image_name, re.IGNORECASE)
+    m = ROCKY_NAME_PATTERN.match(image_name)
     if m:
         major = m.group(2)
         normalized = f"Rocky-{major}"
@@ -362,7 +374,7 @@ def normalize_os_image(
     # 4. Ubuntu standard normalization
     # Ubuntu-24.04-20251107 → Ubuntu-24.04
     # ----------------------------------------
-    m = re.match(r"^(Ubuntu-\d+\.\d+)-\d{14}$", image_name)
+    m = UBUNTU_NAME_PATTERN.match(image_name)
     if m:
         normalized = m.group(1)
         return normalized, (normalized == value_original)
@@ -379,6 +391,7 @@ def resolve_image_and_flavor(
     flavour_name: Optional[str] = None,
     image_name: Optional[str] = None,
     is_gpu: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
 ) -> Tuple[int, str, Dict[str, str]]:
     """
     Resolve both the image and flavor for the given federee.
@@ -390,6 +403,7 @@ def resolve_image_and_flavor(
         flavour_name (Optional[str]): Name of the desired flavor.
         image_name (Optional[str]): Name of the desired OS image.
         is_gpu (bool): Whether a GPU-enabled flavor is required.
+        resolver (Optional[OpenstackResourceResolver]): Resolver shared by the deployment steps.
 
     Returns:
         Tuple[int, str, Optional[Dict[str, str]]]:
@@ -515,7 +529,8 @@ def resolve_image_and_flavor(
             conn=conn,
             prefix=normalized_image_name,
             federee=federee,
-            region=region
+            region=region,
+            resolver=resolver or openstack_backend.create_resolver(conn),
         )
 
         # if users use long names, let's check if they are using the latest known image and give them a warning in case.
@@ -738,6 +753,130 @@ def list_server_details(
     console.print(table)
 
 
+def get_server_volumes(
+    openstack_api: connection.Connection,
+    server_name: str,
+    volume_ids: List[str],
+    include_foreign: bool = False,
+) -> Dict[str, openstack.block_storage.v3.volume.Volume]:
+    """Get the volumes attached to a server with one listing.
+
+    The volumes created by the ewccli for the server are listed at once, filtered
+    by their ewccli and server_name metadata, and joined with the attached volume IDs.
+
+    Args:
+        openstack_api: the Openstack connection.
+        server_name: name of the server the volumes are attached to.
+        volume_ids: IDs of the volumes attached to the server.
+        include_foreign: whether to fetch the attached volumes not created by
+            the ewccli for the server (e.g. the root disk) one by one.
+
+    Returns:
+        the volumes by ID, in the order of volume_ids.
+    """
+    if not volume_ids:
+        return {}
+
+    listed = {
+        vol.id: vol
+        for vol in openstack_api.block_storage.volumes(
+            details=True, metadata={"ewccli": "true", "server_name": server_name}
+        )
+    }
+    volumes = {}
+
+    for vol_id in volume_ids:
+        if vol_id in listed:
+            volumes[vol_id] = listed[vol_id]
+        elif include_foreign:
+            volumes[vol_id] = openstack_api.block_storage.get_volume(vol_id)
+
+    return volumes
+
+
+def select_servers(
+    servers: List[dict],
+    names: Tuple[str, ...] = (),
+    regex: bool = False,
+    selector: Optional[Dict[str, str]] = None,
+) -> Tuple[List[dict], List[str]]:
+    """Select servers by name, name pattern and metadata.
+
+    Names with glob wildcards (``*``, ``?``, ``[``) are shell patterns, e.g.
+    ``test-*``, and all names are regular expressions when ``regex`` is set.
+    Other names match a server name or ID exactly.
+
+    Args:
+        servers: servers listed from Openstack.
+        names: server names, IDs or patterns, any server matches if empty.
+        regex: whether the names are regular expressions.
+        selector: metadata the servers must have, e.g. {"deployed": "ewccli"}.
+
+    Returns:
+        the selected servers, in listing order, and the names matching no server.
+
+    Raises:
+        re.error: if a name is not a valid regular expression.
+    """
+
+    def matcher(name: str):
+        if regex:
+            pattern = re.compile(name)
+            return lambda server: bool(pattern.fullmatch(server.get("name") or ""))
+
+        if any(wildcard in name for wildcard in "*?["):
+            return lambda server: fnmatch.fnmatchcase(server.get("name") or "", name)
+
+        return lambda server: name in (server.get("name"), server.get("id"))
+
+    matchers = {name: matcher(name) for name in names}
+    unmatched = set(names)
+    selected = []
+
+    for server in servers:
+        metadata = server.get("metadata") or {}
+
+        if any(metadata.get(key) != value for key, value in (selector or {}).items()):
+            continue
+
+        matched = [name for name, match in matchers.items() if match(server)]
+        unmatched.difference_update(matched)
+
+        if matched or not names:
+            selected.append(server)
+
+    return selected, [name for name in names if name in unmatched]
+
+
+def setup_keypair(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    keypair_name: str,
+    ssh_public_key_path: str,
+    force: bool = False,
+) -> Tuple[bool, str]:
+    """Get or create the keypair, deleting the existing one first with force.
+
+    Returns:
+        Tuple[bool, str]: whether the keypair is ready and the message.
+    """
+    if force:
+        _LOGGER.info("Force enabled, keypair will be deleted first if existing.")
+        keypair_status, key_pair_message = openstack_backend.delete_keypair(
+            conn=openstack_api, keypair_name=keypair_name
+        )
+        if not keypair_status[0]:
+            return False, key_pair_message
+
+    keypair_status, key_pair_message = openstack_backend.create_keypair(
+        conn=openstack_api,
+        keypair_name=keypair_name,
+        public_key_path=Path(ssh_public_key_path),
+    )
+
+    return bool(keypair_status[0]), key_pair_message
+
+
 def pre_deploy_server_setup(
     openstack_backend: OpenstackBackend,
     openstack_api: connection.Connection,
@@ -749,7 +888,8 @@ def pre_deploy_server_setup(
     ssh_private_encoded: Optional[str] = None,
     ssh_public_encoded: Optional[str] = None,
     dry_run: bool = False,
-    force: bool = False,       
+    force: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
 ):
     """Pre deploy server setup steps:
 
@@ -758,16 +898,13 @@ def pre_deploy_server_setup(
         - select correct network
         - verify all inputs for the resources are valid
         - get or create keypair
-    
+
+    Openstack lookups go through the resolver, so each resource is only requested once.
+    The keypair is set up in background while the inputs are checked.
     """
     outputs: dict[str, Optional[str]] = {}
 
     keypair_name: str = server_inputs["keypair_name"]
-    is_gpu: bool = server_inputs["is_gpu"]
-    image_name: Optional[str] = server_inputs["image_name"]
-    flavour_name: Optional[str] = server_inputs["flavour_name"]
-    security_groups: Optional[tuple] = server_inputs["security_groups"]
-    item_default_security_groups: Optional[tuple] = server_inputs["item_default_security_groups"]
 
     if dry_run:
         return 0, "[Dry Run] skipping pre deploy server setup...", outputs
@@ -813,6 +950,74 @@ def pre_deploy_server_setup(
 
     if not keys_exist:
         return 1, f"\n[Pre deploy server setup] Exiting.", outputs
+
+    resolver = resolver or openstack_backend.create_resolver(openstack_api)
+
+    with ThreadPoolExecutor(
+        max_workers=1, thread_name_prefix="ewccli-keypair"
+    ) as executor:
+        keypair_future = executor.submit(
+            setup_keypair,
+            openstack_backend=openstack_backend,
+            openstack_api=openstack_api,
+            keypair_name=keypair_name,
+            ssh_public_key_path=ssh_public_key_path,
+            force=force,
+        )
+        sc, message = _check_pre_deploy_server_inputs(
+            openstack_backend=openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            region=region,
+            server_inputs=server_inputs,
+            outputs=outputs,
+            resolver=resolver,
+        )
+
+    if sc != 0:
+        return 1, f"[Pre deploy server setup] {message}", outputs
+
+    #################################################################################
+    # Get or Create keypair
+    #################################################################################
+    try:
+        keypair_ready, key_pair_message = keypair_future.result()
+    except Exception as e:
+        return (
+            1,
+            f"[Pre deploy server setup] Could not set up keypair {keypair_name} due to {e}",
+            outputs,
+        )
+
+    if not keypair_ready:
+        return 1, f"[Pre deploy server setup] {key_pair_message}", outputs
+
+    _LOGGER.info(key_pair_message)
+
+    return 0, f"Pre deploy server setup finished successfully.", outputs
+
+
+def _check_pre_deploy_server_inputs(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    federee: str,
+    region: str,
+    server_inputs: CreateServerInputs,
+    outputs: dict,
+    resolver: OpenstackResourceResolver,
+) -> Tuple[int, str]:
+    """Select the image, flavour, networks and security groups, and check them on Openstack.
+
+    The selected values are added to the outputs.
+    """
+    is_gpu: bool = server_inputs["is_gpu"]
+    image_name: Optional[str] = server_inputs["image_name"]
+    flavour_name: Optional[str] = server_inputs["flavour_name"]
+    security_groups: Optional[tuple] = server_inputs["security_groups"]
+    item_default_security_groups: Optional[tuple] = server_inputs[
+        "item_default_security_groups"
+    ]
+
     ##################################################################################
     # Flavour and Image
     ##################################################################################
@@ -823,10 +1028,11 @@ def pre_deploy_server_setup(
         region=region,
         flavour_name=flavour_name,
         image_name=image_name,
-        is_gpu=is_gpu
+        is_gpu=is_gpu,
+        resolver=resolver,
     )
     if sc != 0 or not resolved_info:
-        return 1, f"[Pre deploy server setup] {resolve_message}", outputs
+        return 1, resolve_message
 
     # This image name can be short name or long name
     resolved_image_name: str = resolved_info["image_name"]
@@ -853,7 +1059,7 @@ def pre_deploy_server_setup(
     if not networks:
         default_network = ewc_hub_config.DEFAULT_NETWORK_MAP.get(federee)
         if federee == Federee.ECMWF.value:
-            networks_identified = [n.name for n in openstack_api.list_networks()]
+            networks_identified = [n.name for n in resolver.networks()]
             networks = tuple([n for n in networks_identified if default_network in n])
         else:
             networks = tuple([default_network])
@@ -880,50 +1086,31 @@ def pre_deploy_server_setup(
             flavour_name=resolved_flavour_name,
             networks=networks,
             security_groups=security_groups,
+            resolver=resolver,
         )
 
         if not is_valid:
             return (
                 1,
-                f"[Pre deploy server setup] Server creation inputs are not valid: {message}. Please check the input parameters and try again.",
-                outputs,
+                f"Server creation inputs are not valid: {message}. Please check the input parameters and try again.",
             )
     except Exception as e:
-        return 1, f"[Pre deploy server setup] Could not check inputs from Openstack due to {e}", outputs
+        return 1, f"Could not check inputs from Openstack due to {e}"
 
-    #################################################################################
-    # Get or Create keypair
-    #################################################################################
-    key_pair_message = ""
-
-    if force:
-        _LOGGER.info("Force enabled, keypair will be deleted first if existing.")
-        keypair_status, key_pair_message = openstack_backend.delete_keypair(
-            conn=openstack_api, keypair_name=keypair_name
-        )
-        if not keypair_status[0]:
-            return 1, f"[Pre deploy server setup] {message}", outputs
-
-    keypair_status, key_pair_message = openstack_backend.create_keypair(
-        conn=openstack_api,
-        keypair_name=keypair_name,
-        public_key_path=Path(ssh_public_key_path),
-    )
-
-    if not keypair_status[0]:
-        return 1, f"[Pre deploy server setup] {key_pair_message}", outputs
-    else:
-        _LOGGER.info(key_pair_message)
-
-    return 0, f"Pre deploy server setup finished successfully.", outputs
+    return 0, ""
 
 
 def identify_server_reconfiguration(
     openstack_api: connection.Connection,
     server_inputs: dict,
-    pre_deploy_server_outputs: dict
+    pre_deploy_server_outputs: dict,
+    resolver: Optional[OpenstackResourceResolver] = None,
+    openstack_backend: Optional[OpenstackBackend] = None,
 ):
-    """Identify resources to be reconfigured."""
+    """Identify resources to be reconfigured.
+
+    Without a resolver, the one of the backend is used, sharing the topology cache.
+    """
     outputs: dict[str, Optional[str]] = {}
 
     server_name: str = server_inputs["server_name"]
@@ -934,9 +1121,16 @@ def identify_server_reconfiguration(
     networks: Optional[tuple] = server_inputs["networks"]
     security_groups: Optional[tuple] = server_inputs["security_groups"]
 
+    if not resolver:
+        resolver = (
+            openstack_backend.create_resolver(openstack_api)
+            if openstack_backend
+            else OpenstackResourceResolver(openstack_api)
+        )
+
     # Retrive machine if exists
     try:
-        existing_server_info = openstack_api.get_server(name_or_id=server_name)
+        existing_server_info = resolver.get_server(server_name)
     except Exception as e:
         return (
             1,
@@ -983,9 +1177,7 @@ def identify_server_reconfiguration(
 
     try:
         # Fetch image name from the image ID
-        image = openstack_api.compute.find_image(
-            getattr(existing_server_info.image, "id", None)
-        )
+        image = resolver.find_image(getattr(existing_server_info.image, "id", None))
         server_info_image = image.name if image else None
     except Exception as e:
         return (
@@ -1037,8 +1229,14 @@ def deploy_server(
     boot_from_volume: bool = False,
     dry_run: bool = False,
     force: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
+    show_summary: bool = True,
 ):
-    """Deploy Server in Openstack."""
+    """Deploy Server in Openstack.
+
+    show_summary disables the inputs and server tables, e.g. when replicas
+    are deployed concurrently and summarised together.
+    """
     outputs: dict[str, Optional[str]] = {}
 
     if dry_run:
@@ -1054,14 +1252,17 @@ def deploy_server(
 
     _LOGGER.info(f"Deploy server {server_name} starting...")
 
-    show_server_input_requested_summary(
-        image_name=resolved_image_name,
-        flavour_name=resolved_flavour_name,
-        networks=networks,
-        security_groups=security_groups,
-        keypair_name=keypair_name,
-        extra_volumes=extra_volumes
-    )
+    resolver = resolver or openstack_backend.create_resolver(openstack_api)
+
+    if show_summary:
+        show_server_input_requested_summary(
+            image_name=resolved_image_name,
+            flavour_name=resolved_flavour_name,
+            networks=networks,
+            security_groups=security_groups,
+            keypair_name=keypair_name,
+            extra_volumes=extra_volumes,
+        )
 
     #################################################################################
     # Get or Create Server
@@ -1077,8 +1278,6 @@ def deploy_server(
         else:
             _LOGGER.info(delete_server_message)
 
-        time.sleep(_EWC_CLI_SLEEP_TIME)
-
     _LOGGER.info("[Deploy server] Requesting server from Openstack...")
 
     openstack_server_status, create_server_message, server_info = (
@@ -1090,7 +1289,8 @@ def deploy_server(
             networks=networks,
             sec_groups=security_groups,
             keypair_name=keypair_name,
-            boot_from_volume=boot_from_volume
+            boot_from_volume=boot_from_volume,
+            resolver=resolver,
         )
     )
     if not openstack_server_status[0]:
@@ -1110,7 +1310,7 @@ def deploy_server(
 
     try:
         # Fetch image name from the image ID
-        image = openstack_api.compute.find_image(image_id)
+        image = resolver.find_image(image_id)
         image_name_used = image.name if image else "Unknown"
     except Exception as e:
         return 1, f"[Deploy server] Could not retrieve image due to {e}", outputs
@@ -1121,7 +1321,8 @@ def deploy_server(
         image_name=image_name_used,
     )
 
-    list_server_details(vm_info)
+    if show_summary:
+        list_server_details(vm_info)
 
     outputs = {
         "server_info": server_info,
@@ -1137,6 +1338,7 @@ def post_deploy_server_setup(
     server_inputs: dict,
     server_info: dict,
     dry_run: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
 ):
     """Post deploy server setup steps:
 
@@ -1175,11 +1377,17 @@ def post_deploy_server_setup(
     external_ip_machine = resolve_ip_outputs.get("external_ip_machine") if resolve_ip_outputs else None
 
     # Add external IP if requested and not already present
+    floating_ip = None
+
     if external_ip and not external_ip_machine:
-        openstack_floatingip_status, message, _ = openstack_backend.add_external_ip(
-            conn=openstack_api, server=server_info, federee=federee
+        openstack_floatingip_status, message, floating_ip = (
+            openstack_backend.add_external_ip(
+                conn=openstack_api,
+                server=server_info,
+                federee=federee,
+                resolver=resolver,
+            )
         )
-        time.sleep(_EWC_CLI_SLEEP_TIME - 15)
 
         if not openstack_floatingip_status[0]:
             return 1, message, outputs
@@ -1187,7 +1395,18 @@ def post_deploy_server_setup(
             _LOGGER.info(message)
 
     # Get info of the server again, because the object changed.
-    server_info = openstack_api.get_server(name_or_id=server_name)
+    if getattr(floating_ip, "floating_ip_address", None):
+        try:
+            server_info = wait_for_server_address(
+                openstack_api,
+                server_id=server_info.get("id"),
+                address=floating_ip.floating_ip_address,
+            )
+        except openstack.exceptions.ResourceTimeout as e:
+            return 1, f"[Post deploy server setup] {e}", outputs
+    else:
+        # The server exists, fetch it by ID
+        server_info = openstack_api.compute.get_server(server_info.get("id"))
 
     sc_resolve_ip, resolve_ip_message, resolve_ip_outputs = resolve_machine_ip(
         federee=federee, server_info=server_info
@@ -1221,6 +1440,7 @@ def post_deploy_server_setup(
     ############################################################
 
     extra_volume_sizes = server_inputs.get("extra_volume", None)
+    created_volumes: list = []
 
     if extra_volume_sizes:
         _LOGGER.info(f"Post deploy: creating and attaching extra volumes: {extra_volume_sizes}")
@@ -1231,8 +1451,6 @@ def post_deploy_server_setup(
             base_name=server_name,
             volume_sizes=tuple(extra_volume_sizes),
             volume_type=None,        # <── default volume type TODO: Add volume type performance
-            attempts=2,
-            retry_delay_s=30,
             wait_time_s=600,
             dry_run=dry_run,
             metadata={"ewccli": "true"},
@@ -1248,8 +1466,6 @@ def post_deploy_server_setup(
             conn=openstack_api,
             server_id=server_info.id,
             volumes=created_volumes,
-            attempts=2,
-            retry_delay_s=30,
             wait_time_s=600,
             dry_run=dry_run,
         )
@@ -1261,6 +1477,14 @@ def post_deploy_server_setup(
 
         outputs["attached_volumes"] = [v.id for v in created_volumes]
 
+    # The inventory lists the server right away, without waiting for a refresh
+    openstack_backend.record_server(
+        conn=openstack_api,
+        server=server_info,
+        federee=federee,
+        volumes=tuple(created_volumes),
+    )
+
     return 0, "Post deploy server setup finished successfully", outputs
 
 
@@ -1275,13 +1499,20 @@ def create_server_command(
     ssh_private_encoded: Optional[str] = None,
     ssh_public_encoded: Optional[str] = None,
     dry_run: bool = False,
-    force: bool = False, 
+    force: bool = False,
+    refresh_cache: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
 ):
     """Create Server command."""
     # Accept both dict and Pydantic model
     if hasattr(server_inputs, "model_dump"):
         server_inputs = server_inputs.model_dump()
 
+    # Shared by all the steps, so images, flavours, networks and security groups are looked up once
+    resolver = resolver or openstack_backend.create_resolver(
+        openstack_api, refresh_cache=refresh_cache
+    )
+
 
     #### PRE DEPLOY SERVER ACTION
     os_status_code, os_message, pre_deploy_server_outputs = pre_deploy_server_setup(
@@ -1295,7 +1526,8 @@ def create_server_command(
         ssh_public_key_path=ssh_public_key_path,
         ssh_private_key_path=ssh_private_key_path,
         dry_run=dry_run,
-        force=force,  
+        force=force,
+        resolver=resolver,
     )
 
     boot_from_volume = False
@@ -1320,7 +1552,9 @@ def create_server_command(
         sr_status_code, sr_message, _ = identify_server_reconfiguration(
             openstack_api=openstack_api,
             server_inputs=server_inputs,
-            pre_deploy_server_outputs=pre_deploy_server_outputs  
+            pre_deploy_server_outputs=pre_deploy_server_outputs,
+            resolver=resolver,
+            openstack_backend=openstack_backend,
         )
         if sr_status_code != 0:
             console.print(
@@ -1343,6 +1577,7 @@ def create_server_command(
         boot_from_volume=boot_from_volume,
         dry_run=dry_run,
         force=force,
+        resolver=resolver,
     )
 
     if not deploy_server_outputs:
@@ -1358,6 +1593,7 @@ def create_server_command(
         server_inputs=server_inputs,
         server_info=deploy_server_outputs["server_info"],
         dry_run=dry_run,
+        resolver=resolver,
     )
 
     internal_ip_machine = post_deploy_server_outputs["internal_ip_machine"]
@@ -1370,3 +1606,183 @@ def create_server_command(
     }
 
     return os_status_code, os_message, outputs
+
+
+def replica_names(server_name: str, count: int) -> List[str]:
+    """Names of the replicas of a server: SERVER_NAME-1 to SERVER_NAME-N."""
+    return [f"{server_name}-{index}" for index in range(1, count + 1)]
+
+
+def list_replicas_table(replicas: Dict[str, dict]):
+    """List the replicas in a table with their status and IPs."""
+    table = Table(
+        show_header=True,
+        header_style="bold green",
+        title="Openstack Server Replicas",
+        box=box.MINIMAL_DOUBLE_HEAD,
+    )
+
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Status", style="magenta")
+    table.add_column("Internal IP", style="yellow")
+    table.add_column("External IP", style="yellow")
+    table.add_column("Message", style="white")
+
+    for name, replica in replicas.items():
+        failed = replica["status_code"] != 0
+        table.add_row(
+            name,
+            "[red]failed[/red]" if failed else "[green]deployed[/green]",
+            str(replica.get("internal_ip_machine") or ""),
+            str(replica.get("external_ip_machine") or ""),
+            replica["message"] if failed else "",
+        )
+
+    console.print(table)
+
+
+def create_servers_command(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    federee: str,
+    region: str,
+    server_inputs: CreateServerInputs,
+    count: int,
+    ssh_public_key_path: str,
+    ssh_private_key_path: str,
+    ssh_private_encoded: Optional[str] = None,
+    ssh_public_encoded: Optional[str] = None,
+    dry_run: bool = False,
+    force: bool = False,
+    refresh_cache: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
+    max_workers: Optional[int] = None,
+):
+    """Create replicas of a server, named SERVER_NAME-1 to SERVER_NAME-N.
+
+    The inputs are checked and the keypair set up once. The replicas are then
+    created, waited for and set up (floating IP, volumes) concurrently, each one
+    retrying its own creation with the create_server retry policy.
+
+    Returns:
+        status code, message and the outputs of each replica, by name.
+    """
+    # Accept both dict and Pydantic model
+    if hasattr(server_inputs, "model_dump"):
+        server_inputs = server_inputs.model_dump()
+
+    names = replica_names(server_inputs["server_name"], count)
+    resolver = resolver or openstack_backend.create_resolver(
+        openstack_api, refresh_cache=refresh_cache
+    )
+
+    #### PRE DEPLOY SERVER ACTION, shared by the replicas
+    os_status_code, os_message, pre_deploy_server_outputs = pre_deploy_server_setup(
+        openstack_backend=openstack_backend,
+        openstack_api=openstack_api,
+        federee=federee,
+        region=region,
+        server_inputs=server_inputs,
+        ssh_private_encoded=ssh_private_encoded,
+        ssh_public_encoded=ssh_public_encoded,
+        ssh_public_key_path=ssh_public_key_path,
+        ssh_private_key_path=ssh_private_key_path,
+        dry_run=dry_run,
+        force=force,
+        resolver=resolver,
+    )
+
+    if dry_run:
+        return 0, f"[Dry Run] skipping creation of replicas {', '.join(names)}...", {}
+
+    if os_status_code != 0 or not pre_deploy_server_outputs:
+        return 1, os_message, {}
+
+    if "networks" in pre_deploy_server_outputs:
+        server_inputs["networks"] = pre_deploy_server_outputs["networks"]
+
+    server_inputs["security_groups"] = pre_deploy_server_outputs["security_groups"]
+    server_inputs["normalized_image_name"] = pre_deploy_server_outputs[
+        "normalized_image_name"
+    ]
+
+    show_server_input_requested_summary(
+        image_name=pre_deploy_server_outputs["resolved_image_name"],
+        flavour_name=pre_deploy_server_outputs["resolved_flavour_name"],
+        networks=server_inputs["networks"],
+        security_groups=server_inputs["security_groups"],
+        keypair_name=server_inputs["keypair_name"],
+        extra_volumes=server_inputs["extra_volume"],
+        replicas=names,
+    )
+
+    boot_from_volume = region in [Region.R1.value, Region.R2.value]
+
+    def create_replica(name: str) -> dict:
+        replica_inputs = dict(server_inputs, server_name=name)
+
+        try:
+            if not force:
+                sc, message, _ = identify_server_reconfiguration(
+                    openstack_api=openstack_api,
+                    server_inputs=replica_inputs,
+                    pre_deploy_server_outputs=pre_deploy_server_outputs,
+                    resolver=resolver,
+                    openstack_backend=openstack_backend,
+                )
+                if sc != 0:
+                    return {"status_code": sc, "message": message}
+
+            sc, message, deploy_server_outputs = deploy_server(
+                openstack_backend=openstack_backend,
+                openstack_api=openstack_api,
+                federee=federee,
+                server_inputs=replica_inputs,
+                pre_deploy_server_outputs=pre_deploy_server_outputs,
+                boot_from_volume=boot_from_volume,
+                force=force,
+                resolver=resolver,
+                show_summary=False,
+            )
+            if sc != 0 or not deploy_server_outputs:
+                return {"status_code": 1, "message": message}
+
+            sc, message, post_deploy_server_outputs = post_deploy_server_setup(
+                openstack_backend=openstack_backend,
+                openstack_api=openstack_api,
+                federee=federee,
+                server_inputs=replica_inputs,
+                server_info=deploy_server_outputs["server_info"],
+                resolver=resolver,
+            )
+        except Exception as e:
+            _LOGGER.error(f"Could not create replica {name}: {e}")
+            return {"status_code": 1, "message": str(e)}
+
+        return {
+            "status_code": sc,
+            "message": message,
+            "internal_ip_machine": post_deploy_server_outputs.get(
+                "internal_ip_machine"
+            ),
+            "external_ip_machine": post_deploy_server_outputs.get(
+                "external_ip_machine"
+            ),
+        }
+
+    _LOGGER.info(f"Creating {count} replicas of {server_inputs['server_name']}...")
+
+    replicas = run_concurrently(
+        {name: partial(create_replica, name) for name in names},
+        max_workers=max_workers,
+    )
+
+    failed = [name for name, replica in replicas.items() if replica["status_code"] != 0]
+    if failed:
+        return (
+            1,
+            f"Could not create {len(failed)} of {count} replicas: {', '.join(failed)}",
+            replicas,
+        )
+
+    return 0, f"{count} replicas created successfully.", replicas
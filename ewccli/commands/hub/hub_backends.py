@@ -9,6 +9,7 @@
 """CLI EWC Hub: EWC Hub interaction items specific methods."""
 
 import shutil
+import socket
 import sys
 import json
 import time
@@ -19,6 +20,9 @@ import requests
 from openstack import connection
 
 from ewccli.configuration import config as ewc_hub_config
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.backends.openstack.waiters import wait_for
 from ewccli.utils import run_command_from_host
 from ewccli.enums import Federee
 from ewccli.backends.ansible.backend_ansible import AnsibleBackend
@@ -51,6 +55,8 @@ def get_hub_item_env_variable_value(
     tenancy_name: str,
     variable_name: str,
     openstack_api: Optional[connection.Connection] = None,
+    resolver: Optional[OpenstackResourceResolver] = None,
+    openstack_backend: Optional[OpenstackBackend] = None,
 ) -> str:
     """
     Retrieve the value of a HUB_ENV_VARIABLES_MAP variable for a given federee.
@@ -64,6 +70,8 @@ def get_hub_item_env_variable_value(
         federee (str): The federee key (e.g., Federee.ECMWF.value, Federee.EUMETSAT.value).
         tenancy_name (str): tenancy_name from config file created with ewc login.
         variable_name (str): The variable name to retrieve from HUB_ENV_VARIABLES_MAP.
+        resolver: Resolver of the Openstack resources, to reuse the cached networks and subnets.
+        openstack_backend: Backend creating the resolver when missing, with the topology cache.
 
     Returns:
         Any: The resolved value (string, list, etc.).
@@ -75,14 +83,22 @@ def get_hub_item_env_variable_value(
     os_network_name = "private"
     os_subnetwork_name = "private-subnet"
 
+    if not resolver and openstack_api:
+        resolver = (
+            openstack_backend.create_resolver(openstack_api)
+            if openstack_backend
+            else OpenstackResourceResolver(openstack_api)
+        )
+
     # --- Handle dynamic lookups ---
     if variable_name == "os_network_name" and federee == Federee.ECMWF.value:
-        if openstack_api:
-            networks = list(openstack_api.network.networks())
-            for net in networks:
-                if "private" in net.name.lower():
-                    os_network_name = net.name
-            raise ValueError("No network containing 'private' found.")
+        if resolver:
+            private_networks = [
+                net for net in resolver.networks() if "private" in net.name.lower()
+            ]
+            if not private_networks:
+                raise ValueError("No network containing 'private' found.")
+            os_network_name = private_networks[-1].name
 
     hub_item_env_variables_map["os_network_name"] = {
         Federee.ECMWF.value: os_network_name,
@@ -90,14 +106,16 @@ def get_hub_item_env_variable_value(
     }
 
     if variable_name == "os_subnet_name" and federee == Federee.ECMWF.value:
-        if openstack_api:
-            networks = list(openstack_api.network.networks())
-            for net in networks:
-                if "private" in net.name.lower():
-                    subnets = list(openstack_api.network.subnets(network_id=net.id))
-                    if subnets:
-                        os_subnetwork_name = subnets[0].name
-            raise ValueError("No subnet found for network containing 'private'.")
+        if resolver:
+            private_subnets = [
+                resolver.subnets(network_id=net.id)
+                for net in resolver.networks()
+                if "private" in net.name.lower()
+            ]
+            private_subnets = [subnets for subnets in private_subnets if subnets]
+            if not private_subnets:
+                raise ValueError("No subnet found for network containing 'private'.")
+            os_subnetwork_name = private_subnets[-1][0].name
 
     hub_item_env_variables_map["os_subnet_name"] = {
         Federee.ECMWF.value: os_subnetwork_name,
@@ -214,6 +232,34 @@ def git_clone_item(
     return return_code, message
 
 
+def wait_for_ssh(host: str, port: int = 22, timeout_s: float = 300) -> bool:
+    """Wait until the SSH port of the machine accepts connections.
+
+    Args:
+        host: IP address of the machine.
+        port: SSH port.
+        timeout_s: seconds after which the wait fails.
+
+    Returns:
+        bool: True once the port is reachable, False after the timeout.
+    """
+
+    def is_reachable() -> bool:
+        try:
+            with socket.create_connection((host, port), timeout=5):
+                return True
+        except OSError:
+            return False
+
+    try:
+        return wait_for(
+            is_reachable, description=f"SSH on {host}:{port}", timeout_s=timeout_s
+        )
+    except TimeoutError as e:
+        _LOGGER.warning(str(e))
+        return False
+
+
 def run_ansible_item(
     item: str,
     item_inputs: Optional[dict],
@@ -280,8 +326,9 @@ def run_ansible_item(
     _LOGGER.info(f"Deploying Ansible Playbook item {item}...")
     _LOGGER.info("⏳ This could take a few minutes, grab a beverage meanwhile...")
 
-    # Sleep some time to wait to start.
-    time.sleep(15)
+    # Wait for the machine to accept SSH connections.
+    if ip_machine:
+        wait_for_ssh(host=ip_machine)
 
     if item_inputs:
         extra_vars = json.dumps(item_inputs)
@@ -0,0 +1,283 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""CLI EWC Hub: compiled cache of the EWC Hub catalogue."""
+
+import hashlib
+import os
+import pickle  # nosec B403 - only loads files written by ewccli in the private cache dir
+from collections.abc import Mapping
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+import yaml
+
+from ewccli.configuration import config as ewc_hub_config
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Bump when the layout of the compiled catalogue changes
+_CATALOG_CACHE_VERSION = 1
+
+# libyaml based loader is an order of magnitude faster than the pure Python one
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+class HubItemsCatalog(Mapping):
+    """Read-only mapping of EWC Hub items backed by the compiled catalogue.
+
+    Only the per-item index is loaded upfront, each item is deserialised on first access.
+    """
+
+    def __init__(
+        self,
+        index: Dict[str, Tuple[int, int]],
+        data_path: Optional[Path] = None,
+        version: Optional[str] = None,
+        items: Optional[dict] = None,
+        index_path: Optional[Path] = None,
+    ):
+        """
+        Initialize the catalogue.
+
+        :param index: item name to (offset, length) in the data file.
+        :param data_path: compiled catalogue data file.
+        :param version: sha256 of the catalogue source file.
+        :param items: already materialised items.
+        :param index_path: compiled catalogue index file, other caches are stored next to it.
+        """
+        self._index = index
+        self._data_path = data_path
+        self._items = dict(items or {})
+        self._data: Optional[bytes] = None
+        self.version = version
+        self.index_path = index_path
+
+    @classmethod
+    def from_items(
+        cls,
+        items: dict,
+        version: Optional[str] = None,
+        index_path: Optional[Path] = None,
+    ):
+        """Create a catalogue from items already in memory."""
+        return cls(
+            index={name: (0, 0) for name in items},
+            version=version,
+            items=items,
+            index_path=index_path,
+        )
+
+    def _read(self, offset: int, length: int) -> bytes:
+        if self._data is not None:
+            return self._data[offset : offset + length]
+
+        with open(self._data_path, "rb") as f:
+            f.seek(offset)
+            return f.read(length)
+
+    def __getitem__(self, name: str) -> dict:
+        if name not in self._items:
+            offset, length = self._index[name]
+            self._items[name] = pickle.loads(self._read(offset, length))  # nosec B301
+
+        return self._items[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._index)
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __contains__(self, name) -> bool:
+        return name in self._index
+
+    def items(self):
+        """Return all items, reading the data file once."""
+        if (
+            self._data is None
+            and self._data_path
+            and len(self._items) < len(self._index)
+        ):
+            self._data = self._data_path.read_bytes()
+
+        return super().items()
+
+
+def parse_hub_items(path_to_catalog: Path) -> dict:
+    """Parse EWC Hub items from the catalogue YAML file.
+
+    :param path_to_catalog: catalogue YAML file.
+    :return: items by name.
+    :raises ValueError: if the catalogue is malformed.
+    """
+    with open(path_to_catalog, "rb") as file:
+        items_file = yaml.load(file, Loader=_YAML_LOADER)  # nosec B506 - safe loader
+
+    if not items_file:
+        raise ValueError("items.yaml is empty.")
+
+    items_spec = items_file.get("spec")
+
+    if not items_spec:
+        raise ValueError("spec key is missing from items.yaml.")
+
+    items = items_spec.get("items")
+
+    if not items:
+        raise ValueError("items key is missing from spec key in items.yaml.")
+
+    return items
+
+
+def _file_sha256(path: Path) -> str:
+    """Return the sha256 of a file."""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def _catalog_cache_index_path(path_to_catalog: Path) -> Path:
+    """Return the index file of the compiled catalogue for a catalogue file."""
+    source_key = hashlib.sha256(
+        str(Path(path_to_catalog).expanduser().resolve()).encode("utf-8")
+    ).hexdigest()[:16]
+
+    return ewc_hub_config.EWC_CLI_CACHE_PATH / "hub" / f"{source_key}.index"
+
+
+def write_private_file(path: Path, content: bytes) -> None:
+    """Atomically write a file readable only by the current user."""
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    file_descriptor = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(file_descriptor, "wb") as f:
+        f.write(content)
+    os.replace(tmp_path, path)
+
+
+def _load_catalog_index(index_path: Path) -> Optional[dict]:
+    """Load the index of the compiled catalogue if present and compatible."""
+    try:
+        with open(index_path, "rb") as f:
+            catalog_index = pickle.load(f)  # nosec B301
+    except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+        return None
+
+    if (
+        not isinstance(catalog_index, dict)
+        or catalog_index.get("version") != _CATALOG_CACHE_VERSION
+    ):
+        return None
+
+    return catalog_index
+
+
+def _build_catalog_cache(
+    path_to_catalog: Path,
+    index_path: Path,
+    source_stat: os.stat_result,
+    source_hash: str,
+) -> HubItemsCatalog:
+    """Parse the catalogue and write its compiled representation."""
+    items = parse_hub_items(path_to_catalog)
+
+    data = bytearray()
+    index = {}
+    for name, item in items.items():
+        item_data = pickle.dumps(item, protocol=pickle.HIGHEST_PROTOCOL)
+        index[name] = (len(data), len(item_data))
+        data += item_data
+
+    # The data file is versioned by the source hash so readers of a previous index never mix files
+    data_path = index_path.with_name(f"{index_path.stem}.{source_hash[:16]}.data")
+
+    try:
+        index_path.parent.mkdir(mode=0o700, parents=True, exist_ok=True)
+        write_private_file(data_path, bytes(data))
+        write_private_file(
+            index_path,
+            pickle.dumps(
+                {
+                    "version": _CATALOG_CACHE_VERSION,
+                    "source": str(path_to_catalog),
+                    "mtime_ns": source_stat.st_mtime_ns,
+                    "size": source_stat.st_size,
+                    "sha256": source_hash,
+                    "data": data_path.name,
+                    "items": index,
+                },
+                protocol=pickle.HIGHEST_PROTOCOL,
+            ),
+        )
+        # Drop files derived from previous versions of the catalogue
+        for old_path in index_path.parent.glob(f"{index_path.stem}.*"):
+            if old_path == index_path or old_path.suffix == ".tmp":
+                continue
+            if source_hash[:16] not in old_path.name:
+                old_path.unlink(missing_ok=True)
+    except OSError as cache_error:
+        _LOGGER.debug(
+            f"Could not write compiled catalogue for {path_to_catalog}: {cache_error}"
+        )
+
+    return HubItemsCatalog.from_items(items, version=source_hash, index_path=index_path)
+
+
+def load_hub_catalog(path_to_catalog: Path) -> HubItemsCatalog:
+    """Load EWC Hub items, using the compiled catalogue when it is up to date.
+
+    The compiled catalogue is invalidated when the mtime or size of the catalogue
+    changes and its content hash differs.
+
+    :param path_to_catalog: catalogue YAML file.
+    :return: items by name, each one deserialised on first access.
+    :raises ValueError: if the catalogue is malformed.
+    """
+    path_to_catalog = Path(path_to_catalog)
+    index_path = _catalog_cache_index_path(path_to_catalog)
+    source_stat = path_to_catalog.stat()
+
+    catalog_index = _load_catalog_index(index_path)
+
+    if catalog_index:
+        data_path = index_path.with_name(catalog_index["data"])
+        unchanged = (
+            catalog_index["mtime_ns"] == source_stat.st_mtime_ns
+            and catalog_index["size"] == source_stat.st_size
+        )
+
+        if not unchanged and catalog_index["sha256"] == _file_sha256(path_to_catalog):
+            # Touched but identical, e.g. a 304 revalidation: only refresh the stat
+            catalog_index.update(
+                mtime_ns=source_stat.st_mtime_ns, size=source_stat.st_size
+            )
+            try:
+                write_private_file(
+                    index_path,
+                    pickle.dumps(catalog_index, protocol=pickle.HIGHEST_PROTOCOL),
+                )
+            except OSError:
+                pass
+            unchanged = True
+
+        if unchanged and data_path.exists():
+            _LOGGER.debug(f"Using compiled catalogue {index_path}.")
+            return HubItemsCatalog(
+                index=catalog_index["items"],
+                data_path=data_path,
+                version=catalog_index["sha256"],
+                index_path=index_path,
+            )
+
+    _LOGGER.debug(f"Compiling catalogue {path_to_catalog} into {index_path}.")
+
+    return _build_catalog_cache(
+        path_to_catalog=path_to_catalog,
+        index_path=index_path,
+        source_stat=source_stat,
+        source_hash=_file_sha256(path_to_catalog),
+    )
@@ -24,10 +24,13 @@ from pydantic import ValidationError, create_model
 
 from ewccli.configuration import config as ewc_hub_config
 from ewccli.utils import download_items
+from ewccli.utils import refresh_items
 from ewccli.commands.hub.hub_utils import verify_item_is_deployable
 from ewccli.commands.hub.hub_utils import extract_annotations
 from ewccli.commands.hub.hub_utils import prepare_missing_inputs_error_message
 from ewccli.commands.hub.hub_utils import classify_source
+from ewccli.commands.hub.hub_search import load_search_index
+from ewccli.commands.hub.hub_search import search_hub_items
 from ewccli.commands.commons import openstack_options
 from ewccli.commands.commons import ssh_options
 from ewccli.commands.commons import ssh_options_encoded
@@ -71,7 +74,8 @@ console = Console()
 @click.pass_context
 def ewc_hub_command(ctx, path_to_catalog):
     """EWC Community Hub commands group."""
-    download_items(force=ewc_hub_config.EWC_CLI_HUB_DOWNLOAD_ITEMS)
+    # EWC_CLI_HUB_DOWNLOAD_ITEMS=1 revalidates the catalogue on every invocation
+    refresh_items(ttl_s=0 if ewc_hub_config.EWC_CLI_HUB_DOWNLOAD_ITEMS else None)
 
     # Create the dict if not existing
     ctx.ensure_object(dict)
@@ -95,12 +99,8 @@ def ewc_hub_command(ctx, path_to_catalog):
     ctx.obj['cli_profile'] = None
 
 
-def categorize_item_inputs(
-    ctx,
-    item_info: dict,
-    item_info_inputs: list
-):  # noqa CCR001
-    """Categorize item inputs into default and mandatory."""
+def split_item_inputs(item_info_inputs: Optional[list]):
+    """Split item inputs into required and default inputs."""
     default_inputs = []
     required_inputs = []
 
@@ -123,6 +123,17 @@ def categorize_item_inputs(
             # In other case, the input is mandatory and it needs to be provided by the user.
             required_inputs.append(item_input)
 
+    return required_inputs, default_inputs
+
+
+def categorize_item_inputs(ctx, item_info: dict, item_info_inputs: list):  # noqa CCR001
+    """Categorize item inputs into default and mandatory."""
+    required_inputs, default_inputs = split_item_inputs(item_info_inputs)
+
+    # if no inputs exist for the item, no inputs are requested from the user
+    if not item_info_inputs:
+        return required_inputs, default_inputs
+
     ctx = get_current_context()  # <-- Get Click Context
 
     ctx.command.params[3].type = click.Choice(required_inputs)
@@ -132,6 +143,181 @@ def categorize_item_inputs(
     return required_inputs, default_inputs
 
 
+def fill_default_item_inputs(
+    item_inputs: dict,
+    default_item_inputs: list,
+    federee: str,
+    tenancy_name: str,
+    openstack_api,
+    resolver=None,
+    openstack_backend=None,
+) -> dict:
+    """Fill the default inputs not provided by the user.
+
+    Inputs known by the ewccli (HUB_ENV_VARIABLES_MAP) are taken from the EWC values,
+    the others from the default in the catalog.
+    """
+    for d_item in default_item_inputs:
+        default_item_input_name = d_item.get("name")
+
+        # If default value is not provided by the user.
+        if default_item_input_name not in item_inputs:
+            # TODO: Improve this logic with new parameter in the catalog
+            # Take the default from the EWC values if they exist
+            if default_item_input_name in HUB_ENV_VARIABLES_MAP:
+                item_inputs[default_item_input_name] = get_hub_item_env_variable_value(
+                    hub_item_env_variables_map=HUB_ENV_VARIABLES_MAP,
+                    federee=federee,
+                    tenancy_name=tenancy_name,
+                    variable_name=default_item_input_name,
+                    openstack_api=openstack_api,
+                    resolver=resolver,
+                    openstack_backend=openstack_backend,
+                )
+            else:
+                # Take the default from the catalog
+                item_inputs[default_item_input_name] = d_item.get("default")
+
+    return item_inputs
+
+
+def prepare_item_working_directory(
+    item: str,
+    item_info: dict,
+    dry_run: bool = False,
+    force: bool = False,
+):
+    """Prepare the working directory of the item, cloning its git repository if needed.
+
+    Returns:
+        status code, message and the working directory path.
+    """
+    sources = item_info.get("sources")
+    if not sources:
+        return 1, f"{item} item doesn't contain any sources.", None
+
+    # Consider first element in the list!
+    source = sources[0]
+    version = item_info.get("version")
+
+    is_source = classify_source(source=source)
+
+    _LOGGER.info(f"📦 Classified source '{source}' as: [blue]{is_source}[/blue]")
+
+    working_directory_path = None
+
+    if is_source == "directory":
+        #################################################################################
+        # Use local item (code is still local not available in any public git repository)
+        #################################################################################
+        working_directory_path = source
+
+    if is_source == "github":
+        #############################################################################
+        # Git clone item to be deployed (public repository available in the internet)
+        #############################################################################
+        # Define path for ~/.ewccli where everything is stored
+        # random_id = generate_random_id()
+        # cwd_command = f"{ewc_hub_config.EWC_CLI_DEFAULT_PATH_OUTPUTS}/{item}-{random_id}"
+        command_path = f"{ewc_hub_config.EWC_CLI_DEFAULT_PATH_OUTPUTS}/{item}-{version}"
+        repo_name = os.path.splitext(source.split("/")[-1])[0]
+        working_directory_path = f"{command_path}/{repo_name}"
+
+        git_clone_return_code, git_clone_message = git_clone_item(
+            source=source,
+            repo_name=repo_name,
+            command_path=command_path,
+            dry_run=dry_run,
+            force=force,
+        )
+
+        if git_clone_return_code == 0:
+            _LOGGER.debug("✅ Command executed successfully.")
+
+            if git_clone_message:
+                _LOGGER.info(git_clone_message)
+
+        else:
+            error_message = (
+                f"❌ Command failed with return code {git_clone_return_code}.\n"
+                f"📥 STDERR:\n{git_clone_message if git_clone_message else 'No error output provided.'}\n\n"
+                "💡 Hint: Ensure the repository URL is correct and accessible, "
+                "and that your network and credentials are properly configured."
+            )
+            return 1, error_message, None
+
+    if not working_directory_path:
+        return (
+            1,
+            f"Working directory path is empty, please verify sources metadata in your hub catalogue for {item} item",
+            None,
+        )
+
+    return 0, f"Working directory of {item} ready.", working_directory_path
+
+
+def run_item_playbook(
+    item: str,
+    item_info: dict,
+    item_inputs: dict,
+    server_name: str,
+    working_directory_path: str,
+    normalized_image_name: Optional[str],
+    ip_machine: str,
+    ssh_private_key_path: str,
+    dry_run: bool = False,
+):
+    """Run the Ansible playbook of the item on the server.
+
+    Returns:
+        status code and message.
+    """
+    item_info_ewccli = item_info.get(HubItemCLIKeys.ROOT.value, {})
+
+    username = ewc_hub_config.EWC_CLI_IMAGES_USER.get(normalized_image_name)
+
+    # If missing the mapping in the configuration is missing, so configuration file needs to be checked.
+    if not username:
+        return (
+            1,
+            f"[Ansible Item] username for {normalized_image_name} could not be identified.",
+        )
+
+    # Install requirements for ansible playbook
+    requirements_file_relative_path = item_info_ewccli.get(
+        HubItemCLIKeys.ITEM_PATH_TO_REQUIREMENTS_FILE.value, "requirements.yml"
+    )
+
+    # Run main ansible playbook
+    main_file_relative_path = item_info_ewccli.get(
+        HubItemCLIKeys.ITEM_PATH_TO_MAIN_FILE.value
+    )
+
+    if not main_file_relative_path:
+        return (
+            1,
+            f"{HubItemCLIKeys.ITEM_PATH_TO_MAIN_FILE.value} key for {item} is not set. The Ansible playbook item cannot be installed.",
+        )
+
+    main_file_path = f"{working_directory_path}/{main_file_relative_path}"
+    requirements_file_path = (
+        f"{working_directory_path}/{requirements_file_relative_path}"
+    )
+
+    return run_ansible_playbook_item(
+        item=item,
+        item_inputs=item_inputs,
+        server_name=server_name,
+        username=username,
+        main_file_path=main_file_path,
+        requirements_file_path=requirements_file_path,
+        working_directory_path=working_directory_path,
+        ip_machine=ip_machine,
+        ssh_private_key_path=str(ssh_private_key_path),
+        dry_run=dry_run,
+    )
+
+
 def check_missing_required_inputs(
     parsed_inputs: Optional[Dict[str, str]], required_item_inputs: List[dict]
 ) -> Optional[List[Any]]:
@@ -356,6 +542,7 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
     extra_volume: Optional[tuple] = None,
     ssh_private_encoded: Optional[str] = None,
     ssh_public_encoded: Optional[str] = None,
+    refresh_cache: bool = False,
 ):
     """Deploy EWC Hub item.
 
@@ -445,10 +632,6 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
     #####################################################################################
     # Prepare item parameters
     #####################################################################################
-    sources = item_info.get("sources")
-    if not sources:
-        raise ClickException(f"{item} item doesn't contain any sources.")
-
     # Consider annotations
     annotations = item_info.get("annotations")
     annotations_category, annotations_technology = extract_annotations(
@@ -460,58 +643,16 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
     if not server_name:
         server_name = item
 
-    # Consider first element in the list!
-    source = sources[0]
     version = item_info.get("version")
 
-    is_source = classify_source(source=source)
-
-    _LOGGER.info(f"📦 Classified source '{source}' as: [blue]{is_source}[/blue]")
-
-    working_directory_path = None
-
-    if is_source == "directory":
-        #################################################################################
-        # Use local item (code is still local not available in any public git repository)
-        #################################################################################
-        working_directory_path = source
-
-    if is_source == "github":
-        #############################################################################
-        # Git clone item to be deployed (public repository available in the internet)
-        #############################################################################
-        # Define path for ~/.ewccli where everything is stored
-        # random_id = generate_random_id()
-        # cwd_command = f"{ewc_hub_config.EWC_CLI_DEFAULT_PATH_OUTPUTS}/{item}-{random_id}"
-        command_path = f"{ewc_hub_config.EWC_CLI_DEFAULT_PATH_OUTPUTS}/{item}-{version}"
-        repo_name = os.path.splitext(source.split("/")[-1])[0]
-        working_directory_path = f"{command_path}/{repo_name}"
-
-        git_clone_return_code, git_clone_message = git_clone_item(
-            source=source,
-            repo_name=repo_name,
-            command_path=command_path,
-            dry_run=dry_run,
-            force=force,
+    working_directory_status_code, working_directory_message, working_directory_path = (
+        prepare_item_working_directory(
+            item=item, item_info=item_info, dry_run=dry_run, force=force
         )
+    )
 
-        if git_clone_return_code == 0:
-            _LOGGER.debug("✅ Command executed successfully.")
-
-            if git_clone_message:
-                _LOGGER.info(git_clone_message)
-
-        else:
-            error_message = (
-                f"❌ Command failed with return code {git_clone_return_code}.\n"
-                f"📥 STDERR:\n{git_clone_message if git_clone_message else 'No error output provided.'}\n\n"
-                "💡 Hint: Ensure the repository URL is correct and accessible, "
-                "and that your network and credentials are properly configured."
-            )
-            raise ClickException(error_message)
-
-    if not working_directory_path:
-        raise ClickException(f"Working directory path is empty, please verify sources metadata in your hub catalogue for {item} item")
+    if working_directory_status_code != 0:
+        raise ClickException(working_directory_message)
 
     ########################################################################
     # Run logic based on the technology annotation of the item
@@ -550,6 +691,7 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
                 application_credential_id=application_credential_id,
                 application_credential_secret=application_credential_secret,
                 auth_url=auth_url,
+                profile=cli_profile.get("profile"),
             )
         except Exception as op_error:
             raise ClickException(
@@ -572,6 +714,11 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
                 f"Could not connect to Openstack due to the following error: {op_error}"
             )
 
+        # Shared with the server deployment, so the tenant topology is listed at most once
+        openstack_resolver = openstack_backend.create_resolver(
+            openstack_api, refresh_cache=refresh_cache
+        )
+
         ##########################################
         # Validate inputs
         ###########################################
@@ -582,26 +729,15 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
         ###########################################
 
         # Prepare default parameters
-        for d_item in default_item_inputs:
-            default_item_input_name = d_item.get("name")
-
-            # If default value is not provided by the user.
-            if default_item_input_name not in item_inputs:
-                # TODO: Improve this logic with new parameter in the catalog
-                # Take the default from the EWC values if they exist
-                if default_item_input_name in HUB_ENV_VARIABLES_MAP:
-                    item_inputs[default_item_input_name] = (
-                        get_hub_item_env_variable_value(
-                            hub_item_env_variables_map=HUB_ENV_VARIABLES_MAP,
-                            federee=federee,
-                            tenancy_name=tenancy_name,
-                            variable_name=default_item_input_name,
-                            openstack_api=openstack_api,
-                        )
-                    )
-                else:
-                    # Take the default from the catalog
-                    item_inputs[default_item_input_name] = d_item.get("default")
+        item_inputs = fill_default_item_inputs(
+            item_inputs=item_inputs,
+            default_item_inputs=default_item_inputs,
+            federee=federee,
+            tenancy_name=tenancy_name,
+            openstack_api=openstack_api,
+            resolver=openstack_resolver,
+            openstack_backend=openstack_backend,
+        )
 
         # Validate all input parameters (R + D)
         # (R) Validate required inputs
@@ -646,7 +782,8 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
             ssh_public_key_path=ssh_public_key_path,
             ssh_private_key_path=ssh_private_key_path,
             dry_run=dry_run,
-            force=force,  
+            force=force,
+            resolver=openstack_resolver,
         )
 
         internal_ip_machine = outputs["internal_ip_machine"]
@@ -693,45 +830,13 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
             ewc_hub_config.EWC_CLI_IMAGES_USER.get(normalized_image_name)
         )
 
-        # If missing the mapping in the configuration is missing, so configuration file needs to be checked.
-        if not username:
-            console.print(
-                Panel(
-                    f"[Ansible Item] username for {normalized_image_name} could not be identified.",
-                    title="Error",
-                    style="red")
-                )
-            # Exit with a non-zero status
-            sys.exit(1)
-
-        # Install requirements for ansible playbook
-        requirements_file_relative_path = item_info_ewccli.get(
-            HubItemCLIKeys.ITEM_PATH_TO_REQUIREMENTS_FILE.value, "requirements.yml"
-        )
-
-        # Run main ansible playbook
-        main_file_relative_path = item_info_ewccli.get(
-            HubItemCLIKeys.ITEM_PATH_TO_MAIN_FILE.value
-        )
-
-        if not main_file_relative_path:
-            raise ClickException(
-                f"{HubItemCLIKeys.ITEM_PATH_TO_MAIN_FILE.value} key for {item} is not set. The Ansible playbook item cannot be installed."
-            )
-
-        main_file_path = f"{working_directory_path}/{main_file_relative_path}"
-        requirements_file_path = (
-            f"{working_directory_path}/{requirements_file_relative_path}"
-        )
-
-        ansible_status_code, ansible_message = run_ansible_playbook_item(
+        ansible_status_code, ansible_message = run_item_playbook(
             item=item,
+            item_info=item_info,
             item_inputs=item_inputs,
             server_name=server_name,
-            username=username,
-            main_file_path=main_file_path,
-            requirements_file_path=requirements_file_path,
             working_directory_path=working_directory_path,
+            normalized_image_name=normalized_image_name,
             ip_machine=(
                 external_ip_machine if external_ip_machine else internal_ip_machine
             ),
@@ -739,6 +844,11 @@ def deploy_cmd(  # noqa: CFQ002, CFQ001, CCR001, C901
             dry_run=dry_run,
         )
 
+        if ansible_status_code != 0 and not username:
+            console.print(Panel(ansible_message, title="Error", style="red"))
+            # Exit with a non-zero status
+            sys.exit(1)
+
         if os_status_code != 0:
             raise ClickException(os_message)
         elif ansible_status_code != 0:
@@ -813,6 +923,66 @@ def list_cmd(ctx, force: bool):
     list_items_table(hub_items=ctx.obj['items'])
 
 
+@ewc_hub_command.command("search")
+@click.argument(
+    "query",
+    type=str,
+    nargs=-1,
+)
+@click.option(
+    "--technology",
+    type=str,
+    default=None,
+    help="Filter items by technology annotation (e.g. 'Ansible Playbook').",
+)
+@click.option(
+    "--category",
+    type=str,
+    default=None,
+    help="Filter items by category annotation (e.g. 'GPU-accelerated').",
+)
+@click.option(
+    "--ewccli-compatible",
+    is_flag=True,
+    default=False,
+    help="Only show items that can be deployed with the EWC CLI.",
+)
+@click.pass_context
+def search_cmd(
+    ctx,
+    query: tuple,
+    technology: Optional[str],
+    category: Optional[str],
+    ewccli_compatible: bool,
+):
+    """Search EWC Hub items.
+
+    ewc hub search [QUERY]...
+
+    where QUERY terms are matched against item names, descriptions, maintainers
+    and category/technology annotations.
+    """
+    hub_items = ctx.obj["items"]
+
+    matches = search_hub_items(
+        search_index=load_search_index(hub_items),
+        query=query,
+        technology=technology,
+        category=category,
+        ewccli_compatible=ewccli_compatible,
+    )
+
+    if not matches:
+        console.print("No items match the search.")
+        return
+
+    list_items_table(
+        hub_items={item: hub_items[item] for item in matches},
+        ewccli_compatible_only=False,
+        title="EWC HUB Search Results",
+    )
+
+
 @ewc_hub_command.command("show")
 @click.argument(
     "item",
@@ -826,7 +996,7 @@ def show_cmd(ctx, item):
 
     where <item> is taken from ewc hub list command.
     """
-    if item not in [i for i, _ in ctx.obj['items'].items()]:
+    if item not in ctx.obj["items"]:
         list_items_table(
             hub_items=ctx.obj['items'],
         )
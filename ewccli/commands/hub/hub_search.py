@@ -0,0 +1,207 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""CLI EWC Hub: inverted index to search the EWC Hub catalogue."""
+
+import bisect
+import pickle  # nosec B403 - only loads files written by ewccli in the private cache dir
+import re
+from collections import defaultdict
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from ewccli.enums import HubItemOherAnnotation
+from ewccli.commands.hub.hub_catalog import HubItemsCatalog
+from ewccli.commands.hub.hub_catalog import write_private_file
+from ewccli.commands.hub.hub_utils import extract_annotations
+from ewccli.logger import get_logger
+
+_LOGGER = get_logger(__name__)
+
+# Bump when the layout of the search index changes
+_SEARCH_INDEX_VERSION = 1
+
+_TOKEN_PATTERN = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text: Optional[str]) -> Set[str]:
+    """Split a text into lowercase alphanumeric terms."""
+    if not text:
+        return set()
+
+    return set(_TOKEN_PATTERN.findall(str(text).lower()))
+
+
+def _item_terms(item_name: str, item: dict) -> Set[str]:
+    """Return the searchable terms of an item."""
+    terms = tokenize(item_name)
+
+    for key in ("name", "displayName", "summary", "description"):
+        terms |= tokenize(item.get(key))
+
+    for maintainer in item.get("maintainers") or []:
+        if isinstance(maintainer, dict):
+            terms |= tokenize(maintainer.get("name"))
+        else:
+            terms |= tokenize(maintainer)
+
+    category_list, technology_list = extract_annotations(item.get("annotations"))
+    for annotation in category_list + technology_list:
+        terms |= tokenize(annotation)
+
+    return terms
+
+
+def build_search_index(hub_items: HubItemsCatalog) -> dict:
+    """Build the inverted index of the catalogue.
+
+    :param hub_items: EWC Hub items.
+    :return: search index with terms, annotations and compatibility postings.
+    """
+    terms: Dict[str, Set[str]] = defaultdict(set)
+    technology: Dict[str, Set[str]] = defaultdict(set)
+    category: Dict[str, Set[str]] = defaultdict(set)
+    ewccli_compatible: Set[str] = set()
+
+    for item_name, item in hub_items.items():
+        for term in _item_terms(item_name, item):
+            terms[term].add(item_name)
+
+        annotations = item.get("annotations") or {}
+        category_list, technology_list = extract_annotations(annotations)
+
+        for value in category_list:
+            if value:
+                category[value.lower()].add(item_name)
+
+        for value in technology_list:
+            if value:
+                technology[value.lower()].add(item_name)
+
+        others_annotations = [
+            o.strip() for o in (annotations.get("others") or "").split(",")
+        ]
+        if HubItemOherAnnotation.EWCCLI_COMPATIBLE.value in others_annotations:
+            ewccli_compatible.add(item_name)
+
+    return {
+        "version": _SEARCH_INDEX_VERSION,
+        "catalog_version": hub_items.version,
+        "position": {
+            item_name: position for position, item_name in enumerate(hub_items)
+        },
+        "vocabulary": sorted(terms),
+        "terms": {term: frozenset(names) for term, names in terms.items()},
+        "technology": {value: frozenset(names) for value, names in technology.items()},
+        "category": {value: frozenset(names) for value, names in category.items()},
+        "ewccli_compatible": frozenset(ewccli_compatible),
+    }
+
+
+def _search_index_path(hub_items: HubItemsCatalog) -> Optional[Path]:
+    """Return the persisted search index path of a catalogue version."""
+    if not hub_items.index_path or not hub_items.version:
+        return None
+
+    index_path = hub_items.index_path
+
+    return index_path.with_name(f"{index_path.stem}.{hub_items.version[:16]}.search")
+
+
+def load_search_index(hub_items: HubItemsCatalog) -> dict:
+    """Load the search index of the catalogue, building and persisting it once per version.
+
+    :param hub_items: EWC Hub items.
+    :return: search index.
+    """
+    search_index_path = _search_index_path(hub_items)
+
+    if search_index_path and search_index_path.exists():
+        try:
+            with open(search_index_path, "rb") as f:
+                search_index = pickle.load(f)  # nosec B301
+            if (
+                search_index.get("version") == _SEARCH_INDEX_VERSION
+                and search_index.get("catalog_version") == hub_items.version
+            ):
+                return search_index
+        except (OSError, pickle.UnpicklingError, EOFError, AttributeError, ValueError):
+            pass
+
+    _LOGGER.debug("Building search index of the catalogue.")
+    search_index = build_search_index(hub_items)
+
+    if search_index_path:
+        try:
+            write_private_file(
+                search_index_path,
+                pickle.dumps(search_index, protocol=pickle.HIGHEST_PROTOCOL),
+            )
+        except OSError as cache_error:
+            _LOGGER.debug(
+                f"Could not write search index {search_index_path}: {cache_error}"
+            )
+
+    return search_index
+
+
+def _match_term(search_index: dict, term: str) -> Set[str]:
+    """Return items with a term starting with the given query term."""
+    vocabulary = search_index["vocabulary"]
+    matches: Set[str] = set()
+
+    position = bisect.bisect_left(vocabulary, term)
+    while position < len(vocabulary) and vocabulary[position].startswith(term):
+        matches |= search_index["terms"][vocabulary[position]]
+        position += 1
+
+    return matches
+
+
+def search_hub_items(
+    search_index: dict,
+    query: Iterable[str] = (),
+    technology: Optional[str] = None,
+    category: Optional[str] = None,
+    ewccli_compatible: bool = False,
+) -> List[str]:
+    """Search the catalogue.
+
+    Every query term must prefix-match a term of the item, filters match annotations exactly
+    (case insensitive).
+
+    :param search_index: search index from load_search_index.
+    :param query: free text query.
+    :param technology: technology annotation filter.
+    :param category: category annotation filter.
+    :param ewccli_compatible: keep only EWCCLI compatible items.
+    :return: matching item names, in catalogue order.
+    """
+    candidates: List[Set[str]] = []
+
+    for query_part in query:
+        for term in tokenize(query_part):
+            candidates.append(_match_term(search_index, term))
+
+    if technology:
+        candidates.append(set(search_index["technology"].get(technology.lower(), ())))
+
+    if category:
+        candidates.append(set(search_index["category"].get(category.lower(), ())))
+
+    if ewccli_compatible:
+        candidates.append(set(search_index["ewccli_compatible"]))
+
+    position = search_index["position"]
+
+    if not candidates:
+        return sorted(position, key=position.get)
+
+    matches = set.intersection(*sorted(candidates, key=len))
+
+    return sorted(matches, key=position.get)
@@ -8,13 +8,21 @@
 
 """EWC CLI: VM interaction."""
 
+import csv
+import json
 import sys
 import os
+import re
+import subprocess
 import time
-from typing import Optional
+from datetime import datetime, timedelta
+from functools import partial
+from pathlib import Path
+from typing import Dict, Iterable, Optional, Tuple, Union
 
 import rich_click as click
 from rich.console import Console
+from rich.live import Live
 from rich.table import Table
 from rich.panel import Panel
 from rich import box
@@ -23,25 +31,39 @@ from openstack import connection
 
 from ewccli.configuration import config as ewc_hub_config
 from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.concurrency import run_concurrently
+from ewccli.backends.openstack.concurrency import run_task_graph
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.backends.openstack.watch import ServerEvent
+from ewccli.backends.openstack.watch import ServerWatcher
 from ewccli.commands.commons import openstack_options
 from ewccli.commands.commons import ssh_options
 from ewccli.commands.commons import ssh_options_encoded
 from ewccli.commands.commons import openstack_optional_options
 from ewccli.commands.commons import CommonBackendContext
 from ewccli.commands.commons import login_options
+from ewccli.commands.commons import default_keypair_name
+from ewccli.commands.commons import load_hub_items
+from ewccli.commands.commons import KEYPAIT_DEFAULT
 from ewccli.commands.commons_infra import CreateServerInputs
 from ewccli.commands.commons_infra import check_user_ssh_keys
 from ewccli.commands.commons_infra import get_deployed_server_info, list_server_details
 from ewccli.commands.commons_infra import create_server_command
+from ewccli.commands.commons_infra import create_servers_command
+from ewccli.commands.commons_infra import list_replicas_table
 from ewccli.commands.commons_infra import resolve_machine_ip
+from ewccli.commands.commons_infra import select_servers
+from ewccli.commands.commons_infra import get_server_volumes
 from ewccli.utils import load_cli_profile
 from ewccli.logger import get_logger
 
 _LOGGER = get_logger(__name__)
-_EWC_CLI_SLEEP_TIME = 30  # seconds
 
 console = Console()
 
+# Seconds after which a background refresh of the inventory is considered dead
+_INVENTORY_REFRESH_LOCK_TIMEOUT_S = 300
+
 infra_context = click.make_pass_decorator(CommonBackendContext, ensure=True)
 
 
@@ -60,25 +82,108 @@ def ewc_infra_command(ctx, profile):
         )
         _LOGGER.info(f"Using `{ctx.cli_profile.get('profile')}` profile.")
 
-    federee = ctx.cli_profile.get("federee")
-    region = ctx.cli_profile.get("region")
-    application_credential_id = ctx.cli_profile.get("application_credential_id")
-    application_credential_secret = ctx.cli_profile.get("application_credential_secret")
-    ctx.openstack_backend = OpenstackBackend(
+    ctx.openstack_backend = create_openstack_backend(ctx.cli_profile)
+
+
+def create_openstack_backend(cli_profile: dict) -> OpenstackBackend:
+    """Create the Openstack backend of a CLI profile."""
+    federee = cli_profile.get("federee")
+    region = cli_profile.get("region")
+    application_credential_id = cli_profile.get("application_credential_id")
+    application_credential_secret = cli_profile.get("application_credential_secret")
+    return OpenstackBackend(
         application_credential_id=application_credential_id,
         application_credential_secret=application_credential_secret,
         auth_url=ewc_hub_config.EWC_CLI_SITE_MAP.get(federee).get(region),
+        profile=cli_profile.get("profile"),
     )
 
 
-def list_server_table(servers: dict):
-    """List servers in a table with columns Name, Status, and Networks."""
+def _refresh_inventory_worker(profile: str, lock_file: str):
+    """Refresh the inventory of a profile, entry point of the background refresh."""
+    try:
+        cli_profile = load_cli_profile(profile=profile)
+        openstack_backend = create_openstack_backend(cli_profile)
+        inventory = openstack_backend.open_inventory()
+
+        if inventory:
+            openstack_backend.refresh_inventory(
+                conn=openstack_backend.connect(),
+                inventory=inventory,
+                federee=cli_profile.get("federee"),
+            )
+    finally:
+        Path(lock_file).unlink(missing_ok=True)
+
+
+def refresh_inventory_in_background(profile: str, inventory_file: Path):
+    """Reconcile the inventory with Openstack in a detached process.
+
+    Only one refresh runs at a time, locks left over by killed refreshes are ignored.
+    """
+    lock_file = inventory_file.with_name(f"{inventory_file.name}.lock")
+    try:
+        if time.time() - lock_file.stat().st_mtime < _INVENTORY_REFRESH_LOCK_TIMEOUT_S:
+            _LOGGER.debug("Inventory refresh already in progress.")
+            return
+        lock_file.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+    except FileExistsError:
+        return
+
+    _LOGGER.debug(f"Inventory {inventory_file} is stale, refreshing it in background.")
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; "
+                "from ewccli.commands.infra_command import _refresh_inventory_worker; "
+                "_refresh_inventory_worker(sys.argv[1], sys.argv[2])",
+                profile,
+                str(lock_file),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        lock_file.unlink(missing_ok=True)
+        _LOGGER.debug(f"Could not start background refresh of the inventory: {e}")
+
+
+# Fields of the servers rendered by the json, ndjson and csv outputs
+SERVER_FIELDS = (
+    "id",
+    "name",
+    "status",
+    "image",
+    "flavor",
+    "networks",
+    "security-groups",
+    "keypair",
+)
+
+
+def list_server_table(
+    servers: Union[dict, Iterable[dict]], caption: Optional[str] = None
+):
+    """List servers in a table with columns Name, Status, and Networks.
+
+    The rows are rendered as the servers arrive.
+    """
     console = Console()
 
     table = Table(
         show_header=True,
         header_style="bold green",
         title="Openstack Servers",
+        caption=caption,
         box=box.MINIMAL_DOUBLE_HEAD,
     )
 
@@ -89,17 +194,55 @@ def list_server_table(servers: dict):
     table.add_column("Keypair", style="red")
     table.add_column("Flavor", style="yellow")
 
-    # Add each server as a row
-    for server_id, server_info in servers.items():
-        
-        name = str(server_info.get("name", ""))
-        keypair = str(server_info.get("keypair", ""))
-        status = str(server_info.get("status", ""))
-        networks = str(server_info.get("networks", ""))
-        flavor = str(server_info.get("flavor", ""))
-        table.add_row(name, status, networks, keypair, flavor)
+    rows = servers.values() if isinstance(servers, dict) else servers
+
+    def add_rows():
+        # Add each server as a row
+        for server_info in rows:
+            name = str(server_info.get("name", ""))
+            keypair = str(server_info.get("keypair", ""))
+            status = str(server_info.get("status", ""))
+            networks = str(server_info.get("networks", ""))
+            flavor = str(server_info.get("flavor", ""))
+            table.add_row(name, status, networks, keypair, flavor)
+
+    if not console.is_terminal:
+        add_rows()
+        console.print(table)
+        return
+
+    with Live(table, console=console):
+        add_rows()
 
-    console.print(table)
+
+def write_servers(rows: Iterable[dict], output: str):
+    """Write the servers as json, ndjson or csv to stdout, bypassing Rich.
+
+    Each server is written as soon as it arrives, a json array included.
+    """
+    if output == "csv":
+        writer = csv.DictWriter(
+            sys.stdout, fieldnames=SERVER_FIELDS, extrasaction="ignore"
+        )
+        writer.writeheader()
+        for row in rows:
+            writer.writerow(row)
+            sys.stdout.flush()
+        return
+
+    if output == "ndjson":
+        for row in rows:
+            click.echo(json.dumps({field: row.get(field) for field in SERVER_FIELDS}))
+        return
+
+    separator = "[\n"
+    for row in rows:
+        click.echo(
+            separator + json.dumps({field: row.get(field) for field in SERVER_FIELDS}),
+            nl=False,
+        )
+        separator = ",\n"
+    click.echo("[]" if separator == "[\n" else "\n]")
 
 
 @ewc_infra_command.command("create", help="Create server in Openstack.")
@@ -122,6 +265,21 @@ def list_server_table(servers: dict):
     default=False,
     help="Force item recreation operation.",
 )
+@click.option(
+    "--count",
+    type=click.IntRange(min=1),
+    default=1,
+    show_default=True,
+    help="Number of replicas to create concurrently,"
+    " named SERVER_NAME-1 to SERVER_NAME-N.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="EWC_CLI_INFRA_CREATE_MAX_WORKERS",
+    help="Maximum number of replicas created concurrently.",
+)
 @click.argument("server_name")
 def create_cmd(
     ctx,
@@ -144,8 +302,11 @@ def create_cmd(
     extra_volume: Optional[tuple] = None,
     ssh_private_encoded: Optional[str] = None,
     ssh_public_encoded: Optional[str] = None,
+    refresh_cache: bool = False,
+    count: int = 1,
+    max_workers: Optional[int] = None,
 ):
-    """Show Server from Openstack."""
+    """Create Server in Openstack."""
     if dry_run:
         _LOGGER.info("Dry run enabled...")
 
@@ -203,6 +364,33 @@ def create_cmd(
         extra_volume=extra_volume,
     )
 
+    if count > 1:
+        os_status_code, os_message, replicas = create_servers_command(
+            openstack_backend=ctx.openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            region=region,
+            server_inputs=server_inputs,
+            count=count,
+            ssh_private_encoded=ssh_private_encoded,
+            ssh_public_encoded=ssh_public_encoded,
+            ssh_public_key_path=ssh_public_key_path,
+            ssh_private_key_path=ssh_private_key_path,
+            dry_run=dry_run,
+            force=force,
+            refresh_cache=refresh_cache,
+            max_workers=max_workers,
+        )
+
+        if replicas:
+            list_replicas_table(replicas=replicas)
+
+        if os_status_code != 0:
+            raise ClickException(os_message)
+
+        _LOGGER.info(os_message)
+        return
+
     os_status_code, os_message, outputs = create_server_command(
         openstack_backend=ctx.openstack_backend,
         openstack_api=openstack_api,
@@ -214,7 +402,8 @@ def create_cmd(
         ssh_public_key_path=ssh_public_key_path,
         ssh_private_key_path=ssh_private_key_path,
         dry_run=dry_run,
-        force=force,  
+        force=force,
+        refresh_cache=refresh_cache,
     )
     internal_ip_machine = outputs["internal_ip_machine"]
     external_ip_machine = outputs["external_ip_machine"]
@@ -295,7 +484,9 @@ def show_cmd(
 
     try:
         # Find the server info by name
-        server_info = openstack_api.get_server(name_or_id=server_name)
+        server_info = ctx.openstack_backend.create_resolver(openstack_api).get_server(
+            server_name
+        )
     except Exception as e:
         raise ClickException(
             f"Could not retrieve server {server_name} from Openstack due to: {e}"
@@ -313,7 +504,17 @@ def show_cmd(
     root_volume = None
     extra_volumes = []
 
-    for att in server_info.attached_volumes:
+    attached_volumes = server_info.attached_volumes or []
+
+    # Fetch real Cinder volumes
+    volumes = get_server_volumes(
+        openstack_api,
+        server_name=server_info.name,
+        volume_ids=[att["id"] for att in attached_volumes],
+        include_foreign=True,
+    )
+
+    for att in attached_volumes:
         vol_id = att["id"]
         device = att.get("device") or "unknown"
 
@@ -321,8 +522,7 @@ def show_cmd(
         # if att.get("delete_on_termination", False):
         #     continue
 
-        # Fetch real Cinder volume
-        vol = openstack_api.block_storage.get_volume(vol_id)
+        vol = volumes[vol_id]
 
         # Extract mount point from Cinder volume
         device = None
@@ -365,6 +565,24 @@ def show_cmd(
     show_default=True,
     help="List machines even if not created by the EWC CLI.",
 )
+@click.option(
+    "--output",
+    "-o",
+    type=click.Choice(["table", "json", "ndjson", "csv"], case_sensitive=False),
+    default="table",
+    envvar="EWC_CLI_INFRA_LIST_OUTPUT",
+    show_default=True,
+    help="Output format. json, ndjson and csv are written to stdout for scripts.",
+)
+@click.option(
+    "--cached",
+    is_flag=True,
+    default=False,
+    envvar="EWC_CLI_INFRA_LIST_CACHED",
+    show_default=True,
+    help="List the servers from the local inventory, refreshed in background once older than"
+    " EWC_CLI_INVENTORY_TTL.",
+)
 def list_cmd(
     ctx,
     federee: Optional[str] = None,
@@ -372,13 +590,153 @@ def list_cmd(
     application_credential_id: Optional[str] = None,
     application_credential_secret: Optional[str] = None,
     show_all: bool = False,
+    output: str = "table",
+    cached: bool = False,
 ):
-    """List Servers from Openstack."""
+    """List Servers from Openstack.
+
+    The servers are rendered as they are listed.
+    """
     federee = federee or ctx.cli_profile["federee"]
+    connect = partial(
+        ctx.openstack_backend.connect,
+        auth_url=auth_url,
+        application_credential_id=application_credential_id,
+        application_credential_secret=application_credential_secret,
+    )
+
+    if cached:
+        if show_all:
+            raise ClickException(
+                "The inventory only holds the VMs created with EWC CLI, drop --show-all."
+            )
 
+        list_cached_servers(
+            ctx, federee=federee, output=output.lower(), connect=connect
+        )
+        return
 
     try:
         # Step 1: Authenticate and initialize the OpenStack connection
+        openstack_api = connect()
+    except Exception as op_error:
+        raise ClickException(
+            f"Could not connect to Openstack due to the following error: {op_error}"
+        )
+
+    if show_all:
+        _LOGGER.info("--show-all is enabled.")
+    else:
+        _LOGGER.info(
+            "Listing only VMs created with EWC CLI. If you want to see all VMs, use --show-all flag."
+        )
+
+    servers = ctx.openstack_backend.iter_servers(
+        conn=openstack_api, show_all=show_all, federee=federee
+    )
+
+    try:
+        if output.lower() == "table":
+            list_server_table(servers=servers)
+        else:
+            write_servers(servers, output=output.lower())
+    except Exception as e:
+        raise ClickException(
+            f"Could not retrieve server list from Openstack due to: {e}"
+        )
+
+
+def list_cached_servers(ctx, federee: str, output: str, connect):
+    """List the servers from the local inventory, with the age of the snapshot.
+
+    A missing inventory is built first. A stale one is listed as is while a
+    detached process reconciles it with Openstack, for the next invocations.
+    """
+    inventory = ctx.openstack_backend.open_inventory()
+
+    if inventory is None:
+        raise ClickException(
+            "The inventory is not available. Enable it with EWC_CLI_INVENTORY=1"
+            " and make sure the profile has application credentials."
+        )
+
+    age_s = inventory.age_s()
+
+    if age_s is None:
+        _LOGGER.info("Building the inventory, the next listings are served from it...")
+        try:
+            ctx.openstack_backend.refresh_inventory(
+                conn=connect(), inventory=inventory, federee=federee
+            )
+        except Exception as e:
+            raise ClickException(f"Could not build the inventory due to: {e}")
+        age_s = 0
+    elif age_s > ewc_hub_config.EWC_CLI_INVENTORY_TTL:
+        refresh_inventory_in_background(
+            profile=ctx.cli_profile.get("profile")
+            or ewc_hub_config.EWC_CLI_DEFAULT_PROFILE_NAME,
+            inventory_file=inventory.inventory_file,
+        )
+
+    caption = f"Snapshot age: {timedelta(seconds=int(age_s))}"
+    if age_s > ewc_hub_config.EWC_CLI_INVENTORY_TTL:
+        caption += " (refreshing in background)"
+
+    if output == "table":
+        list_server_table(servers=inventory.servers(), caption=caption)
+    else:
+        _LOGGER.info(caption)
+        write_servers(inventory.servers(), output=output)
+
+
+def format_server_event(event: ServerEvent) -> str:
+    """Format a status transition of a server, e.g. BUILD → ACTIVE."""
+    styles = {"ACTIVE": "green", "ERROR": "red", "DELETED": "yellow"}
+    style = styles.get(event.status, "magenta")
+    timestamp = datetime.now().strftime("%H:%M:%S")
+    previous = f"{event.previous} → " if event.previous else "new → "
+
+    return (
+        f"{timestamp} [cyan]{event.name}[/cyan] {previous}"
+        f"[{style}]{event.status}[/{style}] ({event.server_id})"
+    )
+
+
+@ewc_infra_command.command(
+    name="watch", help="Watch the status transitions of the servers in Openstack."
+)
+@infra_context
+@openstack_options
+@click.option(
+    "--show-all",
+    is_flag=True,
+    default=False,
+    envvar="EWC_CLI_INFRA_LIST_FORCE_ENABLED",
+    show_default=True,
+    help="Watch machines even if not created by the EWC CLI.",
+)
+@click.option(
+    "--interval",
+    type=click.FloatRange(min=1),
+    default=10,
+    envvar="EWC_CLI_INFRA_WATCH_INTERVAL",
+    show_default=True,
+    help="Seconds between two polls.",
+)
+def watch_cmd(
+    ctx,
+    auth_url: Optional[str] = None,
+    application_credential_id: Optional[str] = None,
+    application_credential_secret: Optional[str] = None,
+    show_all: bool = False,
+    interval: float = 10,
+):
+    """Watch the servers from Openstack until interrupted.
+
+    Only the servers changed since the previous poll are requested, so a poll
+    costs the number of changes rather than the number of servers.
+    """
+    try:
         openstack_api = ctx.openstack_backend.connect(
             auth_url=auth_url,
             application_credential_id=application_credential_id,
@@ -389,18 +747,325 @@ def list_cmd(
             f"Could not connect to Openstack due to the following error: {op_error}"
         )
 
+    watcher = ServerWatcher(
+        openstack_api,
+        show_all=show_all,
+        legacy_servers=not show_all and ctx.openstack_backend.legacy_servers_remain(),
+    )
+
     try:
-        servers = ctx.openstack_backend.list_servers(
-            conn=openstack_api, show_all=show_all, federee=federee
-        )
+        watched = watcher.snapshot()
     except Exception as e:
         raise ClickException(
             f"Could not retrieve server list from Openstack due to: {e}"
         )
-    list_server_table(servers=servers)
 
+    console.print(
+        f"Watching {watched} servers every {interval:g}s, press Ctrl+C to stop."
+    )
 
-@ewc_infra_command.command(name="delete", help="Delete server in Openstack.")
+    try:
+        while True:
+            time.sleep(interval)
+
+            try:
+                events = watcher.poll()
+            except Exception as e:
+                # A failed poll is retried at the next interval, from the same watermark
+                _LOGGER.warning(f"Could not poll the servers due to: {e}")
+                continue
+
+            for event in events:
+                console.print(format_server_event(event))
+    except KeyboardInterrupt:
+        console.print("Stopped watching.")
+
+
+@ewc_infra_command.command(
+    name="migrate-tags",
+    help="Tag the servers created by older EWC CLI versions,"
+    " to list them with a server side filter.",
+)
+@infra_context
+@openstack_options
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    envvar="EWC_CLI_DRY_RUN",
+    default=False,
+    help="Show the servers that would be tagged.",
+)
+def migrate_tags_cmd(
+    ctx,
+    auth_url: Optional[str] = None,
+    application_credential_id: Optional[str] = None,
+    application_credential_secret: Optional[str] = None,
+    dry_run: bool = False,
+):
+    """Tag the servers carrying only the legacy deployed=ewccli metadata."""
+    try:
+        openstack_api = ctx.openstack_backend.connect(
+            auth_url=auth_url,
+            application_credential_id=application_credential_id,
+            application_credential_secret=application_credential_secret,
+        )
+    except Exception as op_error:
+        raise ClickException(
+            f"Could not connect to Openstack due to the following error: {op_error}"
+        )
+
+    try:
+        result, tagged, message = ctx.openstack_backend.tag_legacy_servers(
+            conn=openstack_api, dry_run=dry_run
+        )
+    except Exception as e:
+        raise ClickException(f"Could not tag the servers due to: {e}")
+
+    if not result.success:
+        raise ClickException(message)
+
+    console.print(message)
+
+
+@ewc_infra_command.command(
+    name="fip-pool",
+    help="Reserve unbound floating IPs for the ewccli,"
+    " so attaching an external IP is a single port update.",
+)
+@infra_context
+@openstack_options
+@click.option(
+    "--size",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="EWC_CLI_FLOATING_IP_POOL_SIZE",
+    help="Number of floating IPs kept reserved."
+    " (or set env var EWC_CLI_FLOATING_IP_POOL_SIZE)",
+)
+def fip_pool_cmd(
+    ctx,
+    size: Optional[int] = None,
+    federee: Optional[str] = None,
+    auth_url: Optional[str] = None,
+    application_credential_id: Optional[str] = None,
+    application_credential_secret: Optional[str] = None,
+):
+    """Fill the pool of floating IPs reserved for the ewccli.
+
+    Deployments take floating IPs from the pool without refilling it, run the
+    command again to top it up.
+    """
+    federee = federee or ctx.cli_profile["federee"]
+
+    if not size:
+        raise ClickException(
+            "Select the size of the pool with --size or EWC_CLI_FLOATING_IP_POOL_SIZE."
+        )
+
+    try:
+        openstack_api = ctx.openstack_backend.connect(
+            auth_url=auth_url,
+            application_credential_id=application_credential_id,
+            application_credential_secret=application_credential_secret,
+        )
+    except Exception as op_error:
+        raise ClickException(
+            f"Could not connect to Openstack due to the following error: {op_error}"
+        )
+
+    result, message = ctx.openstack_backend.fill_floating_ip_pool(
+        conn=openstack_api, federee=federee, size=size
+    )
+
+    if not result.success:
+        raise ClickException(message)
+
+    console.print(message)
+
+
+@ewc_infra_command.command(
+    name="apply", help="Apply a fleet manifest of servers, DNS records and hub items."
+)
+@infra_context
+@ssh_options
+@openstack_options
+@click.option(
+    "--keypair-name",
+    "-kp",
+    required=False,
+    default=default_keypair_name,
+    envvar="EWC_CLI_OPENSTACK_KEYPAIR_NAME",
+    show_default=KEYPAIT_DEFAULT,
+    type=str,
+    help="Select a name for the keypair of the servers in Openstack. (or set env var EWC_CLI_OPENSTACK_KEYPAIR_NAME)",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="EWC_CLI_INFRA_APPLY_MAX_WORKERS",
+    help="Maximum number of resources applied concurrently.",
+)
+@click.option(
+    "--dry-run",
+    envvar="EWC_CLI_DRY_RUN",
+    default=False,
+    is_flag=True,
+    help="Show the plan without applying it.",
+)
+@click.argument(
+    "manifest", type=click.Path(exists=True, dir_okay=False, path_type=Path)
+)
+def apply_cmd(
+    ctx,
+    manifest: Path,
+    keypair_name: str,
+    ssh_public_key_path: Optional[str] = None,
+    ssh_private_key_path: Optional[str] = None,
+    auth_url: Optional[str] = None,
+    application_credential_id: Optional[str] = None,
+    application_credential_secret: Optional[str] = None,
+    max_workers: Optional[int] = None,
+    dry_run: bool = False,
+):
+    """Apply a fleet manifest.
+
+    Independent resources are applied concurrently and existing servers
+    matching the manifest are left unchanged.
+    """
+    # Imported on use, the other infra commands don't load the hub and Ansible modules
+    from ewccli.commands import commons_fleet
+
+    cli_profile = ctx.cli_profile
+    federee = cli_profile["federee"]
+    region = cli_profile["region"]
+
+    ssh_public_key_path = ssh_public_key_path or cli_profile.get("ssh_public_key_path")
+    ssh_private_key_path = ssh_private_key_path or cli_profile.get(
+        "ssh_private_key_path"
+    )
+
+    try:
+        fleet = commons_fleet.load_fleet_manifest(manifest, keypair_name=keypair_name)
+        stages = commons_fleet.plan_fleet(fleet)
+    except (OSError, ValueError) as e:
+        raise ClickException(str(e))
+
+    if dry_run:
+        commons_fleet.show_fleet_plan(fleet, stages)
+        return
+
+    check_user_ssh_keys(
+        ssh_public_key_path=ssh_public_key_path,
+        ssh_private_key_path=ssh_private_key_path,
+    )
+
+    try:
+        # Step 1: Authenticate and initialize the OpenStack connection
+        openstack_api = ctx.openstack_backend.connect(
+            auth_url=auth_url,
+            application_credential_id=application_credential_id,
+            application_credential_secret=application_credential_secret,
+        )
+    except Exception as op_error:
+        raise ClickException(
+            f"Could not connect to Openstack due to the following error: {op_error}"
+        )
+
+    hub_items = load_hub_items() if fleet.items else None
+
+    try:
+        outcomes = commons_fleet.apply_fleet(
+            openstack_backend=ctx.openstack_backend,
+            openstack_api=openstack_api,
+            federee=federee,
+            region=region,
+            tenancy_name=cli_profile.get("tenant_name"),
+            manifest=fleet,
+            keypair_name=keypair_name,
+            ssh_public_key_path=ssh_public_key_path,
+            ssh_private_key_path=ssh_private_key_path,
+            hub_items=hub_items,
+            max_workers=max_workers,
+        )
+    except ValueError as e:
+        raise ClickException(str(e))
+
+    commons_fleet.show_fleet_summary(fleet, outcomes)
+
+    not_applied = [
+        name for name, outcome in outcomes.items() if outcome.status != "done"
+    ]
+    if not_applied:
+        raise ClickException(f"Could not apply {', '.join(not_applied)}.")
+
+
+def parse_selector(ctx, param, values) -> dict:
+    """Parse the KEY=VALUE metadata selectors."""
+    selector = {}
+
+    for value in values:
+        key, sep, val = value.partition("=")
+        if not sep or not key:
+            raise click.BadParameter(f"expected KEY=VALUE, got `{value}`.")
+        selector[key] = val
+
+    return selector
+
+
+def selected_servers_table(servers: list):
+    """List the servers selected for deletion in a table."""
+    table = Table(
+        show_header=True,
+        header_style="bold green",
+        title="[Dry Run] Servers selected for deletion",
+        box=box.MINIMAL_DOUBLE_HEAD,
+    )
+
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("ID", style="white")
+    table.add_column("Status", style="magenta")
+    table.add_column("Created by ewccli", style="yellow")
+
+    for server in servers:
+        deployed = (server.get("metadata") or {}).get("deployed") == "ewccli"
+        table.add_row(
+            str(server.get("name", "")),
+            str(server.get("id", "")),
+            str(server.get("status", "")),
+            "yes" if deployed else "no",
+        )
+
+    console.print(table)
+
+
+def delete_summary_table(servers: list, results: dict):
+    """List the result of the deletion of each server in a table."""
+    table = Table(
+        show_header=True,
+        header_style="bold green",
+        title="Delete summary",
+        box=box.MINIMAL_DOUBLE_HEAD,
+    )
+
+    table.add_column("Name", style="cyan", no_wrap=True)
+    table.add_column("Result", style="magenta")
+    table.add_column("Message", style="white")
+
+    styles = {"deleted": "green", "skipped": "yellow", "failed": "red"}
+
+    for server in servers:
+        result, message = results[server.get("id")]
+        table.add_row(
+            str(server.get("name", "")),
+            f"[{styles[result]}]{result}[/{styles[result]}]",
+            message,
+        )
+
+    console.print(table)
+
+
+@ewc_infra_command.command(name="delete", help="Delete servers in Openstack.")
 @click.option(
     "--dry-run",
     is_flag=True,
@@ -408,8 +1073,29 @@ def list_cmd(
     help="Simulate the operation without making any changes.",
 )
 @click.argument(
-    "server-name",
+    "server-names",
     type=str,
+    nargs=-1,
+)
+@click.option(
+    "--regex",
+    is_flag=True,
+    default=False,
+    help="Match the server names as regular expressions.",
+)
+@click.option(
+    "--selector",
+    multiple=True,
+    callback=parse_selector,
+    help="Select the servers with the KEY=VALUE metadata, e.g. deployed=ewccli."
+    " Can be repeated.",
+)
+@click.option(
+    "--max-workers",
+    type=click.IntRange(min=1),
+    default=None,
+    envvar="EWC_CLI_INFRA_DELETE_MAX_WORKERS",
+    help="Maximum number of servers deleted concurrently.",
 )
 @click.option(
     "--force",
@@ -423,17 +1109,31 @@ def list_cmd(
 @openstack_options
 def delete_cmd(
     ctx,
-    server_name: str,
+    server_names: Tuple[str, ...],
     force: bool = False,
     auth_url: Optional[str] = None,
     application_credential_id: Optional[str] = None,
     application_credential_secret: Optional[str] = None,
     dry_run: bool = False,
+    regex: bool = False,
+    selector: Optional[dict] = None,
+    max_workers: Optional[int] = None,
 ):
-    """Delete VM from Openstack."""
+    """Delete VMs from Openstack.
+
+    SERVER_NAMES are server names or IDs, or name patterns such as `test-*`.
+    """
     cli_profile = ctx.cli_profile
     federee = cli_profile["federee"]
 
+    if os.getenv("EWC_CLI_OS_SERVER_NAME"):
+        server_names = (os.getenv("EWC_CLI_OS_SERVER_NAME"),)
+
+    if not server_names and not selector:
+        raise ClickException(
+            "Provide the servers to delete by name, pattern or --selector."
+        )
+
     # Step 1: Authenticate and initialize the OpenStack connection
     try:
         # Step 1: Authenticate and initialize the OpenStack connection
@@ -447,50 +1147,159 @@ def delete_cmd(
             f"Could not connect to Openstack due to the following error: {op_error}"
         )
 
-    server_name = os.getenv("EWC_CLI_OS_SERVER_NAME") or server_name
+    is_single_server = (
+        len(server_names) == 1
+        and not regex
+        and not selector
+        and not any(wildcard in server_names[0] for wildcard in "*?[")
+    )
+
+    if not is_single_server:
+        delete_servers(
+            ctx=ctx,
+            openstack_api=openstack_api,
+            federee=federee,
+            server_names=server_names,
+            regex=regex,
+            selector=selector,
+            force=force,
+            dry_run=dry_run,
+            max_workers=max_workers,
+        )
+        return
+
+    server_name = server_names[0]
+    resolver = ctx.openstack_backend.create_resolver(openstack_api)
 
     # Step 2: Fetch server_info
     try:
-        server_info = openstack_api.get_server(name_or_id=server_name)
+        server_info = resolver.get_server(server_name)
     except Exception as e:
         raise ClickException(
             f"Could not retrieve server {server_name} due to: {e}"
         )
 
-    # Step 3: Run pre-delete steps
+    # Step 3: Release the resources of the server and delete it
     try:
-        sc_pre, msg_pre = pre_delete_server(
+        sc, delete_message = delete_server_command(
             openstack_backend=ctx.openstack_backend,
             openstack_api=openstack_api,
             federee=federee,
             server_name=server_name,
             server_info=server_info,
+            force=force,
             dry_run=dry_run,
+            resolver=resolver,
         )
     except Exception as e:
         raise ClickException(
-            f"Pre-delete steps failed for server {server_name} due to: {e}"
+            f"Could not delete server {server_name} from Openstack due to: {e}"
         )
 
-    if sc_pre != 0:
-        raise ClickException(msg_pre)
+    if sc != 0:
+        raise ClickException(delete_message)
+
+    _LOGGER.info(delete_message)
 
-    _LOGGER.info(msg_pre)
 
-    # Step 4: Delete server
+def delete_servers(
+    ctx,
+    openstack_api: connection.Connection,
+    federee: str,
+    server_names: Tuple[str, ...],
+    regex: bool = False,
+    selector: Optional[dict] = None,
+    force: bool = False,
+    dry_run: bool = False,
+    max_workers: Optional[int] = None,
+):
+    """Delete the servers matching the names, patterns and metadata selector."""
+    # Step 2: Select the servers from a single listing
     try:
-        _, delete_message = ctx.openstack_backend.delete_server(
-            conn=openstack_api,
-            server_name=server_name,
-            force=force,
-            dry_run=dry_run,
+        servers, unmatched = select_servers(
+            servers=list(openstack_api.compute.servers(details=True)),
+            names=server_names,
+            regex=regex,
+            selector=selector,
         )
+    except re.error as e:
+        raise ClickException(f"Invalid server name regular expression: {e}")
     except Exception as e:
         raise ClickException(
-            f"Could not delete server {server_name} from Openstack due to: {e}"
+            f"Could not retrieve server list from Openstack due to: {e}"
         )
 
-    _LOGGER.info(delete_message)
+    for name in unmatched:
+        _LOGGER.warning(f"No server matches `{name}`.")
+
+    if not servers:
+        raise ClickException("No server matches the selection.")
+
+    if dry_run:
+        selected_servers_table(servers=servers)
+        return
+
+    _LOGGER.info(f"Deleting {len(servers)} servers...")
+
+    # Step 3: Release the resources of the servers and delete them
+    results = delete_servers_command(
+        openstack_backend=ctx.openstack_backend,
+        openstack_api=openstack_api,
+        federee=federee,
+        servers=servers,
+        force=force,
+        max_workers=max_workers,
+    )
+
+    delete_summary_table(servers=servers, results=results)
+
+    failed = [result for result, _ in results.values() if result == "failed"]
+    if failed:
+        raise ClickException(
+            f"Could not delete {len(failed)} of {len(servers)} servers."
+        )
+
+
+def delete_servers_command(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    federee: str,
+    servers: list,
+    force: bool = False,
+    max_workers: Optional[int] = None,
+) -> Dict[str, Tuple[str, str]]:
+    """Delete servers concurrently over the same connection.
+
+    Servers not created by the ewccli are skipped unless ``force`` is set.
+
+    :return: result (deleted, skipped or failed) and message of each server, by ID.
+    """
+
+    def delete(server) -> Tuple[str, str]:
+        server_name = server.get("name")
+
+        if not force and (server.get("metadata") or {}).get("deployed") != "ewccli":
+            return "skipped", "Not created by the ewccli, use --force to delete it."
+
+        try:
+            sc, message = delete_server_command(
+                openstack_backend=openstack_backend,
+                openstack_api=openstack_api,
+                federee=federee,
+                server_name=server_name,
+                server_info=server,
+                force=force,
+            )
+        except Exception as e:
+            _LOGGER.error(f"Could not delete server {server_name}: {e}")
+            return "failed", str(e)
+
+        return ("deleted", message) if sc == 0 else ("failed", message)
+
+    return run_concurrently(
+        {server.get("id"): partial(delete, server) for server in servers},
+        max_workers=max_workers,
+    )
 
 
 def pre_delete_server(
@@ -501,13 +1310,15 @@ def pre_delete_server(
     server_info: dict,
     dry_run: bool = False,
 ):
-    """Pre delete server steps:
+    """Pre delete server steps, identifying the resources to release:
 
-        - detach floating IP
-        - detach and delete extra volumes
+    - floating IP
+    - extra volumes created by the ewccli for the server
     """
+    outputs: dict = {"external_ip_machine": None, "volumes": []}
+
     if dry_run:
-        return 0, "[Dry Run] skipping pre delete server steps..."
+        return 0, "[Dry Run] skipping pre delete server steps...", outputs
 
     _LOGGER.info("Pre delete server steps starting...")
 
@@ -519,10 +1330,10 @@ def pre_delete_server(
         federee=federee, server_info=server_info
     )
     if sc_resolve_ip != 0:
-        return 1, resolve_ip_message
+        return 1, resolve_ip_message, outputs
 
     if resolve_ip_outputs is None:
-        return 1, "[Pre delete server] No IPs identified."
+        return 1, "[Pre delete server] No IPs identified.", outputs
 
     external_ip_machine = resolve_ip_outputs.get("external_ip_machine")
     internal_ip_machine = resolve_ip_outputs.get("internal_ip_machine")
@@ -531,30 +1342,13 @@ def pre_delete_server(
         return (
             1,
             f"[Pre delete server] internal_ip_machine {internal_ip_machine} is missing or empty",
+            outputs,
         )
 
-    ############################################################
-    # Detach and release external IP (if present)
-    ############################################################
-
-    if external_ip_machine:
-        _LOGGER.info(f"Detaching external IP {external_ip_machine} from server {server_name}")
-
-        detach_status, message = openstack_backend.remove_external_ip(
-            conn=openstack_api,
-            server=server_info,
-            external_ip=external_ip_machine
-        )
-
-        time.sleep(_EWC_CLI_SLEEP_TIME - 15)
-
-        if not detach_status[0]:
-            return 1, message
-
-        _LOGGER.info(message)
+    outputs["external_ip_machine"] = external_ip_machine
 
     ############################################################
-    # Detach and delete extra volumes on the vm
+    # Extra volumes on the vm
     ############################################################
 
     # Get attached volumes from server_info
@@ -566,35 +1360,134 @@ def pre_delete_server(
     else:
         _LOGGER.info(f"Server has {len(attached_volume_ids)} attached volumes.")
 
-        volumes_to_process = []
-
-        # Fetch each volume object and filter by metadata
-        for vol_id in attached_volume_ids:
-            vol = openstack_api.block_storage.get_volume(vol_id)
-
-            if vol.metadata and vol.metadata.get("ewccli") == "true":
-                if vol.metadata.get("server_name") == server_name:
-                    volumes_to_process.append(vol)
+        # Volumes created by the ewccli for this server, listed at once
+        volumes_to_process = list(
+            get_server_volumes(
+                openstack_api, server_name=server_name, volume_ids=attached_volume_ids
+            ).values()
+        )
 
         if volumes_to_process:
             _LOGGER.info(f"Found {len(volumes_to_process)} ewccli volumes to detach/delete")
+        else:
+            _LOGGER.info("No ewccli volumes found for this server.")
 
-            detach_result, deleted_ids, msg = openstack_backend.detach_volumes_from_server(
-                conn=openstack_api,
-                server_id=server_info.get("id"),
-                volumes=volumes_to_process,
-                attempts=2,
-                retry_delay_s=30,
-                wait_time_s=600,
-                dry_run=dry_run,
-            )
+        outputs["volumes"] = volumes_to_process
+
+    return 0, "Pre delete server steps finished successfully", outputs
+
+
+def delete_server_command(
+    openstack_backend: OpenstackBackend,
+    openstack_api: connection.Connection,
+    federee: str,
+    server_name: str,
+    server_info: Optional[dict],
+    force: bool = False,
+    dry_run: bool = False,
+    resolver: Optional[OpenstackResourceResolver] = None,
+) -> Tuple[int, str]:
+    """Delete a server and release its resources.
+
+    The teardown is a dependency graph tracking the real state of the resources:
+
+        - release of the floating IP and detach of the volumes, concurrently
+        - server deletion, once both are done, waiting until the server is gone
+        - deletion of the volumes, once the server is gone
+
+    The server already retrieved is fetched again by ID for its deletion.
+    """
+    resolver = resolver or openstack_backend.create_resolver(openstack_api)
+
+    if server_info:
+        resolver.remember_server(server_info)
 
-            if not detach_result.success:
-                return 1, f"[Pre delete] Volume detach/delete failed: {msg}"
+    if dry_run or not server_info:
+        _, delete_message = openstack_backend.delete_server(
+            conn=openstack_api,
+            server_name=server_name,
+            force=force,
+            dry_run=dry_run,
+            resolver=resolver,
+        )
+        return 0, delete_message
 
-            _LOGGER.info(msg)
+    if not (server_info.get("metadata") or {}).get("deployed") and not force:
+        return (
+            0,
+            "The VM was not created with ewccli therefore is not deleted automatically with this command."
+            " Use --force if you want to delete it anyway.",
+        )
 
+    sc_pre, msg_pre, pre_outputs = pre_delete_server(
+        openstack_backend=openstack_backend,
+        openstack_api=openstack_api,
+        federee=federee,
+        server_name=server_name,
+        server_info=server_info,
+        dry_run=dry_run,
+    )
+
+    if sc_pre != 0:
+        return 1, msg_pre
+
+    _LOGGER.info(msg_pre)
+
+    external_ip_machine = pre_outputs["external_ip_machine"]
+    volumes = pre_outputs["volumes"]
+
+    tasks = {}
+    dependencies = {}
+
+    if external_ip_machine:
+        _LOGGER.info(
+            f"Detaching external IP {external_ip_machine} from server {server_name}"
+        )
+        tasks["floating_ip"] = lambda: openstack_backend.remove_external_ip(
+            conn=openstack_api,
+            server=server_info,
+            external_ip=external_ip_machine,
+        )
+
+    if volumes:
+        tasks["detach_volumes"] = lambda: openstack_backend.detach_volumes_from_server(
+            conn=openstack_api,
+            server_id=server_info.get("id"),
+            volumes=volumes,
+            wait_time_s=600,
+            delete=False,
+        )
+
+    dependencies["server"] = list(tasks)
+    tasks["server"] = lambda: openstack_backend.delete_server(
+        conn=openstack_api,
+        server_name=server_name,
+        force=force,
+        resolver=resolver,
+    )
+
+    if volumes:
+        dependencies["delete_volumes"] = ["server"]
+        tasks["delete_volumes"] = lambda: openstack_backend.delete_volumes(
+            conn=openstack_api,
+            volumes=volumes,
+            wait_time_s=600,
+        )
+
+    outcomes = run_task_graph(
+        tasks, dependencies=dependencies, succeeded=lambda result: result[0].success
+    )
+
+    errors = []
+    for step, outcome in outcomes.items():
+        if outcome.status == "done":
+            _LOGGER.info(outcome.result[-1])
+        elif outcome.status == "failed":
+            errors.append(f"{step}: {outcome.error or outcome.result[-1]}")
         else:
-            _LOGGER.info("No ewccli volumes found for this server.")
+            errors.append(f"{step}: skipped")
+
+    if errors:
+        return 1, f"[Delete server] {server_name} teardown failed: " + "; ".join(errors)
 
-    return 0, "Pre delete server steps finished successfully"
+    return 0, outcomes["server"].result[-1]
@@ -0,0 +1,62 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""CLI EWC lazy command group: import subcommands only when they run."""
+
+import importlib
+from typing import Dict, Optional, Tuple
+
+import rich_click as click
+
+
+class LazyGroup(click.RichGroup):
+    """Click group resolving its subcommands on first use.
+
+    Subcommands are declared as ``{name: ("package.module:attribute", "short help")}``.
+    Until a subcommand is invoked only a lightweight placeholder carrying its help
+    text is registered, so ``--help``, ``version`` and shell completion never pay
+    for the import of the subcommand module and of the backend SDKs behind it.
+    """
+
+    def __init__(
+        self,
+        *args,
+        lazy_subcommands: Optional[Dict[str, Tuple[str, str]]] = None,
+        **kwargs,
+    ):
+        super().__init__(*args, **kwargs)
+        self.lazy_subcommands = dict(lazy_subcommands or {})
+
+        for cmd_name, (_, cmd_help) in self.lazy_subcommands.items():
+            self.commands[cmd_name] = click.RichCommand(
+                name=cmd_name, help=cmd_help, add_help_option=False
+            )
+
+    def resolve_command(self, ctx, args):
+        """Resolve the command and import it if it is still a placeholder."""
+        cmd_name, cmd, remaining_args = super().resolve_command(ctx, args)
+
+        if cmd_name in self.lazy_subcommands:
+            cmd = self._load_lazy_command(cmd_name)
+
+        return cmd_name, cmd, remaining_args
+
+    def _load_lazy_command(self, cmd_name: str) -> click.Command:
+        """Import a lazy subcommand and replace its placeholder."""
+        import_path, _ = self.lazy_subcommands.pop(cmd_name)
+        module_name, attribute_name = import_path.split(":", 1)
+        command = getattr(importlib.import_module(module_name), attribute_name)
+
+        if not isinstance(command, click.Command):
+            raise ValueError(
+                f"Lazy loading of '{import_path}' failed: it is not a click Command."
+            )
+
+        self.commands[cmd_name] = command
+
+        return command
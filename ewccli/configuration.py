@@ -20,6 +20,8 @@ class EWCCLIConfiguration:
 
     EWC_CLI_HUB_ITEMS_URL = "https://raw.githubusercontent.com/ewcloud/ewc-community-hub/refs/heads/main/items.yaml"
     EWC_CLI_HUB_DOWNLOAD_ITEMS = bool(int(os.getenv("EWC_CLI_HUB_DOWNLOAD_ITEMS", 0)))
+    # Seconds before the hub items file is revalidated in background
+    EWC_CLI_HUB_ITEMS_TTL = int(os.getenv("EWC_CLI_HUB_ITEMS_TTL", 24 * 60 * 60))
 
     home_dir = Path.home()
 
@@ -40,6 +42,23 @@ class EWCCLIConfiguration:
     EWC_CLI_DEFAULT_PATH_INPUTS = EWC_CLI_BASE_PATH / "inputs"
     EWC_CLI_DEFAULT_PATH_OUTPUTS = EWC_CLI_BASE_PATH / "outputs"
 
+    # Per-profile caches (Keystone tokens, ...)
+    EWC_CLI_CACHE_PATH = EWC_CLI_BASE_PATH / "cache"
+    EWC_CLI_TOKEN_CACHE = bool(int(os.getenv("EWC_CLI_TOKEN_CACHE", 1)))
+    EWC_CLI_TOPOLOGY_CACHE = bool(int(os.getenv("EWC_CLI_TOPOLOGY_CACHE", 1)))
+    EWC_CLI_TOPOLOGY_CACHE_TTL = int(
+        os.getenv("EWC_CLI_TOPOLOGY_CACHE_TTL", 24 * 60 * 60)
+    )
+    # Local inventory of the resources managed by the ewccli, refreshed in background after the TTL
+    EWC_CLI_INVENTORY = bool(int(os.getenv("EWC_CLI_INVENTORY", 1)))
+    EWC_CLI_INVENTORY_TTL = int(os.getenv("EWC_CLI_INVENTORY_TTL", 5 * 60))
+
+    # Maximum number of concurrent Openstack requests
+    EWC_CLI_MAX_WORKERS = int(os.getenv("EWC_CLI_MAX_WORKERS", 8))
+
+    # Unbound floating IPs kept reserved for the ewccli, 0 disables the pool
+    EWC_CLI_FLOATING_IP_POOL_SIZE = int(os.getenv("EWC_CLI_FLOATING_IP_POOL_SIZE", 0))
+
     # CPU images
     EWC_CLI_CPU_IMAGES = [
         "Rocky-8",
@@ -9,62 +9,46 @@
 """European Weather Cloud (EWC) CLI."""
 
 from importlib.metadata import version, PackageNotFoundError
-from typing import Optional
 import rich_click as click
 
 from ewccli import __title__
-from ewccli.commands.login_command import init_command, init_options
-
-# Multiple backends
-from ewccli.commands.hub.hub_command import ewc_hub_command
-
-# Openstack backend
-from ewccli.commands.infra_command import ewc_infra_command
-
-# Crossplane backend
-# from ewccli.commands.k8s_command import ewc_k8s_command
-# from ewccli.commands.dns_command import ewc_dns_command
-# from ewccli.commands.s3_command import ewc_s3_command
-
+from ewccli.commands.lazy_group import LazyGroup
 from ewccli.configuration import config as ewc_hub_config
 
 
 CONTEXT_SETTINGS = dict(help_option_names=["-h", "--help"])
 
-
-@click.group(context_settings=CONTEXT_SETTINGS)
+# Subcommands are imported only when invoked, keeping `ewc --help` and `ewc version` fast
+LAZY_SUBCOMMANDS = {
+    "login": (
+        "ewccli.commands.login_command:ewc_login_command",
+        "Initialize configuration for EWC CLI.",
+    ),
+    # Multiple backends
+    "hub": (
+        "ewccli.commands.hub.hub_command:ewc_hub_command",
+        "EWC Community Hub commands group.",
+    ),
+    # Openstack backend
+    "infra": (
+        "ewccli.commands.infra_command:ewc_infra_command",
+        "EWC Infrastructure commands group.",
+    ),
+    # Crossplane backend
+    # "k8s": ("ewccli.commands.k8s_command:ewc_k8s_command", "EWC Kubernetes commands group."),
+    # "dns": ("ewccli.commands.dns_command:ewc_dns_command", "EWC DNS commands group."),
+    # "s3": ("ewccli.commands.s3_command:ewc_s3_command", "EWC S3 commands group."),
+}
+
+
+@click.group(
+    cls=LazyGroup, lazy_subcommands=LAZY_SUBCOMMANDS, context_settings=CONTEXT_SETTINGS
+)
 def cli():
     """European Weather Cloud (EWC) CLI."""
     pass
 
 
-@cli.command(name="login", help="Initialize configuration for EWC CLI.")
-@init_options
-def init(
-    application_credential_id: str,
-    application_credential_secret: str,
-    ssh_public_key_path: str,
-    ssh_private_key_path: str,
-    tenant_name: str,
-    federee: str,
-    region: str,
-    profile: Optional[str] = None,
-    # token: str,
-):
-    """Login command."""
-    init_command(
-        application_credential_id=application_credential_id,
-        application_credential_secret=application_credential_secret,
-        ssh_public_key_path=ssh_public_key_path,
-        ssh_private_key_path=ssh_private_key_path,
-        tenant_name=tenant_name,
-        federee=federee,
-        profile=profile,
-        region=region,
-        # token=token,
-    )
-
-
 def get_version():
     """
     Return the version of the installed package.
@@ -100,13 +84,5 @@ def version_cmd():
     click.echo(get_version())
 
 
-# Register subcommands
-cli.add_command(ewc_hub_command)
-cli.add_command(ewc_infra_command)
-# cli.add_command(ewc_k8s_command)
-# cli.add_command(ewc_dns_command)
-# cli.add_command(ewc_s3_command)
-
-
 if __name__ == "__main__":
     cli(prog_name=f"{ewc_hub_config.EWC_CLI_NAME}")
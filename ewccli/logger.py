@@ -15,8 +15,9 @@ from rich.logging import RichHandler
 from ewccli.configuration import config as ewc_hub_config
 
 
-# Optionally use rich Console globally
-console = Console()
+# Optionally use rich Console globally.
+# Logs go to stderr, so stdout only carries the command output (e.g. JSON).
+console = Console(stderr=True)
 
 
 class UTCFormatter(logging.Formatter):
@@ -6,6 +6,7 @@
 # See the LICENSE file for more details
 
 
+import openstack
 import pytest
 from types import SimpleNamespace
 from unittest.mock import MagicMock
@@ -13,6 +14,8 @@ from unittest.mock import ANY
 
 from ewccli.backends.openstack.backend_ostack import OpenstackBackend
 from ewccli.backends.openstack.backend_ostack import ExtraVolumesResult
+from ewccli.backends.openstack.retry import RetryPolicy
+from ewccli.configuration import config as ewc_hub_config
 
 
 @pytest.fixture
@@ -74,14 +77,18 @@ def test_create_volumes_success(backend, fake_conn):
         make_volume("vol1", status="creating"),
         make_volume("vol2", status="creating"),
     ]
+    for vol in created:
+        vol.id = vol.name
     fake_conn.block_storage.create_volume.side_effect = created
 
-    # Mock wait_for_status → returns ready volumes
+    # Mock volumes listing → returns ready volumes
     ready = [
         make_volume("vol1", status="available"),
         make_volume("vol2", status="available"),
     ]
-    fake_conn.block_storage.wait_for_status.side_effect = ready
+    for vol in ready:
+        vol.id = vol.name
+    fake_conn.block_storage.volumes.return_value = ready
 
     res, vols, msg = backend.create_volumes(
         conn=fake_conn,
@@ -126,7 +133,9 @@ def test_delete_volumes_dry_run(backend, fake_conn):
 
 def test_delete_volumes_success(backend, fake_conn):
     vol = make_volume("vol1", metadata={"ewccli": "true"})
-    fake_conn.block_storage.volumes.return_value = [vol]
+    vol.id = "vol1"
+    # Volume found, then gone at the first poll
+    fake_conn.block_storage.volumes.side_effect = [[vol], []]
 
     res, deleted, msg = backend.delete_volumes(
         conn=fake_conn,
@@ -134,7 +143,7 @@ def test_delete_volumes_success(backend, fake_conn):
     )
 
     fake_conn.block_storage.delete_volume.assert_called_once_with(vol, ignore_missing=True)
-    fake_conn.block_storage.wait_for_delete.assert_called_once()
+    assert fake_conn.block_storage.volumes.call_count == 2
 
     assert res.success is True
     assert res.changed is True
@@ -144,6 +153,7 @@ def test_delete_volumes_success(backend, fake_conn):
 
 def test_delete_volumes_failure(backend, fake_conn):
     vol = make_volume("vol1", metadata={"ewccli": "true"})
+    vol.id = "vol1"
     fake_conn.block_storage.volumes.return_value = [vol]
 
     # First attempt fails, second attempt fails → error recorded
@@ -161,9 +171,223 @@ def test_delete_volumes_failure(backend, fake_conn):
     assert "failed" in msg
 
 
+@pytest.mark.parametrize("attached", [1, 10])
+def test_detach_volumes_lists_attachments_once(backend, fake_conn, attached):
+    volumes = [
+        SimpleNamespace(id=f"vol{idx}", name=f"vol{idx}") for idx in range(attached)
+    ]
+    fake_conn.compute = MagicMock()
+    fake_conn.compute.volume_attachments.return_value = [
+        SimpleNamespace(id=f"att{idx}", volume_id=f"vol{idx}")
+        for idx in range(attached)
+    ]
+
+    res, detached, _ = backend.detach_volumes_from_server(
+        conn=fake_conn, server_id="server-1", volumes=volumes, delete=False
+    )
+
+    assert res.success is True
+    assert detached == [vol.id for vol in volumes]
+    fake_conn.compute.volume_attachments.assert_called_once_with("server-1")
+    assert fake_conn.compute.delete_volume_attachment.call_count == attached
+
+
+@pytest.mark.parametrize("interfaces", [1, 10])
+def test_remove_network_lists_networks_once(backend, interfaces):
+    conn = MagicMock()
+    conn.network.networks.return_value = [
+        SimpleNamespace(id="net-target", name="private-2")
+    ]
+    conn.compute.server_interfaces.return_value = [
+        SimpleNamespace(net_id=f"net-{idx}", port_id=f"port-{idx}")
+        for idx in range(interfaces - 1)
+    ] + [SimpleNamespace(net_id="net-target", port_id="port-target")]
+    server = SimpleNamespace(name="vm1")
+
+    result = backend.remove_network(conn=conn, server=server, network_name="private-2")
+
+    assert result.success is True and result.changed is True
+    conn.network.networks.assert_called_once_with(name="private-2")
+    conn.network.get_network.assert_not_called()
+    conn.compute.delete_server_interface.assert_called_once_with(server, "port-target")
+
+
+class FakeServer(dict):
+    """Server behaving like the openstacksdk resources (dict and attributes)."""
+
+    __getattr__ = dict.get
+
+
+def make_floating_ip(fip_id, tags=(), revision_number=1):
+    return SimpleNamespace(
+        id=fip_id,
+        floating_ip_address=f"136.0.0.{fip_id[-1]}",
+        port_id=None,
+        tags=list(tags),
+        revision_number=revision_number,
+    )
+
+
+def test_add_external_ip_binds_pool_floating_ip_first(backend, monkeypatch):
+    # The pool is not refilled on the deploy path
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_FLOATING_IP_POOL_SIZE", 3)
+    conn = MagicMock()
+    conn.network.find_network.return_value = SimpleNamespace(
+        id="net-external", name="external"
+    )
+    conn.network.ports.return_value = [SimpleNamespace(id="port-1")]
+    unpooled = make_floating_ip("fip-1")
+    taken = make_floating_ip("fip-2", tags=["ewccli-pool"])
+    pooled = make_floating_ip("fip-3", tags=["ewccli-pool"], revision_number=4)
+    conn.network.ips.return_value = [unpooled, taken, pooled]
+
+    def update_ip(floating_ip, if_revision=None, **attrs):
+        # fip-2 was bound by another deployment since the listing
+        if floating_ip is taken:
+            raise openstack.exceptions.PreconditionFailedException()
+        return floating_ip
+
+    conn.network.update_ip.side_effect = update_ip
+    conn.network.get_ip.return_value = SimpleNamespace(
+        id="fip-3", floating_ip_address="136.0.0.3", port_id="port-1", status="ACTIVE"
+    )
+    conn.network.get_port.return_value = SimpleNamespace(id="port-1", status="ACTIVE")
+    server = FakeServer(name="vm", id="srv-1", addresses={"private": []})
+
+    result, _, floating_ip = backend.add_external_ip(
+        conn=conn, server=server, federee="EUMETSAT"
+    )
+
+    assert result.success is True and result.changed is True
+    assert floating_ip.id == "fip-3"
+    conn.network.ips.assert_called_once_with(
+        floating_network_id="net-external", status="DOWN"
+    )
+    assert [c.args[0].id for c in conn.network.update_ip.call_args_list] == [
+        "fip-2",
+        "fip-3",
+    ]
+    assert conn.network.update_ip.call_args.kwargs == {
+        "if_revision": 4,
+        "port_id": "port-1",
+    }
+    conn.network.create_ip.assert_not_called()
+
+
+def test_fill_floating_ip_pool(backend):
+    conn = MagicMock()
+    conn.network.find_network.return_value = SimpleNamespace(
+        id="net-external", name="external"
+    )
+    conn.network.ips.return_value = [make_floating_ip("fip-1", tags=["ewccli-pool"])]
+
+    result, msg = backend.fill_floating_ip_pool(conn, federee="EUMETSAT", size=3)
+
+    assert result.success is True and result.changed is True
+    assert msg == "Reserved 2 floating IPs in the pool."
+    conn.network.ips.assert_called_once_with(
+        floating_network_id="net-external", tags="ewccli-pool"
+    )
+    assert conn.network.create_ip.call_count == 2
+    conn.network.set_tags.assert_called_with(
+        conn.network.create_ip.return_value, ["ewccli-pool"]
+    )
+
+
+def test_fill_floating_ip_pool_releases_untagged_floating_ip(backend):
+    conn = MagicMock()
+    conn.network.find_network.return_value = SimpleNamespace(
+        id="net-external", name="external"
+    )
+    conn.network.ips.return_value = []
+    conn.network.set_tags.side_effect = openstack.exceptions.HttpException("tags")
+
+    result, _ = backend.fill_floating_ip_pool(conn, federee="EUMETSAT", size=1)
+
+    assert result.success is False
+    conn.network.delete_ip.assert_called_once_with(
+        conn.network.create_ip.return_value, ignore_missing=True
+    )
+
+
 #############################################################
 #############################################################
 
+
+def create_server(backend, conn, monkeypatch):
+    monkeypatch.setattr(
+        backend,
+        "resolve_server_inputs",
+        lambda **_: SimpleNamespace(
+            image=SimpleNamespace(id="img-1"),
+            flavour=SimpleNamespace(id="flavor-1"),
+            networks=[SimpleNamespace(id="net-1")],
+            security_groups={"ssh": SimpleNamespace(name="ssh")},
+            errors=[],
+        ),
+    )
+    resolver = MagicMock()
+    resolver.get_server.return_value = None
+
+    return backend.create_server(
+        conn=conn,
+        server_name="vm",
+        image_name="Rocky-9",
+        flavour_name="small",
+        networks=("private",),
+        keypair_name="kp",
+        sec_groups=("ssh",),
+        resolver=resolver,
+        retry_policy=RetryPolicy(attempts=2, initial_delay_s=0),
+    )
+
+
+def test_create_server_post_error_is_not_retried(backend, monkeypatch):
+    conn = MagicMock()
+    # Nova may have booted the server before answering 502
+    conn.compute.create_server.side_effect = openstack.exceptions.HttpException(
+        "Bad Gateway", http_status=502
+    )
+
+    result, message, _ = create_server(backend, conn, monkeypatch)
+
+    assert not result.success
+    assert "HttpException" in message
+    conn.compute.create_server.assert_called_once()
+
+
+def test_create_server_retried_once_broken_server_deleted(backend, monkeypatch):
+    conn = MagicMock()
+    server = SimpleNamespace(id="srv-1", name="vm")
+    conn.compute.create_server.return_value = server
+    conn.compute.wait_for_server.side_effect = [
+        openstack.exceptions.ResourceFailure("ERROR"),
+        server,
+    ]
+
+    result, _, new_server = create_server(backend, conn, monkeypatch)
+
+    assert result.success and new_server is server
+    conn.compute.delete_server.assert_called_once_with(server)
+    assert conn.compute.create_server.call_count == 2
+
+
+def test_create_server_not_retried_while_broken_server_remains(backend, monkeypatch):
+    conn = MagicMock()
+    conn.compute.wait_for_server.side_effect = openstack.exceptions.ResourceFailure(
+        "ERROR"
+    )
+    conn.compute.wait_for_delete.side_effect = openstack.exceptions.ResourceTimeout(
+        "delete"
+    )
+
+    result, message, _ = create_server(backend, conn, monkeypatch)
+
+    assert not result.success
+    assert message == "ResourceFailure (vm)"
+    conn.compute.create_server.assert_called_once()
+
+
 def test_ssh_key_matches_openstack_true(tmp_path, backend):
     """
     Test that matching keys return True.
@@ -8,6 +8,7 @@
 
 """Tests for EWC commands common methods."""
 
+import threading
 from unittest.mock import MagicMock
 from unittest.mock import patch
 import pytest
@@ -18,6 +19,7 @@ from ewccli.tests.ewccli_base_test import SecurityGroup
 from ewccli.tests.ewccli_base_test import ServerInfo
 
 from ewccli.enums import Federee
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
 from ewccli.configuration import EWCCLIConfiguration as ewc_hub_config
 from ewccli.commands.commons_infra import get_deployed_server_info
 from ewccli.commands.commons_infra import resolve_image_and_flavor
@@ -26,6 +28,8 @@ from ewccli.commands.commons_infra import pre_deploy_server_setup
 from ewccli.commands.commons_infra import identify_server_reconfiguration
 from ewccli.commands.commons_infra import deploy_server
 from ewccli.commands.commons_infra import post_deploy_server_setup
+from ewccli.commands.commons_infra import select_servers
+from ewccli.commands.commons_infra import create_servers_command
 
 
 
@@ -41,7 +45,12 @@ class FakeOpenstackBackend:
     def __init__(self, *args, **kwargs):
         pass  # skip real OpenStack connection
 
-    def find_latest_image(self, conn, prefix: str, federee: str, region: str):
+    def create_resolver(self, conn, refresh_cache: bool = False):
+        return OpenstackResourceResolver(conn)
+
+    def find_latest_image(
+        self, conn, prefix: str, federee: str, region: str, resolver=None
+    ):
         """
         Fake backend implementation that simulates the real find_latest_image()
         but without calling OpenStack.
@@ -639,10 +648,11 @@ def test_identify_server_reconfiguration_existing_server(conn):
     }
 
     fake_server = MagicMock()
+    fake_server.name = "vm1"
     fake_server.metadata = {"deployed": "ewccli"}
     fake_server.image = MagicMock(id="img123")
 
-    conn.get_server.return_value = fake_server
+    conn.compute.servers.return_value = [fake_server]
     conn.compute.find_image.return_value = MagicMock(name="Ubuntu-22.04")
 
     with patch(
@@ -674,9 +684,10 @@ def test_identify_server_reconfiguration_wrong_origin(conn):
     }
 
     fake_server = MagicMock()
+    fake_server.name = "vm1"
     fake_server.metadata = {"deployed": "manual"}  # NOT ewccli
 
-    conn.get_server.return_value = fake_server
+    conn.compute.servers.return_value = [fake_server]
 
     code, msg, outputs = identify_server_reconfiguration(
         conn,
@@ -688,6 +699,30 @@ def test_identify_server_reconfiguration_wrong_origin(conn):
     assert "not been deployed with the EWC CLI" in msg
     assert outputs == {}
 
+def test_identify_server_reconfiguration_uses_backend_resolver(conn):
+    backend = MagicMock()
+    backend.create_resolver.return_value.get_server.return_value = None
+    server_inputs = {
+        "server_name": "vm1",
+        "keypair_name": "mykey",
+        "networks": ("private",),
+        "security_groups": ("ssh",),
+    }
+    pre_deploy_server_outputs = {
+        "resolved_image_name": "Ubuntu-22.04",
+        "resolved_flavour_name": "m1.small",
+    }
+
+    code, _, _ = identify_server_reconfiguration(
+        conn, server_inputs, pre_deploy_server_outputs, openstack_backend=backend
+    )
+
+    assert code == 0
+    # The resolver of the backend shares the topology cache
+    backend.create_resolver.assert_called_once_with(conn)
+    backend.create_resolver.return_value.get_server.assert_called_once_with("vm1")
+
+
 def test_deploy_server_success(conn):
     backend = MagicMock()
 
@@ -757,7 +792,7 @@ def test_post_deploy_server_setup_success(conn):
 
     # server returned after refresh
     refreshed_server_info = MagicMock()
-    conn.get_server.return_value = refreshed_server_info
+    conn.compute.get_server.return_value = refreshed_server_info
 
     with patch(
         "ewccli.commands.commons_infra.resolve_machine_ip",
@@ -877,4 +912,95 @@ def test_create_server_command_success(conn):
     mock_pre.assert_called_once()
     mock_identify.assert_called_once()
     mock_deploy.assert_called_once()
-    
\ No newline at end of file
+
+
+# --- select_servers ----------------------------------------------------------
+SELECTABLE_SERVERS = [
+    {"id": "id-1", "name": "test-a", "metadata": {"deployed": "ewccli"}},
+    {"id": "id-2", "name": "test-b", "metadata": {}},
+    {"id": "id-3", "name": "prod-a", "metadata": {"deployed": "ewccli"}},
+]
+
+
+@pytest.mark.parametrize(
+    "names, regex, selector, expected_ids, unmatched",
+    [
+        (("test-a", "id-3"), False, None, ["id-1", "id-3"], []),
+        (("test-*",), False, None, ["id-1", "id-2"], []),
+        (("test-*",), False, {"deployed": "ewccli"}, ["id-1"], []),
+        ((r"(test|prod)-a",), True, None, ["id-1", "id-3"], []),
+        ((), False, {"deployed": "ewccli"}, ["id-1", "id-3"], []),
+        (("test-a", "missing-*"), False, None, ["id-1"], ["missing-*"]),
+    ],
+)
+def test_select_servers(names, regex, selector, expected_ids, unmatched):
+    servers, not_found = select_servers(
+        SELECTABLE_SERVERS, names=names, regex=regex, selector=selector
+    )
+
+    assert [server["id"] for server in servers] == expected_ids
+    assert not_found == unmatched
+
+
+# --- create_servers_command --------------------------------------------------
+def test_create_servers_command_replicas(conn):
+    barrier = threading.Barrier(3, timeout=5)
+    pre_deploy_outputs = {
+        "normalized_image_name": "ubuntu-22.04",
+        "resolved_image_name": "Ubuntu-22.04-20250202020202",
+        "resolved_flavour_name": "m1.small",
+        "security_groups": ("ssh",),
+    }
+
+    def deploy(server_inputs, **_):
+        barrier.wait()
+        if server_inputs["server_name"] == "pool-2":
+            return 1, "quota exceeded", {}
+        return 0, "ok", {"server_info": {"name": server_inputs["server_name"]}}
+
+    def post_deploy(server_inputs, **_):
+        return (
+            0,
+            "ok",
+            {"internal_ip_machine": f"10.0.0.{server_inputs['server_name'][-1]}"},
+        )
+
+    server_inputs = {
+        "server_name": "pool",
+        "keypair_name": "mykey",
+        "networks": ("private",),
+        "security_groups": ("ssh",),
+        "extra_volume": None,
+    }
+
+    with patch(
+        "ewccli.commands.commons_infra.pre_deploy_server_setup",
+        return_value=(0, "ok", pre_deploy_outputs),
+    ) as pre_deploy, patch(
+        "ewccli.commands.commons_infra.identify_server_reconfiguration",
+        return_value=(0, "ok", {}),
+    ), patch(
+        "ewccli.commands.commons_infra.deploy_server", side_effect=deploy
+    ), patch(
+        "ewccli.commands.commons_infra.post_deploy_server_setup",
+        side_effect=post_deploy,
+    ):
+        code, msg, replicas = create_servers_command(
+            openstack_backend=MagicMock(),
+            openstack_api=conn,
+            federee="EUMETSAT",
+            region="WAW3-1",
+            server_inputs=server_inputs,
+            count=3,
+            ssh_public_key_path="id.pub",
+            ssh_private_key_path="id",
+        )
+
+    # Inputs are checked once for all the replicas
+    pre_deploy.assert_called_once()
+    assert code == 1
+    assert "pool-2" in msg
+    assert list(replicas) == ["pool-1", "pool-2", "pool-3"]
+    assert replicas["pool-1"]["internal_ip_machine"] == "10.0.0.1"
+    assert replicas["pool-2"] == {"status_code": 1, "message": "quota exceeded"}
+    assert replicas["pool-3"]["status_code"] == 0
@@ -0,0 +1,225 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Tests for fleet manifests."""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+from unittest.mock import patch
+
+import pytest
+
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.commands.commons_fleet import apply_fleet
+from ewccli.commands.commons_fleet import load_fleet_manifest
+from ewccli.commands.commons_fleet import plan_fleet
+
+MANIFEST = """
+servers:
+  - name: db
+    image: Ubuntu-22.04
+    extra_volumes: [50]
+  - name: cache
+    image: Ubuntu-22.04
+  - name: web
+    image: Ubuntu-22.04
+    external_ip: true
+    depends_on: [db]
+dns:
+  - name: web-dns
+    server: web
+"""
+
+
+@pytest.fixture
+def manifest_path(tmp_path):
+    path = tmp_path / "fleet.yaml"
+    path.write_text(MANIFEST)
+    return path
+
+
+def write_manifest(tmp_path, content):
+    path = tmp_path / "fleet.yaml"
+    path.write_text(content)
+    return path
+
+
+def test_plan_fleet_stages(manifest_path):
+    manifest = load_fleet_manifest(manifest_path, keypair_name="kp")
+
+    assert manifest.dependencies()["web-dns"] == ("web",)
+    assert plan_fleet(manifest) == [["db", "cache"], ["web"], ["web-dns"]]
+
+
+@pytest.mark.parametrize(
+    "content, error",
+    [
+        (
+            "servers:\n  - {name: a, depends_on: [b]}\n  - {name: b, depends_on: [a]}\n",
+            "cycle",
+        ),
+        ("servers:\n  - {name: a, depends_on: [c]}\n", "unknown c"),
+        (
+            "servers:\n  - {name: a}\ndns:\n  - {name: a, server: a}\n",
+            "duplicated names a",
+        ),
+        ("dns:\n  - {name: a-dns, server: a}\n", "unknown server a"),
+        ("servers:\n  - {name: a, extra_volumes: [-1]}\n", "Invalid extra volume size"),
+    ],
+)
+def test_load_fleet_manifest_invalid(tmp_path, content, error):
+    with pytest.raises(ValueError, match=error):
+        load_fleet_manifest(write_manifest(tmp_path, content), keypair_name="kp")
+
+
+def test_apply_fleet(manifest_path):
+    manifest = load_fleet_manifest(manifest_path, keypair_name="kp")
+    # db and cache are independent, so they are deployed together
+    barrier = threading.Barrier(2, timeout=5)
+    conn = MagicMock()
+    cache = SimpleNamespace(id="cache-id", name="cache")
+    conn.compute.servers.side_effect = lambda details, name: (
+        [cache] if name == "^cache$" else []
+    )
+
+    def deploy(server_inputs, **_):
+        if server_inputs["server_name"] == "db":
+            barrier.wait()
+            return 0, "ok", {"server_info": {}}
+        return 1, "quota exceeded", {}
+
+    def identify(**_):
+        barrier.wait()
+        return 0, "No reconfiguration needed.", {}
+
+    pre_deploy_outputs = {
+        "normalized_image_name": "ubuntu-22.04",
+        "security_groups": ("ssh",),
+    }
+
+    with (
+        patch("ewccli.commands.commons_fleet.setup_keypair", return_value=(True, "ok")),
+        patch(
+            "ewccli.commands.commons_fleet.pre_deploy_server_setup",
+            return_value=(0, "ok", pre_deploy_outputs),
+        ) as pre_deploy_server_setup,
+        patch(
+            "ewccli.commands.commons_fleet.identify_server_reconfiguration",
+            side_effect=identify,
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.deploy_server", side_effect=deploy
+        ) as deploy_server,
+        patch(
+            "ewccli.commands.commons_fleet.post_deploy_server_setup",
+            return_value=(0, "ok", {"internal_ip_machine": "10.0.0.1"}),
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.resolve_machine_ip",
+            return_value=(0, "ok", {"internal_ip_machine": "10.0.0.2"}),
+        ),
+    ):
+        outcomes = apply_fleet(
+            openstack_backend=MagicMock(),
+            openstack_api=conn,
+            federee="EUMETSAT",
+            region="WAW3-1",
+            tenancy_name="tenant",
+            manifest=manifest,
+            keypair_name="kp",
+            ssh_public_key_path="id.pub",
+            ssh_private_key_path="id",
+            resolver=OpenstackResourceResolver(conn),
+        )
+
+    assert outcomes["db"].result[2]["result"] == "created"
+    # The existing server matching the manifest is not deployed again
+    assert outcomes["cache"].result[2]["result"] == "unchanged"
+    assert [
+        c.kwargs["server_inputs"]["server_name"] for c in deploy_server.call_args_list
+    ] == ["db", "web"]
+    assert outcomes["web"].status == "failed"
+    assert outcomes["web-dns"].status == "skipped"
+    # As with `ewc infra create`, the servers get the default security groups
+    assert {
+        c.kwargs["server_inputs"]["item_default_security_groups"]
+        for c in pre_deploy_server_setup.call_args_list
+    } == {("ssh",)}
+
+
+def test_apply_fleet_items_sharing_hub_item(tmp_path):
+    manifest = load_fleet_manifest(
+        write_manifest(
+            tmp_path,
+            "servers:\n  - {name: a}\n  - {name: b}\n"
+            "items:\n  - {name: a-mon, item: monitoring, server: a}\n"
+            "  - {name: b-mon, item: monitoring, server: b}\n",
+        ),
+        keypair_name="kp",
+    )
+    hub_items = {"monitoring": {"annotations": {"technology": "Ansible Playbook"}}}
+    running = []
+    overlaps = []
+
+    def run_playbook(server_name, **_):
+        # Both items run in the working directory of the hub item
+        overlaps.append(bool(running))
+        running.append(server_name)
+        time.sleep(0.05)
+        running.remove(server_name)
+        return 0, "ok"
+
+    with (
+        patch("ewccli.commands.commons_fleet.setup_keypair", return_value=(True, "ok")),
+        patch(
+            "ewccli.commands.commons_fleet.pre_deploy_server_setup",
+            return_value=(
+                0,
+                "ok",
+                {"normalized_image_name": "rocky-9", "security_groups": ("ssh",)},
+            ),
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.deploy_server",
+            return_value=(0, "ok", {"server_info": {}}),
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.post_deploy_server_setup",
+            return_value=(0, "ok", {"internal_ip_machine": "10.0.0.1"}),
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.prepare_item_working_directory",
+            return_value=(0, "ok", "/outputs/monitoring"),
+        ),
+        patch(
+            "ewccli.commands.commons_fleet.run_item_playbook", side_effect=run_playbook
+        ) as run_item_playbook,
+    ):
+        conn = MagicMock()
+        conn.compute.servers.return_value = []
+        outcomes = apply_fleet(
+            openstack_backend=MagicMock(),
+            openstack_api=conn,
+            federee="EUMETSAT",
+            region="WAW3-1",
+            tenancy_name="tenant",
+            manifest=manifest,
+            keypair_name="kp",
+            ssh_public_key_path="id.pub",
+            ssh_private_key_path="id",
+            hub_items=hub_items,
+            resolver=OpenstackResourceResolver(conn),
+        )
+
+    assert outcomes["a-mon"].status == outcomes["b-mon"].status == "done"
+    assert sorted(
+        c.kwargs["server_name"] for c in run_item_playbook.call_args_list
+    ) == ["a", "b"]
+    assert overlaps == [False, False]
@@ -10,6 +10,7 @@
 
 from typing import Optional
 
+import openstack
 import pytest
 from pydantic import BaseModel
 from unittest.mock import MagicMock
@@ -55,7 +56,8 @@ def test_find_latest_rocky8_cpu(finder, conn, monkeypatch):
     img_old = FakeImage(name="Rocky-8.9-20250101010101", created_at=now - timedelta(days=10))
     img_new = FakeImage(name="Rocky-8.9-20250202020202", created_at=now)
 
-    conn.compute.images.return_value = [img_old, img_new]
+    # Glance sorts newest first
+    conn.image.images.return_value = [img_new, img_old]
 
     # Correct target to patch!
     monkeypatch.setattr(
@@ -76,7 +78,7 @@ def test_find_latest_ubuntu_2204_cpu(finder, conn, monkeypatch):
     img1 = FakeImage(name="Ubuntu-22.04-20250101010101", created_at=now - timedelta(days=5))
     img2 = FakeImage(name="Ubuntu-22.04-20250303030303", created_at=now)
 
-    conn.compute.images.return_value = [img1, img2]
+    conn.image.images.return_value = [img2, img1]
 
     monkeypatch.setattr(
         "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_CPU_IMAGES",
@@ -96,7 +98,7 @@ def test_find_latest_rocky_gpu(finder, conn, monkeypatch):
     img1 = FakeImage(name="Rocky-9.6-GPU-20250101010101", created_at=now - timedelta(days=3))
     img2 = FakeImage(name="Rocky-9.6-GPU-20250303030303", created_at=now)
 
-    conn.compute.images.return_value = [img1, img2]
+    conn.image.images.return_value = [img2, img1]
 
     monkeypatch.setattr(
         "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_CPU_IMAGES",
@@ -116,7 +118,8 @@ def test_find_latest_ubuntu_gpu(finder, conn, monkeypatch):
     img1 = FakeImage(name="Ubuntu 22.04 NVIDIA_AI", created_at=now - timedelta(days=1))
     img2 = FakeImage(name="Ubuntu 22.04 NVIDIA_AI", created_at=now)
 
-    conn.compute.images.return_value = [img1, img2]
+    # name=..., limit=1: Glance returns the newest image of that name
+    conn.image.images.return_value = [img2]
 
     # Correct GPU mapping shape
     monkeypatch.setattr(
@@ -148,7 +151,7 @@ def test_find_latest_ubuntu_gpu(finder, conn, monkeypatch):
 # ---------------------------------------------------------------------------
 
 def test_no_matching_images(finder, conn, monkeypatch):
-    conn.compute.images.return_value = [
+    conn.image.images.return_value = [
         FakeImage(name="UnrelatedImage", created_at=datetime.utcnow())
     ]
 
@@ -158,6 +161,88 @@ def test_no_matching_images(finder, conn, monkeypatch):
     )
 
     assert finder(None, conn, "Rocky-8", "EUMETSAT", "WAW3-1") is None
+    # A family without image is not found, without scanning every image
+    conn.compute.images.assert_not_called()
+
+
+# ---------------------------------------------------------------------------
+# Server-side filtering
+# ---------------------------------------------------------------------------
+
+
+def test_find_latest_image_server_side(finder, conn, monkeypatch):
+    now = datetime.utcnow()
+    newest_other = FakeImage(name="Ubuntu-24.04-20250404040404", created_at=now)
+    img_new = FakeImage(
+        name="Rocky-9.6-20250303030303", created_at=now - timedelta(days=1)
+    )
+    img_old = FakeImage(
+        name="Rocky-9.5-20250101010101", created_at=now - timedelta(days=10)
+    )
+
+    # Newest first, the listing must not be consumed past the first match
+    listed = []
+
+    def images(**query):
+        for image in (newest_other, img_new, img_old):
+            listed.append(image)
+            yield image
+
+    conn.image.images.side_effect = images
+    monkeypatch.setattr(
+        "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_CPU_IMAGES",
+        {"Rocky-8", "Rocky-9", "Ubuntu-22.04", "Ubuntu-24.04"},
+    )
+
+    assert finder(None, conn, "Rocky-9", "EUMETSAT", "WAW3-1") == img_new
+    conn.image.images.assert_called_once_with(status="active", sort="created_at:desc")
+    assert listed == [newest_other, img_new]
+    conn.compute.images.assert_not_called()
+
+
+def test_find_latest_image_server_side_exact_name(finder, conn, monkeypatch):
+    img = FakeImage(name="Ubuntu 22.04 NVIDIA_AI", created_at=datetime.utcnow())
+    conn.image.images.return_value = [img]
+    monkeypatch.setattr(
+        "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_OS_GPU_IMAGES_SITE_MAP",
+        {"EUMETSAT": {"WAW3-1": "Ubuntu 22.04 NVIDIA_AI"}},
+    )
+
+    assert finder(None, conn, "Ubuntu 22.04 NVIDIA_AI", "EUMETSAT", "WAW3-1") == img
+    conn.image.images.assert_called_once_with(
+        status="active", sort="created_at:desc", name="Ubuntu 22.04 NVIDIA_AI", limit=1
+    )
+    conn.compute.images.assert_not_called()
+
+
+def test_find_latest_image_falls_back_to_client_side(finder, conn, monkeypatch):
+    img = FakeImage(name="Rocky-8.9-20250101010101", created_at=datetime.utcnow())
+    conn.image.images.side_effect = openstack.exceptions.BadRequestException("sort")
+    conn.compute.images.return_value = [img]
+    monkeypatch.setattr(
+        "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_CPU_IMAGES",
+        {"Rocky-8", "Rocky-9", "Ubuntu-22.04", "Ubuntu-24.04"},
+    )
+
+    assert finder(None, conn, "Rocky-8", "EUMETSAT", "WAW3-1") == img
+    conn.compute.images.assert_called_once()
+
+
+def test_find_latest_image_without_image_is_not_found(finder, conn, monkeypatch):
+    conn.image.images.return_value = []
+    monkeypatch.setattr(
+        "ewccli.configuration.EWCCLIConfiguration.EWC_CLI_CPU_IMAGES",
+        {"Rocky-8", "Rocky-9", "Ubuntu-22.04", "Ubuntu-24.04"},
+    )
+
+    assert finder(None, conn, "Rocky-8", "EUMETSAT", "WAW3-1") is None
+    conn.compute.images.assert_not_called()
+
+
+def test_find_latest_image_unknown_family(finder, conn):
+    assert finder(None, conn, "Debian-12", "EUMETSAT", "WAW3-1") is None
+    conn.image.images.assert_not_called()
+    conn.compute.images.assert_not_called()
 
 
 # Pydantic models
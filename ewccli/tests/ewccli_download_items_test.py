@@ -13,14 +13,24 @@ import requests
 
 from ewccli.configuration import config as ewc_hub_config
 from ewccli.utils import download_items
+from ewccli.utils import refresh_items
+from ewccli.utils import load_items_metadata
 
 
 class DummyResponse:
     """Dummy response object for mocking requests.get."""
 
-    def __init__(self, text: str = "dummy content", raise_exc: Exception = None):
+    def __init__(
+        self,
+        text: str = "dummy content",
+        raise_exc: Exception = None,
+        status_code: int = 200,
+        headers: dict = None,
+    ):
         self.text = text
         self._raise_exc = raise_exc
+        self.status_code = status_code
+        self.headers = headers or {}
 
     def raise_for_status(self):
         """Raise exception if configured, else succeed."""
@@ -121,3 +131,132 @@ def test_download_handles_request_exception(temp_config, monkeypatch, caplog):
     download_items(force=True)
 
     assert "connection error" in caplog.text
+
+
+def test_download_sends_conditional_request(temp_config, monkeypatch):
+    """
+    Test that `download_items` revalidates with the stored ETag/Last-Modified.
+    """
+    calls = []
+
+    def fake_get(*a, **kw):
+        calls.append(kw.get("headers"))
+        if kw.get("headers"):
+            return DummyResponse("", status_code=304, headers={"ETag": '"v1"'})
+        return DummyResponse(
+            "v1 content",
+            headers={"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"},
+        )
+
+    monkeypatch.setattr("requests.get", fake_get)
+
+    download_items(force=False)
+    download_items(force=True)
+
+    assert calls[0] == {}
+    assert calls[1] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Oct 2025 10:00:00 GMT",
+    }
+    # 304 keeps the existing copy
+    assert ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH.read_text() == "v1 content"
+    assert load_items_metadata(ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH)["etag"] == '"v1"'
+
+
+def test_download_keeps_validators_omitted_by_304(temp_config, monkeypatch):
+    """
+    Test that `download_items` keeps the stored validators when a 304 omits them.
+    """
+    validators = {"ETag": '"v1"', "Last-Modified": "Wed, 01 Oct 2025 10:00:00 GMT"}
+    responses = iter(
+        [
+            DummyResponse("v1 content", headers=validators),
+            DummyResponse("", status_code=304),
+        ]
+    )
+    calls = []
+
+    def fake_get(*a, **kw):
+        calls.append(kw.get("headers"))
+        return next(responses, DummyResponse("", status_code=304))
+
+    monkeypatch.setattr("requests.get", fake_get)
+
+    download_items(force=False)
+    download_items(force=True)
+    download_items(force=True)
+
+    metadata = load_items_metadata(ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH)
+    assert metadata["etag"] == '"v1"'
+    assert metadata["last_modified"] == "Wed, 01 Oct 2025 10:00:00 GMT"
+    assert calls[2] == {
+        "If-None-Match": '"v1"',
+        "If-Modified-Since": "Wed, 01 Oct 2025 10:00:00 GMT",
+    }
+
+
+def test_download_ignores_unwritable_metadata(temp_config, monkeypatch, caplog):
+    """
+    Test that `download_items` keeps the download when the metadata cannot be saved.
+    """
+    # A directory in place of the metadata file makes the write fail
+    (temp_config / "items.yaml.meta.json").mkdir()
+    monkeypatch.setattr("requests.get", lambda *a, **kw: DummyResponse("data"))
+
+    download_items(force=False)
+
+    assert ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH.read_text() == "data"
+    assert "Could not save items metadata" in caplog.text
+    assert list(temp_config.glob("*.tmp")) == []
+
+
+def test_refresh_downloads_missing_file_synchronously(temp_config, monkeypatch):
+    """
+    Test that `refresh_items` blocks only when there is no local copy.
+    """
+    monkeypatch.setattr("requests.get", lambda *a, **kw: DummyResponse("data"))
+    monkeypatch.setattr(
+        "subprocess.Popen", lambda *a, **kw: pytest.fail("Should not be called")
+    )
+
+    refresh_items(ttl_s=3600)
+
+    assert ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH.read_text() == "data"
+
+
+def test_refresh_skips_fresh_file(temp_config, monkeypatch):
+    """
+    Test that `refresh_items` does not touch the network within the TTL.
+    """
+    monkeypatch.setattr("requests.get", lambda *a, **kw: DummyResponse("data"))
+    download_items()
+
+    monkeypatch.setattr(
+        "requests.get", lambda *a, **kw: pytest.fail("Should not be called")
+    )
+    monkeypatch.setattr(
+        "subprocess.Popen", lambda *a, **kw: pytest.fail("Should not be called")
+    )
+
+    refresh_items(ttl_s=3600)
+
+
+def test_refresh_stale_file_in_background(temp_config, monkeypatch):
+    """
+    Test that `refresh_items` serves a stale copy and refreshes it in background once.
+    """
+    item_file = ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH
+    item_file.write_text("stale content")
+    spawned = []
+
+    monkeypatch.setattr(
+        "requests.get", lambda *a, **kw: pytest.fail("Should not be called")
+    )
+    monkeypatch.setattr("subprocess.Popen", lambda *a, **kw: spawned.append(a))
+
+    refresh_items(ttl_s=3600)
+    # A refresh is already running
+    refresh_items(ttl_s=3600)
+
+    assert len(spawned) == 1
+    assert item_file.read_text() == "stale content"
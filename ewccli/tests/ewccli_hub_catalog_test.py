@@ -0,0 +1,190 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test compiled EWC Hub catalogue."""
+
+import os
+import time
+
+import pytest
+import yaml
+
+from ewccli.configuration import config as ewc_hub_config
+from ewccli.commands.hub import hub_catalog
+from ewccli.commands.hub.hub_catalog import load_hub_catalog
+
+
+def make_item(index: int) -> dict:
+    """Build a synthetic hub item."""
+    return {
+        "displayName": f"Item {index}",
+        "version": f"1.{index}.0",
+        "summary": f"Synthetic item number {index} for testing.",
+        "description": "Lorem ipsum dolor sit amet. " * 2,
+        "maintainers": [{"name": f"Maintainer {index % 7}", "email": "m@example.com"}],
+        "annotations": {
+            "category": "Compute,Data Access",
+            "technology": "Ansible Playbook",
+            "others": "EWCCLI-compatible",
+        },
+        "cli": {
+            "inputs": [
+                {"name": f"input_{n}", "type": "str", "default": f"value_{n}"}
+                for n in range(2)
+            ]
+        },
+    }
+
+
+def write_catalog(path, n_items: int):
+    """Write a synthetic catalogue with `n_items` items."""
+    path.write_text(
+        yaml.safe_dump(
+            {"spec": {"items": {f"item-{i}": make_item(i) for i in range(n_items)}}},
+            sort_keys=False,
+        )
+    )
+
+
+@pytest.fixture(autouse=True)
+def cache_root(tmp_path, monkeypatch):
+    """Redirect the EWC CLI caches to a temporary directory."""
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+def test_load_hub_catalog_builds_and_reuses_cache(tmp_path, monkeypatch):
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 10)
+
+    items = load_hub_catalog(catalog_path)
+    assert len(items) == 10
+    assert items["item-3"] == make_item(3)
+
+    # Second load must not parse the YAML again
+    monkeypatch.setattr(
+        hub_catalog,
+        "parse_hub_items",
+        lambda *a, **kw: pytest.fail("Should not be called"),
+    )
+    cached_items = load_hub_catalog(catalog_path)
+
+    assert "item-3" in cached_items
+    assert cached_items["item-3"] == make_item(3)
+    assert dict(cached_items.items()) == dict(items.items())
+    assert cached_items.version == items.version
+
+
+def test_load_hub_catalog_only_materialises_requested_item(tmp_path):
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 10)
+    load_hub_catalog(catalog_path)
+
+    items = load_hub_catalog(catalog_path)
+    items["item-5"]
+
+    assert list(items._items) == ["item-5"]
+
+
+def test_load_hub_catalog_invalidated_on_change(tmp_path):
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 10)
+    load_hub_catalog(catalog_path)
+
+    write_catalog(catalog_path, 12)
+    items = load_hub_catalog(catalog_path)
+
+    assert len(items) == 12
+    assert len(list((tmp_path / "cache" / "hub").glob("*.data"))) == 1
+
+
+def test_load_hub_catalog_touched_file_keeps_cache(tmp_path, monkeypatch):
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 10)
+    load_hub_catalog(catalog_path)
+
+    stat = catalog_path.stat()
+    os.utime(catalog_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+    monkeypatch.setattr(
+        hub_catalog,
+        "parse_hub_items",
+        lambda *a, **kw: pytest.fail("Should not be called"),
+    )
+
+    assert len(load_hub_catalog(catalog_path)) == 10
+
+
+@pytest.mark.parametrize(
+    "content, error",
+    [
+        ("", "empty"),
+        ("foo: bar", "spec key is missing"),
+        ("spec: {foo: bar}", "items key is missing"),
+    ],
+)
+def test_load_hub_catalog_malformed(tmp_path, content, error):
+    catalog_path = tmp_path / "items.yaml"
+    catalog_path.write_text(content)
+
+    with pytest.raises(ValueError, match=error):
+        load_hub_catalog(catalog_path)
+
+
+def test_compiled_catalog_with_thousands_of_items(tmp_path, monkeypatch):
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 2000)
+    load_hub_catalog(catalog_path)
+
+    # On a warm cache the compiled catalogue is used, the YAML is not parsed
+    monkeypatch.setattr(
+        yaml, "load", lambda *a, **kw: pytest.fail("Should not be called")
+    )
+    items = load_hub_catalog(catalog_path)
+
+    assert items["item-1999"] == make_item(1999)
+    assert list(items._items) == ["item-1999"]
+    assert len(dict(load_hub_catalog(catalog_path).items())) == 2000
+
+
+@pytest.mark.skipif(
+    not os.getenv("EWC_CLI_BENCHMARK"),
+    reason="benchmark, set EWC_CLI_BENCHMARK=1 to run it",
+)
+def test_benchmark_compiled_catalog(tmp_path):
+    """Benchmark YAML parsing against the compiled catalogue on thousands of items."""
+    catalog_path = tmp_path / "items.yaml"
+    write_catalog(catalog_path, 2000)
+
+    start = time.perf_counter()
+    with open(catalog_path) as f:
+        yaml.safe_load(f)
+    yaml_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    load_hub_catalog(catalog_path)
+    build_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    items = load_hub_catalog(catalog_path)
+    items["item-1999"]
+    show_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    all_items = dict(load_hub_catalog(catalog_path).items())
+    list_s = time.perf_counter() - start
+
+    print(
+        f"\n2000 items: pure Python yaml {yaml_s * 1000:.1f} ms,"
+        f" compile {build_s * 1000:.1f} ms,"
+        f" cached single item {show_s * 1000:.2f} ms,"
+        f" cached all items {list_s * 1000:.1f} ms"
+    )
+
+    assert len(all_items) == 2000
+    assert show_s * 10 < yaml_s
+    assert list_s < yaml_s
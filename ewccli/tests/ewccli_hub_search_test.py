@@ -0,0 +1,168 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test EWC Hub search."""
+
+import time
+
+import pytest
+import yaml
+from click.testing import CliRunner
+
+from ewccli.ewccli import cli
+from ewccli.configuration import config as ewc_hub_config
+from ewccli.commands.hub import hub_search
+from ewccli.commands.hub.hub_catalog import load_hub_catalog
+from ewccli.commands.hub.hub_search import load_search_index
+from ewccli.commands.hub.hub_search import search_hub_items
+
+ITEMS = {
+    "ssh-bastion": {
+        "displayName": "SSH Bastion",
+        "summary": "Jump host for your tenancy",
+        "description": "Hardened SSH bastion.",
+        "maintainers": [{"name": "EUMETSAT", "email": "a@example.com"}],
+        "annotations": {
+            "category": "Security",
+            "technology": "Ansible Playbook",
+            "others": "Deployable,EWCCLI-compatible",
+        },
+    },
+    "jupyterhub-gpu": {
+        "displayName": "JupyterHub GPU",
+        "summary": "Notebooks on GPU flavours",
+        "description": "JupyterHub with CUDA drivers.",
+        "maintainers": [{"name": "ECMWF", "email": "b@example.com"}],
+        "annotations": {
+            "category": "GPU-accelerated,Data Science",
+            "technology": "Ansible Playbook",
+            "others": "Deployable,EWCCLI-compatible",
+        },
+    },
+    "gpu-cluster": {
+        "displayName": "GPU cluster",
+        "summary": "Kubernetes cluster with GPU nodes",
+        "description": "Terraform based cluster.",
+        "maintainers": [{"name": "ECMWF", "email": "c@example.com"}],
+        "annotations": {
+            "category": "GPU-accelerated",
+            "technology": "Terraform Module",
+            "others": "Deployable",
+        },
+    },
+}
+
+
+@pytest.fixture
+def catalog_path(tmp_path, monkeypatch):
+    """Write a catalogue and redirect the EWC CLI caches to a temporary directory."""
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path / "cache")
+    path = tmp_path / "items.yaml"
+    path.write_text(yaml.safe_dump({"spec": {"items": ITEMS}}, sort_keys=False))
+    return path
+
+
+@pytest.fixture
+def search_index(catalog_path):
+    return load_search_index(load_hub_catalog(catalog_path))
+
+
+@pytest.mark.parametrize(
+    "kwargs, expected",
+    [
+        ({}, ["ssh-bastion", "jupyterhub-gpu", "gpu-cluster"]),
+        ({"query": ["gpu"]}, ["jupyterhub-gpu", "gpu-cluster"]),
+        ({"query": ["jup"]}, ["jupyterhub-gpu"]),
+        ({"query": ["ecmwf", "terraform"]}, ["gpu-cluster"]),
+        ({"query": ["eumetsat"]}, ["ssh-bastion"]),
+        ({"technology": "ansible playbook"}, ["ssh-bastion", "jupyterhub-gpu"]),
+        (
+            {
+                "technology": "Ansible Playbook",
+                "category": "GPU-accelerated",
+                "ewccli_compatible": True,
+            },
+            ["jupyterhub-gpu"],
+        ),
+        (
+            {"category": "GPU-accelerated", "ewccli_compatible": True},
+            ["jupyterhub-gpu"],
+        ),
+        ({"query": ["nothing"]}, []),
+    ],
+)
+def test_search_hub_items(search_index, kwargs, expected):
+    assert search_hub_items(search_index, **kwargs) == expected
+
+
+def test_search_index_is_persisted_per_catalog_version(catalog_path, monkeypatch):
+    load_search_index(load_hub_catalog(catalog_path))
+
+    monkeypatch.setattr(
+        hub_search,
+        "build_search_index",
+        lambda *a, **kw: pytest.fail("Should not be called"),
+    )
+    assert load_search_index(load_hub_catalog(catalog_path))["terms"]
+
+
+def test_search_index_rebuilt_on_new_catalog_version(catalog_path):
+    load_search_index(load_hub_catalog(catalog_path))
+
+    catalog_path.write_text(
+        yaml.safe_dump({"spec": {"items": {"new-item": ITEMS["ssh-bastion"]}}})
+    )
+    search_index = load_search_index(load_hub_catalog(catalog_path))
+
+    assert search_hub_items(search_index, query=["bastion"]) == ["new-item"]
+
+
+def test_search_is_fast_on_large_catalog(tmp_path, monkeypatch):
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path / "cache")
+    path = tmp_path / "items.yaml"
+    items = {f"{name}-{i}": item for i in range(1000) for name, item in ITEMS.items()}
+    path.write_text(yaml.safe_dump({"spec": {"items": items}}))
+    search_index = load_search_index(load_hub_catalog(path))
+
+    start = time.perf_counter()
+    for _ in range(100):
+        matches = search_hub_items(
+            search_index,
+            query=["jupyter"],
+            category="GPU-accelerated",
+            ewccli_compatible=True,
+        )
+    elapsed_per_query = (time.perf_counter() - start) / 100
+
+    assert len(matches) == 1000
+    assert elapsed_per_query < 0.005
+
+
+def test_search_cmd(catalog_path, monkeypatch):
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_HUB_ITEMS_PATH", catalog_path)
+    monkeypatch.setattr(
+        "ewccli.commands.hub.hub_command.refresh_items", lambda *a, **kw: None
+    )
+    runner = CliRunner()
+
+    result = runner.invoke(
+        cli,
+        [
+            "hub",
+            "--path-to-catalog",
+            str(catalog_path),
+            "search",
+            "--category",
+            "GPU-accelerated",
+        ],
+    )
+
+    assert result.exit_code == 0
+    assert "jupyterhub-gpu" in result.output
+    assert "gpu-cluster" in result.output
+    assert "ssh-bastion" not in result.output
@@ -8,6 +8,11 @@
 
 """Tests for EWC infra command."""
 
+import csv
+import io
+import json
+import threading
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import MagicMock
@@ -15,7 +20,15 @@ from types import SimpleNamespace
 
 from ewccli.ewccli import cli
 from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.backend_ostack import DetachVolumesResult
+from ewccli.backends.openstack.backend_ostack import ExternalIPResult
+from ewccli.backends.openstack.backend_ostack import ExtraVolumesResult
+from ewccli.backends.openstack.backend_ostack import ServerResult
+from ewccli.commands.infra_command import delete_server_command
+from ewccli.commands.infra_command import delete_servers_command
 from ewccli.commands.infra_command import pre_delete_server
+from ewccli.commands.infra_command import write_servers
+from ewccli.configuration import config as ewc_hub_config
 
 
 # -----------------------------
@@ -51,6 +64,11 @@ def make_server(**kwargs):
     return FakeServer(**kwargs)
 
 
+def list_servers(backend, conn, **kwargs):
+    """Rows of the servers listed by iter_servers, by ID."""
+    return {row["id"]: row for row in backend.iter_servers(conn, **kwargs)}
+
+
 # -------------------------
 # Tests
 # -------------------------
@@ -75,9 +93,13 @@ def test_basic_server(conn, backend):
     image = make_server(id="img1", name="ubuntu")
 
     conn.compute.servers.return_value = [server]
-    conn.compute.images.return_value = [image]
+    conn.image.get_image.return_value = image
 
-    result = backend.list_servers(conn, show_all=False, federee="EUMETSAT")
+    result = list_servers(backend, conn, show_all=False, federee="EUMETSAT")
+
+    # Only the referenced image is resolved
+    conn.image.get_image.assert_called_once_with("img1")
+    conn.compute.images.assert_not_called()
 
     assert "1" in result
     assert result["1"]["name"] == "group2"
@@ -102,7 +124,7 @@ def test_security_groups_none(conn, backend):
     conn.compute.servers.return_value = [server]
     conn.compute.images.return_value = []
 
-    result = backend.list_servers(conn, show_all=True)
+    result = list_servers(backend, conn, show_all=True)
 
     assert result["1"]["security-groups"] == ""
 
@@ -128,7 +150,7 @@ def test_multiple_networks(conn, backend):
     conn.compute.servers.return_value = [server]
     conn.compute.images.return_value = []
 
-    result = backend.list_servers(conn, show_all=True, federee="EUMETSAT")
+    result = list_servers(backend, conn, show_all=True, federee="EUMETSAT")
 
     networks = result["1"]["networks"]
 
@@ -152,7 +174,7 @@ def test_filtered_by_metadata(conn, backend):
     conn.compute.servers.return_value = [server]
     conn.compute.images.return_value = []
 
-    result = backend.list_servers(conn, show_all=False)
+    result = list_servers(backend, conn, show_all=False)
 
     assert result == {}
 
@@ -173,7 +195,7 @@ def test_show_all(conn, backend):
     conn.compute.servers.return_value = [server]
     conn.compute.images.return_value = []
 
-    result = backend.list_servers(conn, show_all=True)
+    result = list_servers(backend, conn, show_all=True)
 
     assert "1" in result
 
@@ -194,11 +216,346 @@ def test_error_server(conn, backend):
     conn.compute.servers.return_value = [server]
     conn.compute.images.return_value = []
 
-    result = backend.list_servers(conn, show_all=True)
+    result = list_servers(backend, conn, show_all=True)
 
     assert result["1"]["status"] == "ERROR"
 
 
+def test_iter_servers_filters_tag_server_side(conn, backend):
+    server = make_server(
+        id="1",
+        name="tagged",
+        status="ACTIVE",
+        metadata={},
+        tags=["ewccli"],
+        image=None,
+        key_name="test-keypair",
+        flavor={"original_name": "vm"},
+        addresses={},
+        security_groups=[],
+    )
+
+    conn.compute.servers.return_value = [server]
+    conn.compute.images.return_value = []
+
+    assert "1" in list_servers(backend, conn, show_all=False)
+    conn.compute.servers.assert_called_once_with(tags="ewccli")
+
+    conn.compute.servers.reset_mock()
+    list_servers(backend, conn, show_all=True)
+    conn.compute.servers.assert_called_once_with()
+
+
+def test_iter_servers_lists_legacy_servers_until_migrated(
+    conn, tmp_path, monkeypatch, caplog
+):
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path)
+    backend = OpenstackBackend(
+        application_credential_id="cred",
+        application_credential_secret="secret",
+        auth_url="https://auth",
+    )
+    fields = dict(
+        status="ACTIVE",
+        image=None,
+        key_name="kp",
+        flavor={"original_name": "vm"},
+        addresses={},
+        security_groups=[],
+        metadata={"deployed": "ewccli"},
+    )
+    legacy = make_server(id="1", name="legacy", tags=[], **fields)
+    tagged = make_server(id="2", name="tagged", tags=["ewccli"], **fields)
+    conn.compute.servers.return_value = [legacy, tagged]
+
+    # Servers deployed by older versions are still listed, with a hint to tag them
+    assert list(list_servers(backend, conn)) == ["1", "2"]
+    conn.compute.servers.assert_called_once_with()
+    assert "ewc infra migrate-tags" in caplog.text
+
+    backend.tag_legacy_servers(conn)
+    conn.compute.servers.reset_mock()
+    conn.compute.servers.return_value = [tagged]
+
+    assert list(list_servers(backend, conn)) == ["2"]
+    conn.compute.servers.assert_called_once_with(tags="ewccli")
+
+
+def test_tag_legacy_servers(conn, backend):
+    legacy = make_server(
+        id="1", name="legacy", metadata={"deployed": "ewccli"}, tags=[]
+    )
+    tagged = make_server(
+        id="2", name="tagged", metadata={"deployed": "ewccli"}, tags=["ewccli"]
+    )
+    manual = make_server(id="3", name="manual", metadata={}, tags=[])
+    conn.compute.servers.return_value = [legacy, tagged, manual]
+
+    result, names, msg = backend.tag_legacy_servers(conn, dry_run=True)
+
+    assert result.changed is False
+    assert "legacy" in msg
+    conn.compute.add_tag_to_server.assert_not_called()
+
+    result, names, msg = backend.tag_legacy_servers(conn)
+
+    assert result.success is True and result.changed is True
+    assert names == ["legacy"]
+    conn.compute.add_tag_to_server.assert_called_once_with(legacy, "ewccli")
+
+
+def test_iter_servers_streams_rows(conn, backend):
+    first_row_rendered = threading.Event()
+
+    def servers(**_):
+        for idx in range(3):
+            if idx == 1:
+                # The next page is only listed once the first row is rendered
+                assert first_row_rendered.wait(timeout=5)
+            yield make_server(
+                id=str(idx),
+                name=f"vm-{idx}",
+                status="ACTIVE",
+                metadata={"deployed": "ewccli"},
+                image={"id": "img1" if idx < 2 else "img2"},
+                key_name="kp",
+                flavor={"original_name": "vm"},
+                addresses={},
+                security_groups=[],
+            )
+
+    conn.compute.servers.side_effect = servers
+    conn.image.get_image.side_effect = lambda image_id: make_server(
+        id=image_id, name=f"name-{image_id}"
+    )
+
+    rows = []
+    for row in backend.iter_servers(conn, federee="EUMETSAT"):
+        rows.append(row)
+        first_row_rendered.set()
+
+    assert [(row["name"], row["image"]) for row in rows] == [
+        ("vm-0", "name-img1"),
+        ("vm-1", "name-img1"),
+        ("vm-2", "name-img2"),
+    ]
+    assert conn.image.get_image.call_count == 2
+
+
+@pytest.mark.parametrize("output", ["json", "ndjson", "csv"])
+def test_write_servers(capsys, output):
+    rows = [
+        {
+            "id": "1",
+            "name": "vm-1",
+            "status": "ACTIVE",
+            "networks": "private (10.0.0.1)\nexternal",
+        },
+        {"id": "2", "name": "vm-2", "status": "ERROR", "networks": ""},
+    ]
+
+    write_servers(iter(rows), output=output)
+    out = capsys.readouterr().out
+
+    if output == "json":
+        parsed = json.loads(out)
+    elif output == "ndjson":
+        parsed = [json.loads(line) for line in out.splitlines()]
+    else:
+        parsed = list(csv.DictReader(io.StringIO(out)))
+
+    assert [(row["id"], row["name"], row["networks"]) for row in parsed] == [
+        ("1", "vm-1", "private (10.0.0.1)\nexternal"),
+        ("2", "vm-2", ""),
+    ]
+
+
+def test_write_servers_empty_json(capsys):
+    write_servers(iter([]), output="json")
+
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def make_teardown_backend(server_success=True):
+    """Backend recording the teardown steps, the first two waiting for each other."""
+    steps = []
+    barrier = threading.Barrier(2, timeout=5)
+    backend = MagicMock()
+
+    def remove_external_ip(**_):
+        barrier.wait()
+        steps.append("floating_ip")
+        return ExternalIPResult(True, True), "floating IP released"
+
+    def detach_volumes_from_server(**kwargs):
+        assert kwargs["delete"] is False
+        barrier.wait()
+        steps.append("detach_volumes")
+        return DetachVolumesResult(True, True), ["vol1"], "volumes detached"
+
+    def delete_server(**_):
+        steps.append("server")
+        return ServerResult(server_success, server_success, 0), "server deleted"
+
+    def delete_volumes(**_):
+        steps.append("delete_volumes")
+        return ExtraVolumesResult(True, True), [], "volumes deleted"
+
+    backend.remove_external_ip.side_effect = remove_external_ip
+    backend.detach_volumes_from_server.side_effect = detach_volumes_from_server
+    backend.delete_server.side_effect = delete_server
+    backend.delete_volumes.side_effect = delete_volumes
+    return backend, steps
+
+
+def teardown_server_info():
+    return {
+        "id": "server-123",
+        "attached_volumes": [{"id": "vol1"}],
+        "addresses": {
+            "private": [
+                {"addr": "10.0.0.98", "OS-EXT-IPS:type": "fixed"},
+                {"addr": "64.225.131.199", "OS-EXT-IPS:type": "floating"},
+            ]
+        },
+        "metadata": {"deployed": "ewccli"},
+    }
+
+
+def test_delete_server_teardown_graph():
+    backend, steps = make_teardown_backend()
+    api = MagicMock()
+    api.block_storage.volumes.return_value = [
+        SimpleNamespace(id="vol1", metadata={"ewccli": "true", "server_name": "vm1"})
+    ]
+
+    rc, msg = delete_server_command(
+        openstack_backend=backend,
+        openstack_api=api,
+        federee="EUMETSAT",
+        server_name="vm1",
+        server_info=teardown_server_info(),
+    )
+
+    assert rc == 0
+    assert msg == "server deleted"
+    # Floating IP and volumes are released concurrently, before the server deletion
+    assert set(steps[:2]) == {"floating_ip", "detach_volumes"}
+    assert steps[2:] == ["server", "delete_volumes"]
+
+
+def test_delete_server_teardown_failure_skips_volume_deletion():
+    backend, steps = make_teardown_backend(server_success=False)
+    api = MagicMock()
+    api.block_storage.volumes.return_value = [
+        SimpleNamespace(id="vol1", metadata={"ewccli": "true", "server_name": "vm1"})
+    ]
+
+    rc, msg = delete_server_command(
+        openstack_backend=backend,
+        openstack_api=api,
+        federee="EUMETSAT",
+        server_name="vm1",
+        server_info=teardown_server_info(),
+    )
+
+    assert rc == 1
+    assert "server: server deleted" in msg and "delete_volumes: skipped" in msg
+    backend.delete_volumes.assert_not_called()
+
+
+def test_delete_server_not_created_by_ewccli():
+    backend, steps = make_teardown_backend()
+    server_info = dict(teardown_server_info(), metadata={})
+
+    rc, msg = delete_server_command(
+        openstack_backend=backend,
+        openstack_api=MagicMock(),
+        federee="EUMETSAT",
+        server_name="vm1",
+        server_info=server_info,
+    )
+
+    assert rc == 0
+    assert "--force" in msg
+    assert steps == []
+
+
+def test_delete_servers_concurrently():
+    barrier = threading.Barrier(2, timeout=5)
+    backend = MagicMock()
+
+    def delete_server(server_name, **_):
+        barrier.wait()
+        if server_name == "vm-broken":
+            return (
+                ServerResult(False, False, 1),
+                f"ResourceTimeout/delete ({server_name})",
+            )
+        return ServerResult(True, True, 0), f"({server_name}) deleted successfully."
+
+    backend.delete_server.side_effect = delete_server
+    addresses = {"private": [{"addr": "10.0.0.98", "OS-EXT-IPS:type": "fixed"}]}
+    servers = [
+        {
+            "id": "id-1",
+            "name": "vm-ok",
+            "metadata": {"deployed": "ewccli"},
+            "addresses": addresses,
+        },
+        {
+            "id": "id-2",
+            "name": "vm-broken",
+            "metadata": {"deployed": "ewccli"},
+            "addresses": addresses,
+        },
+        {"id": "id-3", "name": "vm-manual", "metadata": {}, "addresses": addresses},
+    ]
+
+    results = delete_servers_command(
+        openstack_backend=backend,
+        openstack_api=MagicMock(),
+        federee="EUMETSAT",
+        servers=servers,
+        max_workers=2,
+    )
+
+    assert results["id-1"] == ("deleted", "(vm-ok) deleted successfully.")
+    assert results["id-2"][0] == "failed"
+    assert results["id-3"][0] == "skipped"
+    assert backend.delete_server.call_count == 2
+
+
+@pytest.mark.parametrize("attached", [1, 10])
+def test_pre_delete_server_lists_volumes_once(attached):
+    api = MagicMock()
+    owned = {"ewccli": "true", "server_name": "vm1"}
+    # The root disk is attached but was not created by the ewccli for the server
+    api.block_storage.volumes.return_value = [
+        SimpleNamespace(id=f"vol{idx}", metadata=owned) for idx in range(attached)
+    ]
+    server_info = dict(
+        teardown_server_info(),
+        attached_volumes=[{"id": "root"}]
+        + [{"id": f"vol{idx}"} for idx in range(attached)],
+    )
+
+    rc, _, outputs = pre_delete_server(
+        openstack_backend=MagicMock(),
+        openstack_api=api,
+        federee="EUMETSAT",
+        server_name="vm1",
+        server_info=server_info,
+    )
+
+    assert rc == 0
+    assert [vol.id for vol in outputs["volumes"]] == [
+        f"vol{idx}" for idx in range(attached)
+    ]
+    api.block_storage.volumes.assert_called_once_with(details=True, metadata=owned)
+    api.block_storage.get_volume.assert_not_called()
+
+
 # class FakeVolume:
 #     def __init__(self, vol_id, metadata):
 #         self.id = vol_id
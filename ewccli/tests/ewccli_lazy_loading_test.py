@@ -0,0 +1,90 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test lazy loading of the CLI subcommands."""
+
+import json
+import subprocess
+import sys
+
+import pytest
+from click.testing import CliRunner
+
+from ewccli.ewccli import cli
+
+# Generous budget for the cold paths: they used to take well over a second
+_IMPORT_TIME_BUDGET_SECONDS = 1.0
+
+_HEAVY_MODULES = (
+    "openstack",
+    "ansible_runner",
+    "kubernetes",
+    "prompt_toolkit",
+    "pydantic",
+    "cryptography",
+    "ewccli.commands.hub.hub_command",
+    "ewccli.commands.infra_command",
+    "ewccli.commands.login_command",
+)
+
+_PROBE = """
+import json
+import sys
+import time
+
+start = time.perf_counter()
+from ewccli.ewccli import cli
+
+try:
+    cli({args!r}, prog_name="ewc")
+except SystemExit:
+    pass
+elapsed = time.perf_counter() - start
+heavy = [m for m in {heavy!r} if m in sys.modules]
+print(json.dumps({{"elapsed": elapsed, "heavy": heavy}}))
+"""
+
+
+def _run_probe(args):
+    """Run the CLI in a fresh interpreter and report imports and timing."""
+    result = subprocess.run(
+        [sys.executable, "-c", _PROBE.format(args=args, heavy=_HEAVY_MODULES)],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+@pytest.mark.parametrize("args", [["version"], ["--help"], []])
+def test_cold_paths_do_not_import_subcommands(args):
+    """Cold paths must not import subcommand modules or backend SDKs."""
+    report = _run_probe(args)
+
+    assert report["heavy"] == []
+    assert report["elapsed"] < _IMPORT_TIME_BUDGET_SECONDS
+
+
+def test_help_lists_lazy_subcommands():
+    """Top level help lists lazy subcommands without loading them."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["--help"])
+
+    assert result.exit_code == 0
+    for name in ("hub", "infra", "login", "version"):
+        assert name in result.output
+
+
+def test_subcommand_is_loaded_on_invocation():
+    """Invoking a subcommand imports it and replaces the placeholder."""
+    runner = CliRunner()
+    result = runner.invoke(cli, ["infra", "--help"])
+
+    assert result.exit_code == 0
+    assert "create" in result.output
+    assert "delete" in result.output
@@ -0,0 +1,49 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test concurrent execution of Openstack operations."""
+
+import pytest
+
+from ewccli.backends.openstack.concurrency import run_task_graph
+
+
+def test_run_task_graph_skips_dependents_of_failed_tasks():
+    def fail():
+        raise RuntimeError("boom")
+
+    outcomes = run_task_graph(
+        tasks={"a": lambda: 1, "b": fail, "c": lambda: 3, "d": lambda: 4},
+        dependencies={"c": ["a"], "d": ["b", "c"]},
+    )
+
+    assert outcomes["a"].status == "done" and outcomes["a"].result == 1
+    assert outcomes["b"].status == "failed" and str(outcomes["b"].error) == "boom"
+    assert outcomes["c"].status == "done"
+    assert outcomes["d"].status == "skipped"
+
+
+def test_run_task_graph_rejects_cycles():
+    with pytest.raises(ValueError):
+        run_task_graph(
+            tasks={"a": lambda: 1, "b": lambda: 2},
+            dependencies={"a": ["b"], "b": ["a"]},
+        )
+
+
+def test_run_task_graph_skips_transitively_in_reverse_order():
+    def fail():
+        raise RuntimeError("boom")
+
+    outcomes = run_task_graph(
+        tasks={"c": lambda: 3, "b": lambda: 2, "a": fail},
+        dependencies={"c": ["b"], "b": ["a"]},
+    )
+
+    assert outcomes["a"].status == "failed"
+    assert outcomes["b"].status == outcomes["c"].status == "skipped"
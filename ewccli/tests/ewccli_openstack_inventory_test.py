@@ -0,0 +1,210 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test the local inventory of the Openstack resources."""
+
+import json
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.inventory import Inventory
+from ewccli.backends.openstack.inventory import InventoryError
+from ewccli.backends.openstack.inventory import get_inventory_file
+from ewccli.commands import infra_command
+from ewccli.configuration import config as ewc_hub_config
+
+
+class FakeServer(SimpleNamespace):
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def make_server(
+    server_id, status="ACTIVE", updated_at="2026-01-01T00:00:00Z", image_id="img-1"
+):
+    return FakeServer(
+        id=server_id,
+        name=f"vm-{server_id}",
+        status=status,
+        tags=["ewccli"],
+        metadata={"deployed": "ewccli"},
+        image={"id": image_id},
+        flavor={"original_name": "eo1.small"},
+        key_name="ewc-key",
+        addresses={"private": [{"addr": "10.0.0.1"}]},
+        security_groups=[{"name": "ssh"}],
+        updated_at=updated_at,
+    )
+
+
+@pytest.fixture
+def inventory(tmp_path):
+    inventory = Inventory(
+        get_inventory_file("cred", "https://keystone/", cache_path=tmp_path)
+    )
+    yield inventory
+    inventory.close()
+
+
+def test_inventory_records_and_forgets_servers(inventory):
+    assert inventory.age_s() is None
+
+    server = {"id": "srv-1", "name": "vm", "status": "ACTIVE", "security-groups": "ssh"}
+    inventory.sync(
+        [server],
+        volumes=[],
+        floating_ips=[],
+        keypairs=[],
+        full=True,
+        changes_since="T1",
+    )
+    inventory.put_server(
+        {**server, "name": "vm-renamed"},
+        volumes=[
+            {
+                "id": "vol-1",
+                "name": "vm-vol",
+                "size": 10,
+                "status": "in-use",
+                "server_id": "srv-1",
+            }
+        ],
+        floating_ips=[
+            {"address": "136.0.0.1", "status": "ACTIVE", "server_id": "srv-1"}
+        ],
+    )
+
+    assert [(row["name"], row["security-groups"]) for row in inventory.servers()] == [
+        ("vm-renamed", "ssh")
+    ]
+    assert inventory.get_meta("changes_since") == "T1"
+    assert inventory.age_s() < 60
+
+    inventory.remove_server("srv-1")
+
+    assert inventory.servers() == []
+    assert inventory.resources("volumes") == []
+    assert inventory.resources("floating_ips") == []
+
+
+def test_refresh_inventory_applies_changes_since(inventory):
+    conn = MagicMock()
+    conn.compute.servers.return_value = [make_server("srv-1"), make_server("srv-2")]
+    conn.compute.keypairs.return_value = [
+        SimpleNamespace(name="ewc-key", fingerprint="aa:bb"),
+        SimpleNamespace(name="other-key", fingerprint="cc:dd"),
+    ]
+    conn.network.ips.return_value = [
+        SimpleNamespace(
+            id="fip-1",
+            floating_ip_address="136.0.0.1",
+            status="ACTIVE",
+            port_details={"device_id": "srv-1"},
+            tags=[],
+        ),
+        SimpleNamespace(
+            id="fip-2",
+            floating_ip_address="136.0.0.2",
+            status="ACTIVE",
+            port_details={"device_id": "foreign"},
+            tags=[],
+        ),
+    ]
+    conn.block_storage.volumes.return_value = [
+        SimpleNamespace(
+            id="vol-1",
+            name="vm-vol",
+            size=10,
+            status="in-use",
+            attachments=[{"server_id": "srv-2"}],
+        ),
+    ]
+    conn.image.get_image.return_value = SimpleNamespace(name="Rocky-9")
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    assert backend.refresh_inventory(conn, inventory, federee="ECMWF")
+
+    conn.compute.servers.assert_called_once_with(tags="ewccli")
+    assert [row["id"] for row in inventory.servers()] == ["srv-1", "srv-2"]
+    assert inventory.servers()[0]["image"] == "Rocky-9"
+    assert [fip["id"] for fip in inventory.resources("floating_ips")] == ["fip-1"]
+    assert inventory.resources("keypairs") == [
+        {"name": "ewc-key", "fingerprint": "aa:bb"}
+    ]
+    assert inventory.resources("volumes")[0]["server_id"] == "srv-2"
+
+    # srv-1 deleted and srv-3 created since the last refresh
+    conn.compute.servers.reset_mock()
+    conn.compute.servers.return_value = [
+        make_server("srv-1", status="DELETED", updated_at="2026-01-02T00:00:00Z"),
+        make_server("srv-3", updated_at="2026-01-03T00:00:00Z"),
+    ]
+
+    assert backend.refresh_inventory(conn, inventory, federee="ECMWF")
+
+    conn.compute.servers.assert_called_once_with(changes_since="2026-01-01T00:00:00Z")
+    assert [row["id"] for row in inventory.servers()] == ["srv-2", "srv-3"]
+    assert inventory.get_meta("changes_since") == "2026-01-03T00:00:00Z"
+    # The image of the servers already inventoried is not resolved again
+    conn.image.get_image.assert_called_once_with("img-1")
+    assert inventory.resources("floating_ips") == []
+
+
+@pytest.mark.parametrize("stale", [False, True])
+def test_list_cached_servers(inventory, monkeypatch, capsys, stale):
+    inventory.sync([{"id": "srv-1", "name": "vm", "status": "ACTIVE"}], full=True)
+    if stale:
+        monkeypatch.setattr(ewc_hub_config, "EWC_CLI_INVENTORY_TTL", -1)
+    refreshes = []
+    monkeypatch.setattr(
+        infra_command,
+        "refresh_inventory_in_background",
+        lambda **kwargs: refreshes.append(kwargs),
+    )
+    backend = MagicMock()
+    backend.open_inventory.return_value = inventory
+    ctx = SimpleNamespace(openstack_backend=backend, cli_profile={"profile": "default"})
+    connect = MagicMock()
+
+    started = time.monotonic()
+    infra_command.list_cached_servers(
+        ctx, federee="ECMWF", output="json", connect=connect
+    )
+
+    assert time.monotonic() - started < 1
+    assert json.loads(capsys.readouterr().out)[0]["name"] == "vm"
+    # Openstack is not queried, only the detached refresh once stale
+    connect.assert_not_called()
+    backend.refresh_inventory.assert_not_called()
+    assert refreshes == (
+        [{"profile": "default", "inventory_file": inventory.inventory_file}]
+        if stale
+        else []
+    )
+
+
+def test_open_inventory_ignores_corrupted_database(tmp_path, monkeypatch):
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path)
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+    backend.credential_id, backend.auth_url, backend.profile = (
+        "cred",
+        "https://keystone/",
+        "default",
+    )
+    inventory_file = get_inventory_file("cred", "https://keystone/", profile="default")
+    inventory_file.parent.mkdir(parents=True, exist_ok=True)
+    inventory_file.write_bytes(b"not a database" * 100)
+
+    with pytest.raises(InventoryError):
+        Inventory(inventory_file)
+
+    assert backend.open_inventory() is None
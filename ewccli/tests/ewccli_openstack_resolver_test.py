@@ -0,0 +1,407 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test Openstack resource resolver."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import openstack
+import pytest
+
+from ewccli.backends.openstack import waiters
+from ewccli.backends.openstack.backend_ostack import KeyPairResult
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.commands import commons_infra
+from ewccli.commands.commons_infra import CreateServerInputs
+from ewccli.commands.commons_infra import create_server_command
+
+
+class FakeServer(dict):
+    """Server behaving like the openstacksdk resources (dict and attributes)."""
+
+    __getattr__ = dict.get
+
+
+def test_resolver_memoizes_lookups():
+    conn = MagicMock()
+    conn.compute.find_flavor.return_value = SimpleNamespace(id="f-1", name="small")
+    resolver = OpenstackResourceResolver(conn)
+
+    assert resolver.find_flavor("small") is resolver.find_flavor("small")
+    assert resolver.find_flavor("f-1").name == "small"
+    conn.compute.find_flavor.assert_called_once_with("small")
+
+
+def test_resolver_listing_resolves_unique_names_only():
+    conn = MagicMock()
+    conn.network.networks.return_value = [
+        SimpleNamespace(id="n-1", name="private"),
+        SimpleNamespace(id="n-2", name="shared"),
+        SimpleNamespace(id="n-3", name="shared"),
+    ]
+    resolver = OpenstackResourceResolver(conn)
+
+    assert len(resolver.networks()) == 3
+    assert resolver.find_network("private").id == "n-1"
+    assert resolver.find_network("n-3").name == "shared"
+    conn.network.find_network.assert_not_called()
+
+    # Ambiguous names are left to the API
+    resolver.find_network("shared")
+    conn.network.find_network.assert_called_once_with("shared")
+    resolver.networks()
+    conn.network.networks.assert_called_once()
+
+
+def test_resolver_forget():
+    conn = MagicMock()
+    conn.compute.find_image.return_value = None
+    resolver = OpenstackResourceResolver(conn)
+
+    assert resolver.find_image("missing") is None
+    resolver.forget("image", "missing")
+    resolver.find_image("missing")
+
+    assert conn.compute.find_image.call_count == 2
+
+
+def test_resolver_get_server_exact_name_then_id():
+    conn = MagicMock()
+    server = SimpleNamespace(id="7c9e6679-7425-40de-944b-e07fc1f90ae7", name="vm.1")
+    # Nova matches the filter as a regular expression, e.g. vm.10 for vm.1
+    conn.compute.servers.return_value = [
+        server,
+        SimpleNamespace(id="other", name="vm.10"),
+    ]
+    conn.compute.get_server.return_value = server
+    resolver = OpenstackResourceResolver(conn)
+
+    assert resolver.get_server("vm.1") is server
+    assert resolver.get_server("vm.1") is server
+    assert resolver.get_server(server.id) is server
+
+    conn.compute.servers.assert_called_once_with(details=True, name=r"^vm\.1$")
+    assert conn.compute.get_server.call_count == 2
+
+    resolver.forget_server(server.id)
+    conn.compute.servers.return_value = []
+    assert resolver.get_server("vm.1") is None
+
+
+def test_resolver_get_server_duplicated_names():
+    conn = MagicMock()
+    conn.compute.servers.return_value = [
+        SimpleNamespace(id="a", name="vm"),
+        SimpleNamespace(id="b", name="vm"),
+    ]
+
+    with pytest.raises(openstack.exceptions.SDKException, match="Multiple matches"):
+        OpenstackResourceResolver(conn).get_server("vm")
+
+
+def test_find_security_groups_single_listing():
+    conn = MagicMock()
+    conn.network.security_groups.side_effect = lambda name=None, id=None: [
+        sg
+        for sg in (
+            SimpleNamespace(id="sg-1", name="ssh"),
+            SimpleNamespace(id="sg-2", name="http"),
+        )
+        if sg.name in (name or ()) or sg.id in (id or ())
+    ]
+    resolver = OpenstackResourceResolver(conn)
+
+    found, missing = resolver.find_security_groups(["ssh", "sg-2", "ssh"])
+
+    assert {key: sg.id for key, sg in found.items()} == {"ssh": "sg-1", "sg-2": "sg-2"}
+    assert missing == []
+    assert conn.network.security_groups.call_count == 2
+
+    # Already resolved
+    resolver.find_security_groups(["ssh"])
+    assert conn.network.security_groups.call_count == 2
+
+
+def test_check_server_inputs_reports_all_missing_security_groups():
+    conn = MagicMock()
+    conn.network.security_groups.return_value = [
+        SimpleNamespace(id="sg-1", name="ssh", description=None)
+    ]
+    resolver = OpenstackResourceResolver(conn)
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    is_valid, message = backend.check_server_inputs(
+        conn=conn,
+        federee="EUMETSAT",
+        image_name="Rocky-9.6-20250101000000",
+        security_groups=("ssh", "web", "db"),
+        resolver=resolver,
+    )
+
+    assert is_valid is False
+    assert "web, db" in message
+    conn.get_security_group.assert_not_called()
+
+
+def test_check_server_inputs_reports_every_invalid_input():
+    conn = MagicMock()
+    conn.compute.find_image.return_value = None
+    conn.compute.find_flavor.return_value = None
+    conn.network.find_network.return_value = None
+    conn.network.security_groups.return_value = []
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    is_valid, message = backend.check_server_inputs(
+        conn=conn,
+        federee="EUMETSAT",
+        image_name="missing-image",
+        flavour_name="missing-flavour",
+        networks=("net-a", "net-b"),
+        security_groups=("web",),
+        resolver=OpenstackResourceResolver(conn),
+    )
+
+    assert is_valid is False
+    for expected in (
+        "Unsupported OS image for the EWC CLI: missing-image",
+        "Unknown flavour (missing-flavour)",
+        "Unknown security groups (web)",
+        "Unknown network (net-a)",
+        "Unknown network (net-b)",
+    ):
+        assert expected in message
+
+
+def test_resolve_server_inputs_concurrently():
+    """The lookups wait for each other, so they only complete if run concurrently."""
+    barrier = threading.Barrier(4, timeout=5)
+
+    def lookup(result):
+        def wait(*_, **__):
+            barrier.wait()
+            return result
+
+        return wait
+
+    conn = MagicMock()
+    conn.compute.find_image.side_effect = lookup(
+        SimpleNamespace(id="img-1", name="image")
+    )
+    conn.compute.find_flavor.side_effect = lookup(
+        SimpleNamespace(id="fl-1", name="small")
+    )
+    conn.network.find_network.side_effect = lookup(
+        SimpleNamespace(id="net-1", name="private")
+    )
+    conn.network.security_groups.side_effect = lookup(
+        [SimpleNamespace(id="sg-1", name="ssh")]
+    )
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    server_inputs = backend.resolve_server_inputs(
+        resolver=OpenstackResourceResolver(conn),
+        image_name="image",
+        flavour_name="small",
+        networks=("private",),
+        security_groups=("ssh",),
+    )
+
+    assert server_inputs.errors == []
+    assert server_inputs.image.id == "img-1"
+    assert server_inputs.flavour.id == "fl-1"
+    assert [network.id for network in server_inputs.networks] == ["net-1"]
+    assert server_inputs.security_groups["ssh"].id == "sg-1"
+
+
+def test_pre_deploy_keypair_overlaps_input_checks(monkeypatch):
+    monkeypatch.setattr(commons_infra, "check_ssh_keys_exist", lambda **_: True)
+    keypair_started = threading.Event()
+
+    def create_keypair(**_):
+        keypair_started.set()
+        return KeyPairResult(True, True), "keypair created"
+
+    backend = MagicMock()
+    backend.create_keypair.side_effect = create_keypair
+    backend.delete_keypair.return_value = (
+        KeyPairResult(False, False),
+        "cannot delete keypair",
+    )
+
+    def check_server_inputs(**_):
+        # The keypair is created while the inputs are checked
+        assert keypair_started.wait(timeout=5)
+        return True, ""
+
+    backend.check_server_inputs.side_effect = check_server_inputs
+    monkeypatch.setattr(
+        commons_infra,
+        "resolve_image_and_flavor",
+        lambda **_: (
+            0,
+            "",
+            {
+                "image_name": "img",
+                "normalized_image_name": "img",
+                "flavour_name": "small",
+            },
+        ),
+    )
+    server_inputs = CreateServerInputs(
+        server_name="vm", keypair_name="key", networks=("private",)
+    ).model_dump()
+
+    status_code, _, _ = commons_infra.pre_deploy_server_setup(
+        backend,
+        MagicMock(),
+        "EUMETSAT",
+        "WAW3-1",
+        server_inputs,
+        "id_rsa.pub",
+        "id_rsa",
+    )
+    assert status_code == 0
+
+    # A failed keypair deletion reports its own message
+    status_code, message, _ = commons_infra.pre_deploy_server_setup(
+        backend,
+        MagicMock(),
+        "EUMETSAT",
+        "WAW3-1",
+        server_inputs,
+        "id_rsa.pub",
+        "id_rsa",
+        force=True,
+    )
+    assert status_code == 1
+    assert "cannot delete keypair" in message
+
+
+@pytest.mark.parametrize(
+    "federee, region, addresses, networks",
+    [
+        (
+            "EUMETSAT",
+            "WAW3-1",
+            {"private": [{"OS-EXT-IPS:type": "fixed", "addr": "10.0.0.5"}]},
+            [],
+        ),
+        (
+            "ECMWF",
+            "CCI1",
+            {"private-a1b2": [{"OS-EXT-IPS:type": "fixed", "addr": "10.0.0.5"}]},
+            [
+                SimpleNamespace(id="net-private", name="private-a1b2"),
+                SimpleNamespace(id="net-external", name="external-internet"),
+            ],
+        ),
+    ],
+)
+def test_create_server_command_api_calls(
+    monkeypatch, federee, region, addresses, networks
+):
+    """Each resource is requested once per deployment."""
+    monkeypatch.setattr(waiters.time, "sleep", lambda *_: None)
+    monkeypatch.setattr(commons_infra, "check_ssh_keys_exist", lambda **_: True)
+
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+    monkeypatch.setattr(
+        backend,
+        "create_keypair",
+        lambda **_: (KeyPairResult(True, False), "keypair ok"),
+    )
+
+    image = SimpleNamespace(
+        id="img-1", name="Rocky-9.6-20250101000000", created_at="2025-01-01"
+    )
+    old_image = SimpleNamespace(
+        id="img-0", name="Rocky-9.5-20240101000000", created_at="2024-01-01"
+    )
+    server = FakeServer(
+        id="srv-1",
+        name="vm",
+        status="ACTIVE",
+        image={"id": "img-1"},
+        addresses=addresses,
+        security_groups=[{"name": "ssh"}],
+    )
+    floating_addresses = {
+        name: values + [{"OS-EXT-IPS:type": "floating", "addr": "136.0.0.5"}]
+        for name, values in addresses.items()
+    }
+
+    conn = MagicMock()
+    conn.image.images.return_value = [image, old_image]
+    conn.compute.find_flavor.return_value = SimpleNamespace(id="flavor-1", name="small")
+    conn.network.security_groups.return_value = [SimpleNamespace(id="sg-1", name="ssh")]
+    conn.network.find_network.side_effect = lambda name: SimpleNamespace(
+        id=f"net-{name}", name=name
+    )
+    conn.network.networks.return_value = networks
+    # The server is looked up by name before its creation, then fetched by ID
+    conn.compute.servers.return_value = []
+    conn.compute.get_server.return_value = FakeServer(
+        server, addresses=floating_addresses
+    )
+    conn.compute.wait_for_server.return_value = server
+    floating_ip = SimpleNamespace(
+        id="fip-1", floating_ip_address="136.0.0.5", port_id="port-1", status="ACTIVE"
+    )
+    conn.network.ips.return_value = [
+        SimpleNamespace(
+            id="fip-1", floating_ip_address="136.0.0.5", port_id=None, tags=[]
+        )
+    ]
+    conn.network.get_ip.return_value = floating_ip
+    conn.network.ports.return_value = [SimpleNamespace(id="port-1")]
+    conn.network.get_port.return_value = SimpleNamespace(id="port-1", status="ACTIVE")
+
+    server_inputs = CreateServerInputs(
+        server_name="vm", keypair_name="key", external_ip=True, image_name="Rocky-9"
+    )
+
+    status_code, _, outputs = create_server_command(
+        backend,
+        conn,
+        federee,
+        region,
+        server_inputs,
+        ssh_public_key_path="id_rsa.pub",
+        ssh_private_key_path="id_rsa",
+    )
+
+    assert status_code == 0
+    assert outputs["external_ip_machine"] == "136.0.0.5"
+    assert conn.compute.create_server.call_args.kwargs["image_id"] == "img-1"
+
+    assert conn.image.images.call_count == 1
+    assert conn.compute.images.call_count == 0
+    assert conn.compute.find_image.call_count == 0
+    assert conn.compute.find_flavor.call_count == 1
+    conn.network.security_groups.assert_called_once_with(name=["ssh"])
+    conn.get_security_group.assert_not_called()
+    conn.get_server.assert_not_called()
+    # Only the floating IPs of the external network are reused
+    conn.network.ips.assert_called_once_with(
+        floating_network_id="net-external", status="DOWN"
+    )
+    conn.network.create_ip.assert_not_called()
+    conn.compute.servers.assert_called_with(details=True, name="^vm$")
+    conn.compute.get_server.assert_called_with("srv-1")
+
+    if federee == "ECMWF":
+        # private and external networks both come from the single listing
+        assert conn.network.networks.call_count == 1
+        assert conn.network.find_network.call_count == 0
+    else:
+        # private and external networks
+        assert conn.network.networks.call_count == 0
+        assert conn.network.find_network.call_count == 2
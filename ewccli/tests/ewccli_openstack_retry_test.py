@@ -0,0 +1,152 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test retry of Openstack operations."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import openstack
+import pytest
+from keystoneauth1 import exceptions as keystone_exceptions
+
+from ewccli.backends.openstack import retry
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.retry import RetryPolicy
+from ewccli.backends.openstack.retry import get_retry_policy
+from ewccli.backends.openstack.retry import is_transient_error
+from ewccli.backends.openstack.retry import retry_call
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the pauses instead of sleeping, advancing the monotonic clock."""
+    slept = []
+    clock = [0.0]
+
+    def sleep(seconds):
+        slept.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(retry.time, "sleep", sleep)
+    monkeypatch.setattr(retry.time, "monotonic", lambda: clock[0])
+    return slept
+
+
+def http_error(status_code, error_class=openstack.exceptions.HttpException):
+    """HTTP error as raised by openstacksdk for a response with the status code."""
+    error = error_class(message=f"HTTP {status_code}")
+    error.status_code = status_code
+    return error
+
+
+def failing(errors, result="done"):
+    """Operation raising the errors in turn, then returning the result."""
+    errors = iter(errors)
+
+    def operation():
+        error = next(errors, None)
+        if error is not None:
+            raise error
+        return result
+
+    return operation
+
+
+@pytest.mark.parametrize(
+    "error, transient",
+    [
+        (http_error(503), True),
+        (http_error(409, openstack.exceptions.ConflictException), True),
+        (openstack.exceptions.ResourceTimeout("timeout"), True),
+        (keystone_exceptions.ConnectFailure("connection refused"), True),
+        (http_error(400, openstack.exceptions.BadRequestException), False),
+        (http_error(403, openstack.exceptions.ForbiddenException), False),
+        (http_error(404, openstack.exceptions.NotFoundException), False),
+        (ValueError("bug"), False),
+    ],
+)
+def test_is_transient_error(error, transient):
+    assert is_transient_error(error) is transient
+
+
+def test_retry_call_backs_off_with_jitter(sleeps):
+    policy = RetryPolicy(attempts=4, initial_delay_s=2, max_delay_s=5, jitter=0.25)
+    error = http_error(503)
+
+    assert retry_call(failing([error] * 3), policy, "operation") == "done"
+
+    assert len(sleeps) == 3
+    for pause_s, delay_s in zip(sleeps, (2, 4, 5)):
+        assert delay_s * 0.75 <= pause_s <= delay_s * 1.25
+
+
+def test_retry_call_fatal_error_not_retried(sleeps):
+    cleanups = []
+
+    with pytest.raises(ValueError):
+        retry_call(
+            failing([ValueError("bug")]),
+            RetryPolicy(),
+            "operation",
+            on_failure=cleanups.append,
+        )
+
+    assert sleeps == []
+    assert len(cleanups) == 1
+
+
+def test_retry_call_deadline(sleeps):
+    policy = RetryPolicy(attempts=10, initial_delay_s=4, jitter=0, deadline_s=10)
+    error = openstack.exceptions.ResourceTimeout("timeout")
+
+    with pytest.raises(openstack.exceptions.ResourceTimeout):
+        retry_call(failing([error] * 10), policy, "operation")
+
+    # 4s and 8s pauses would end after the deadline
+    assert sleeps == [4]
+
+
+def test_get_retry_policy_overrides():
+    policy = get_retry_policy("create_volumes", attempts=5, initial_delay_s=None)
+
+    assert policy.attempts == 5
+    assert policy.initial_delay_s == RetryPolicy().initial_delay_s
+
+
+def test_create_volumes_recovers_from_transient_error(sleeps):
+    conn = MagicMock()
+    created = []
+
+    def create_volume(size, name, **_):
+        # The second volume fails once with a transient error
+        if size == 20 and not any(vol.size == 20 for vol in created):
+            created.append(SimpleNamespace(id="failed", size=20))
+            raise http_error(503)
+        vol = SimpleNamespace(
+            id=f"vol-{len(created) + 1}", name=name, size=size, status="available"
+        )
+        created.append(vol)
+        return vol
+
+    conn.block_storage.create_volume.side_effect = create_volume
+    conn.block_storage.volumes.side_effect = lambda **_: [
+        v for v in created if v.id != "failed"
+    ]
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    result, volumes, _ = backend.create_volumes(
+        conn=conn, base_name="vm", volume_sizes=(10, 20)
+    )
+
+    assert result.success
+    assert [vol.size for vol in volumes] == [10, 20]
+    # Only the failed volume is created again, the available one is kept
+    assert conn.block_storage.create_volume.call_count == 3
+    conn.block_storage.delete_volume.assert_not_called()
+    assert len(sleeps) == 1 and sleeps[0] < 30
@@ -0,0 +1,202 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test Openstack waiters."""
+
+import threading
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import openstack
+import pytest
+
+from ewccli.backends.openstack import retry
+from ewccli.backends.openstack import waiters
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record the sleeps instead of sleeping, advancing the monotonic clock."""
+    slept = []
+    clock = [0.0]
+
+    def sleep(seconds):
+        slept.append(seconds)
+        clock[0] += seconds
+
+    monkeypatch.setattr(waiters.time, "sleep", sleep)
+    monkeypatch.setattr(waiters.time, "monotonic", lambda: clock[0])
+    return slept
+
+
+def test_wait_for_returns_immediately(sleeps):
+    assert (
+        waiters.wait_for(lambda: "ready", description="ready", timeout_s=10) == "ready"
+    )
+    assert sleeps == []
+
+
+def test_wait_for_backs_off(sleeps):
+    results = iter([None, None, None, None, None, "ready"])
+
+    assert (
+        waiters.wait_for(lambda: next(results), description="ready", timeout_s=60)
+        == "ready"
+    )
+    assert sleeps == [1, 2, 4, 8, 10]
+
+
+def test_wait_for_deadline(sleeps):
+    with pytest.raises(TimeoutError):
+        waiters.wait_for(lambda: False, description="never", timeout_s=5)
+
+    assert sum(sleeps) == 5
+
+
+def test_wait_for_resource_deadline(sleeps):
+    with pytest.raises(openstack.exceptions.ResourceTimeout):
+        waiters.wait_for_resource(lambda: None, description="server", timeout_s=5)
+
+
+def test_delete_server_waits_until_gone(sleeps):
+    conn = MagicMock()
+    conn.compute.servers.return_value = [
+        SimpleNamespace(id="srv-1", name="vm", metadata={"deployed": "ewccli"})
+    ]
+    conn.compute.find_server.side_effect = [SimpleNamespace(id="srv-1"), None]
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    result, _ = backend.delete_server(conn=conn, server_name="vm")
+
+    assert result.success and result.changed
+    assert conn.compute.find_server.call_count == 2
+    assert sleeps == [1]
+
+
+def test_delete_server_timeout(sleeps):
+    conn = MagicMock()
+    conn.compute.servers.return_value = [
+        SimpleNamespace(id="srv-1", name="vm", metadata={"deployed": "ewccli"})
+    ]
+    conn.compute.find_server.return_value = SimpleNamespace(id="srv-1")
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    result, message = backend.delete_server(conn=conn, server_name="vm", wait_time_s=30)
+
+    assert not result.success
+    assert "ResourceTimeout/delete" in message
+
+
+def test_floating_ip_active_waits_for_port(sleeps):
+    conn = MagicMock()
+    conn.network.get_ip.side_effect = [
+        SimpleNamespace(id="fip-1", port_id=None, status="DOWN"),
+        SimpleNamespace(id="fip-1", port_id="port-1", status="ACTIVE"),
+        SimpleNamespace(id="fip-1", port_id="port-1", status="ACTIVE"),
+    ]
+    conn.network.get_port.side_effect = [
+        SimpleNamespace(id="port-1", status="DOWN"),
+        SimpleNamespace(id="port-1", status="ACTIVE"),
+    ]
+
+    floating_ip = waiters.wait_for_floating_ip_active(conn, "fip-1", "port-1")
+
+    assert floating_ip.status == "ACTIVE"
+    assert sleeps == [1, 2]
+
+
+def test_create_volumes_polls_with_one_listing(sleeps, monkeypatch):
+    monkeypatch.setattr(retry.time, "sleep", lambda seconds: None)
+    conn = MagicMock()
+    created = []
+    polls = []
+
+    def create_volume(size, name, **_):
+        # The first 20 GB volume ends in error status
+        status = (
+            "error"
+            if size == 20 and not any(v.size == 20 for v in created)
+            else "creating"
+        )
+        vol = SimpleNamespace(
+            id=f"vol-{len(created) + 1}", name=name, size=size, status=status
+        )
+        created.append(vol)
+        return vol
+
+    def volumes(**kwargs):
+        polls.append(kwargs["metadata"])
+        listing = [SimpleNamespace(**vars(v)) for v in created]
+        for vol in created:
+            vol.status = "available" if vol.status == "creating" else vol.status
+        return listing
+
+    conn.block_storage.create_volume.side_effect = create_volume
+    conn.block_storage.volumes.side_effect = volumes
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    result, vols, _ = backend.create_volumes(
+        conn=conn, base_name="vm", volume_sizes=(10, 20, 30)
+    )
+
+    assert result.success
+    assert [v.size for v in vols] == [10, 20, 30]
+    # One listing per poll whatever the number of volumes: two polls for each of the two attempts
+    assert len(polls) == 4
+    assert polls[0] == {"ewccli": "true", "server_name": "vm"}
+    # Only the volume in error status is deleted and created again
+    conn.block_storage.delete_volume.assert_called_once()
+    assert conn.block_storage.delete_volume.call_args.args[0].status == "error"
+    assert len({v.name for v in created}) == 4
+
+
+def test_delete_volumes_issues_deletes_concurrently(sleeps):
+    conn = MagicMock()
+    volumes = [
+        SimpleNamespace(id=f"vol-{idx}", name=f"vol-{idx}", status="available")
+        for idx in range(3)
+    ]
+    listings = []
+    barrier = threading.Barrier(len(volumes), timeout=5)
+
+    def delete_volume(vol, **_):
+        # Every delete must be in flight before any of them returns
+        barrier.wait()
+        vol.status = "deleting"
+
+    def list_volumes(**kwargs):
+        listings.append(kwargs)
+        if len(listings) == 1:
+            return volumes
+        # vol-2 lingers for one more poll, vol-1 fails to delete
+        remaining = [
+            v
+            for v in volumes
+            if v.id == "vol-1" or (v.id == "vol-2" and len(listings) == 2)
+        ]
+        for vol in remaining:
+            vol.status = "error_deleting" if vol.id == "vol-1" else vol.status
+        return remaining
+
+    conn.block_storage.delete_volume.side_effect = delete_volume
+    conn.block_storage.volumes.side_effect = list_volumes
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+
+    result, deleted, msg = backend.delete_volumes(conn=conn, base_name="vm")
+
+    assert not result.success
+    assert [v.id for v in deleted] == ["vol-0", "vol-2"]
+    assert msg == "Deleted 2 volumes, 1 failed"
+    # One listing to select the volumes, then one per poll
+    assert len(listings) == 3
+    assert all(
+        listing["metadata"] == {"ewccli": "true", "server_name": "vm"}
+        for listing in listings
+    )
+    conn.block_storage.wait_for_delete.assert_not_called()
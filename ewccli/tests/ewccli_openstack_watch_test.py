@@ -0,0 +1,104 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test the watch of the Openstack servers."""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+from ewccli.backends.openstack.watch import ServerEvent
+from ewccli.backends.openstack.watch import ServerWatcher
+
+
+class FakeServer(SimpleNamespace):
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
+
+def make_server(server_id, status, updated_at, tags=("ewccli",), name=None):
+    return FakeServer(
+        id=server_id,
+        name=name or f"vm-{server_id}",
+        status=status,
+        updated_at=updated_at,
+        tags=list(tags),
+        metadata={},
+    )
+
+
+def test_watcher_applies_changes_since_deltas():
+    conn = MagicMock()
+    conn.compute.servers.side_effect = [
+        # Snapshot
+        [
+            make_server("1", "BUILD", "2026-01-01T10:00:00Z"),
+            make_server("2", "ACTIVE", "2026-01-01T09:00:00Z"),
+        ],
+        # Changes: 1 is active, 2 is deleted, 3 appears, a manual server is ignored
+        [
+            make_server("1", "ACTIVE", "2026-01-01T10:05:00Z"),
+            make_server("2", "DELETED", "2026-01-01T10:06:00Z", tags=()),
+            make_server("3", "BUILD", "2026-01-01T10:07:00Z"),
+            make_server("4", "ACTIVE", "2026-01-01T10:08:00Z", tags=()),
+        ],
+        # The most recent change is returned again, without any transition
+        [make_server("4", "ACTIVE", "2026-01-01T10:08:00Z", tags=())],
+    ]
+    watcher = ServerWatcher(conn)
+
+    assert watcher.snapshot() == 2
+    assert watcher.poll() == [
+        ServerEvent("1", "vm-1", "BUILD", "ACTIVE"),
+        ServerEvent("2", "vm-2", "ACTIVE", "DELETED"),
+        ServerEvent("3", "vm-3", None, "BUILD"),
+    ]
+    assert watcher.poll() == []
+
+    calls = [c.kwargs for c in conn.compute.servers.call_args_list]
+    assert calls == [
+        {"details": True, "tags": "ewccli"},
+        {"details": True, "changes_since": "2026-01-01T10:00:00Z"},
+        {"details": True, "changes_since": "2026-01-01T10:08:00Z"},
+    ]
+    assert set(watcher.servers) == {"1", "3"}
+
+
+def test_watcher_failed_poll_keeps_watermark():
+    conn = MagicMock()
+    conn.compute.servers.side_effect = [
+        [make_server("1", "BUILD", "2026-01-01T10:00:00Z")],
+        RuntimeError("connection reset"),
+        [make_server("1", "ERROR", "2026-01-01T10:05:00Z")],
+    ]
+    watcher = ServerWatcher(conn)
+    watcher.snapshot()
+
+    try:
+        watcher.poll()
+    except RuntimeError:
+        pass
+
+    assert watcher.poll() == [ServerEvent("1", "vm-1", "BUILD", "ERROR")]
+    assert (
+        conn.compute.servers.call_args.kwargs["changes_since"] == "2026-01-01T10:00:00Z"
+    )
+
+
+def test_watcher_lists_legacy_servers():
+    legacy = make_server("1", "ACTIVE", "2026-01-01T10:00:00Z", tags=())
+    legacy.metadata = {"deployed": "ewccli"}
+    conn = MagicMock()
+    conn.compute.servers.return_value = [
+        legacy,
+        make_server("2", "ACTIVE", "2026-01-01T09:00:00Z", tags=()),
+    ]
+    watcher = ServerWatcher(conn, legacy_servers=True)
+
+    # Servers without tag are only filtered on client side
+    assert watcher.snapshot() == 1
+    conn.compute.servers.assert_called_once_with(details=True)
@@ -0,0 +1,158 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test Openstack Keystone token cache."""
+
+import json
+import stat
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from keystoneauth1 import access
+from keystoneauth1.identity import v3
+
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack import token_cache
+from ewccli.configuration import config as ewc_hub_config
+
+
+def make_auth_state(expires_in_s: int) -> str:
+    """Build a keystone v3 auth state expiring in `expires_in_s` seconds."""
+    expires_at = datetime.now(timezone.utc) + timedelta(seconds=expires_in_s)
+    return json.dumps(
+        {
+            "auth_token": "gAAAA-token",
+            "body": {
+                "token": {
+                    "expires_at": expires_at.strftime("%Y-%m-%dT%H:%M:%S.000000Z"),
+                    "issued_at": datetime.now(timezone.utc).strftime(
+                        "%Y-%m-%dT%H:%M:%S.000000Z"
+                    ),
+                    "methods": ["application_credential"],
+                    "catalog": [],
+                }
+            },
+        }
+    )
+
+
+@pytest.fixture
+def cache_root(tmp_path, monkeypatch):
+    """Redirect the EWC CLI caches to a temporary directory."""
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+def test_token_cache_file_is_keyed_per_profile_and_credentials(cache_root):
+    path_a = token_cache.get_token_cache_file("cred-a", "https://auth", profile="p1")
+    path_b = token_cache.get_token_cache_file("cred-b", "https://auth", profile="p1")
+    path_c = token_cache.get_token_cache_file("cred-a", "https://other", profile="p1")
+    path_d = token_cache.get_token_cache_file("cred-a", "https://auth", profile="p2")
+
+    assert len({path_a, path_b, path_c, path_d}) == 4
+    assert path_a.is_relative_to(cache_root / "p1")
+    assert "cred-a" not in str(path_a)
+
+
+def test_save_auth_state_restrictive_permissions(cache_root):
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth")
+
+    token_cache.save_auth_state(cache_file, make_auth_state(3600))
+
+    assert stat.S_IMODE(cache_file.stat().st_mode) == 0o600
+    assert stat.S_IMODE(cache_file.parent.stat().st_mode) == 0o700
+
+
+def test_load_auth_state_valid_token(cache_root):
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth")
+    auth_state = make_auth_state(3600)
+    token_cache.save_auth_state(cache_file, auth_state)
+
+    assert token_cache.load_auth_state(cache_file) == auth_state
+
+
+@pytest.mark.parametrize("expires_in_s", [-60, 60])
+def test_load_auth_state_expired_token(cache_root, expires_in_s):
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth")
+    token_cache.save_auth_state(cache_file, make_auth_state(expires_in_s))
+
+    assert token_cache.load_auth_state(cache_file) is None
+
+
+def test_load_auth_state_corrupted_file(cache_root):
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth")
+    cache_file.parent.mkdir(parents=True, exist_ok=True)
+    cache_file.write_text("not json")
+
+    assert token_cache.load_auth_state(cache_file) is None
+
+
+def make_conn():
+    auth_plugin = MagicMock()
+    return SimpleNamespace(
+        session=SimpleNamespace(auth=auth_plugin), authorize=MagicMock()
+    )
+
+
+def test_connect_authorizes_and_caches_on_miss(cache_root):
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+    backend.profile = "p1"
+    conn = make_conn()
+    conn.session.auth.get_auth_state.return_value = make_auth_state(3600)
+
+    backend._authorize_with_token_cache(
+        conn, credential_id="cred", auth_url="https://auth"
+    )
+
+    conn.authorize.assert_called_once()
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth", profile="p1")
+    assert cache_file.exists()
+
+
+def test_connect_reuses_cached_token_without_keystone_call(cache_root):
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+    backend.profile = "p1"
+    auth_state = make_auth_state(3600)
+    token_cache.save_auth_state(
+        token_cache.get_token_cache_file("cred", "https://auth", profile="p1"),
+        auth_state,
+    )
+    conn = make_conn()
+
+    backend._authorize_with_token_cache(
+        conn, credential_id="cred", auth_url="https://auth"
+    )
+
+    conn.authorize.assert_not_called()
+    conn.session.auth.set_auth_state.assert_called_once_with(auth_state)
+
+
+def test_renewed_token_is_cached_again(cache_root):
+    cache_file = token_cache.get_token_cache_file("cred", "https://auth")
+    auth_plugin = v3.ApplicationCredential(
+        auth_url="https://auth",
+        application_credential_id="cred",
+        application_credential_secret="secret",
+    )
+    auth_plugin.set_auth_state(make_auth_state(3600))
+    renewed_state = json.loads(make_auth_state(7200))
+    # keystoneauth re-authenticates against Keystone once the token expires
+    auth_plugin.get_auth_ref = lambda session, **kwargs: access.create(
+        body=renewed_state["body"], auth_token="gAAAA-renewed"
+    )
+
+    token_cache.save_auth_state_on_reauthentication(auth_plugin, cache_file)
+    auth_plugin.get_access(session=None)
+    assert not cache_file.exists()
+
+    auth_plugin.invalidate()
+    auth_plugin.get_access(session=None)
+
+    assert json.loads(cache_file.read_text())["auth_token"] == "gAAAA-renewed"
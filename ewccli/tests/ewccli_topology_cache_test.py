@@ -0,0 +1,155 @@
+#!/usr/bin/env python
+#
+# Package Name: ewccli
+# License: GPL-3.0-or-later
+# Copyright (c) 2025 EUMETSAT, ECMWF for European Weather Cloud
+# See the LICENSE file for more details
+
+
+"""Test Openstack tenant topology cache."""
+
+import os
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ewccli.configuration import config as ewc_hub_config
+from ewccli.backends.openstack.backend_ostack import OpenstackBackend
+from ewccli.backends.openstack.resolver import OpenstackResourceResolver
+from ewccli.backends.openstack.topology_cache import TopologyCache
+from ewccli.backends.openstack.topology_cache import get_topology_cache_file
+from ewccli.commands.hub.hub_backends import HUB_ENV_VARIABLES_MAP
+from ewccli.commands.hub.hub_backends import get_hub_item_env_variable_value
+
+
+@pytest.fixture
+def cache_file(tmp_path):
+    return get_topology_cache_file(
+        credential_id="cred", auth_url="https://keystone/v3/", cache_path=tmp_path
+    )
+
+
+@pytest.fixture
+def conn():
+    conn = MagicMock()
+    conn.network.networks.return_value = [
+        SimpleNamespace(id="net-1", name="private-abc"),
+        SimpleNamespace(id="net-2", name="external-internet"),
+    ]
+    conn.network.subnets.return_value = [
+        SimpleNamespace(id="sub-1", name="private-abc-subnet", network_id="net-1"),
+    ]
+    conn.network.security_groups.return_value = [
+        SimpleNamespace(id="sg-1", name="ssh", description="SSH"),
+    ]
+    conn.compute.flavors.return_value = [
+        SimpleNamespace(id="fl-1", name="small", vcpus=2, ram=4096, disk=30),
+    ]
+    return conn
+
+
+def resolve_topology(resolver):
+    return (
+        resolver.find_network("private-abc").id,
+        resolver.get_security_group("ssh").id,
+        resolver.find_flavor("small").id,
+    )
+
+
+def test_topology_cache_file_is_private(cache_file, conn):
+    TopologyCache(cache_file, ttl_s=60).put("network", conn.network.networks())
+
+    assert cache_file.parent.name == "topology"
+    assert oct(os.stat(cache_file).st_mode & 0o777) == "0o600"
+
+
+def test_topology_reused_across_invocations(cache_file, conn):
+    first = OpenstackResourceResolver(
+        conn, topology=TopologyCache(cache_file, ttl_s=60)
+    )
+    assert resolve_topology(first) == ("net-1", "sg-1", "fl-1")
+
+    second = OpenstackResourceResolver(
+        MagicMock(), topology=TopologyCache(cache_file, ttl_s=60)
+    )
+    assert resolve_topology(second) == ("net-1", "sg-1", "fl-1")
+    assert second.find_flavor("fl-1").ram == 4096
+
+    second.conn.network.networks.assert_not_called()
+    second.conn.network.security_groups.assert_not_called()
+    second.conn.compute.flavors.assert_not_called()
+    second.conn.network.find_network.assert_not_called()
+    second.conn.get_security_group.assert_not_called()
+    second.conn.compute.find_flavor.assert_not_called()
+
+
+@pytest.mark.parametrize("ttl_s, refresh", [(0, False), (60, True)])
+def test_topology_stale_or_refreshed(cache_file, conn, ttl_s, refresh):
+    TopologyCache(cache_file, ttl_s=60).put("network", conn.network.networks())
+    conn.network.networks.reset_mock()
+    time.sleep(0.01)
+
+    resolver = OpenstackResourceResolver(
+        conn, topology=TopologyCache(cache_file, ttl_s=ttl_s, refresh=refresh)
+    )
+    resolver.networks()
+
+    conn.network.networks.assert_called_once()
+
+
+def test_topology_miss_invalidates_once(cache_file, conn):
+    TopologyCache(cache_file, ttl_s=60).put("network", conn.network.networks())
+    conn.network.networks.reset_mock()
+    conn.network.networks.return_value = [
+        SimpleNamespace(id="net-3", name="new-network")
+    ]
+    resolver = OpenstackResourceResolver(
+        conn, topology=TopologyCache(cache_file, ttl_s=60)
+    )
+
+    assert resolver.find_network("new-network").id == "net-3"
+    conn.network.networks.assert_called_once()
+    conn.network.find_network.assert_not_called()
+
+    # Listed during this command, the API is asked directly
+    conn.network.find_network.return_value = None
+    assert resolver.find_network("unknown") is None
+    conn.network.networks.assert_called_once()
+    conn.network.find_network.assert_called_once_with("unknown")
+
+    cached = TopologyCache(cache_file, ttl_s=60).get("network")
+    assert [n.name for n in cached] == ["new-network"]
+
+
+def test_create_resolver_uses_profile_cache(tmp_path, monkeypatch, conn):
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_CACHE_PATH", tmp_path)
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_TOPOLOGY_CACHE", True)
+    backend = OpenstackBackend.__new__(OpenstackBackend)
+    backend.credential_id = "cred"
+    backend.auth_url = "https://keystone/v3"
+    backend.profile = "dev"
+
+    backend.create_resolver(conn).networks()
+
+    assert list((tmp_path / "dev" / "topology").glob("*.json"))
+
+    monkeypatch.setattr(ewc_hub_config, "EWC_CLI_TOPOLOGY_CACHE", False)
+    assert backend.create_resolver(conn).topology is None
+
+
+@pytest.mark.parametrize(
+    "variable_name, expected",
+    [("os_network_name", "private-abc"), ("os_subnet_name", "private-abc-subnet")],
+)
+def test_hub_env_variable_from_topology(conn, variable_name, expected):
+    value = get_hub_item_env_variable_value(
+        hub_item_env_variables_map=dict(HUB_ENV_VARIABLES_MAP),
+        federee="ECMWF",
+        tenancy_name="tenancy",
+        variable_name=variable_name,
+        resolver=OpenstackResourceResolver(conn),
+    )
+
+    assert value == expected
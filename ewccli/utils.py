@@ -9,6 +9,8 @@
 """Utils."""
 
 import os
+import json
+import time
 import base64
 import sys
 import subprocess
@@ -34,6 +36,8 @@ from ewccli.logger import get_logger
 
 _LOGGER = get_logger(__name__)
 
+_ITEMS_REFRESH_LOCK_TIMEOUT_S = 60
+
 
 def _resolve_profile(
     profile: Optional[str] = None,
@@ -446,6 +450,20 @@ def delete_cli_profile(
     )
 
 
+def get_profile_cache_path(
+    profile: Optional[str] = None,
+    cache_path: Optional[Path] = None,
+) -> Path:
+    """Return (and create) the private cache directory of a profile."""
+    cache_path = Path(cache_path or ewc_hub_config.EWC_CLI_CACHE_PATH)
+    profile_cache_path = cache_path / (
+        profile or ewc_hub_config.EWC_CLI_DEFAULT_PROFILE_NAME
+    )
+    profile_cache_path.mkdir(mode=0o700, parents=True, exist_ok=True)
+
+    return profile_cache_path
+
+
 def generate_random_id(length: int = 10):
     """Generate random ID."""
     characters = string.ascii_letters + string.digits
@@ -542,8 +560,55 @@ def run_command_from_host_live(
         return 1, f"\nError running command: {e}"
 
 
+def _items_metadata_path(item_file: Path) -> Path:
+    """Return the path of the HTTP metadata stored next to the items file."""
+    return item_file.with_name(f"{item_file.name}.meta.json")
+
+
+def load_items_metadata(item_file: Path) -> dict:
+    """Load ETag/Last-Modified metadata of the items file, if any."""
+    metadata_file = _items_metadata_path(item_file)
+    try:
+        return json.loads(metadata_file.read_text())
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_items_metadata(item_file: Path, metadata: dict) -> None:
+    """Save ETag/Last-Modified metadata of the items file.
+
+    The metadata is only a cache, failing to write it makes the next
+    revalidation a full download.
+    """
+    metadata_file = _items_metadata_path(item_file)
+    tmp_file = metadata_file.with_name(f"{metadata_file.name}.{os.getpid()}.tmp")
+
+    try:
+        tmp_file.write_text(json.dumps(metadata))
+        os.replace(tmp_file, metadata_file)
+    except OSError as metadata_error:
+        _LOGGER.warning(
+            f"Could not save items metadata {metadata_file}: {metadata_error}"
+        )
+        tmp_file.unlink(missing_ok=True)
+
+
+def items_are_fresh(item_file: Path, ttl_s: int) -> bool:
+    """Check if the items file was validated against the hub within the TTL."""
+    if not item_file.exists():
+        return False
+
+    checked_at = load_items_metadata(item_file).get("checked_at", 0)
+
+    return time.time() - checked_at < ttl_s
+
+
 def download_items(force: bool = False):
-    """Download items for the community hub."""
+    """Download items for the community hub.
+
+    When the items file already exists and force is set, a conditional request
+    (ETag/If-Modified-Since) is sent and the file is only rewritten if it changed.
+    """
     # URL of the YAML file
     url = ewc_hub_config.EWC_CLI_HUB_ITEMS_URL
 
@@ -558,24 +623,118 @@ def download_items(force: bool = False):
         _LOGGER.debug(f"✅ Items file already exist at {item_file}. Skipping download.")
         return
 
-    if force:
+    headers = {}
+    # Validators of the local copy, sent with the conditional request
+    validators = {}
+    if force and item_file.exists():
         _LOGGER.debug(
-            f"✅ Items file already exist at {item_file}. Force enabled, redownloading it."
+            f"✅ Items file already exist at {item_file}. Force enabled, redownloading it if changed."
         )
+        metadata = load_items_metadata(item_file)
+        if metadata.get("url") == url:
+            validators = metadata
+            if metadata.get("etag"):
+                headers["If-None-Match"] = metadata["etag"]
+            if metadata.get("last_modified"):
+                headers["If-Modified-Since"] = metadata["last_modified"]
 
     # Download the file
     try:
         # Add a timeout (e.g., 10 seconds)
-        response = requests.get(url, timeout=10)
+        response = requests.get(url, timeout=10, headers=headers)
         response.raise_for_status()
-        item_file.write_text(response.text)
-        _LOGGER.debug(f"Downloaded to: {item_file}")
+
+        if response.status_code == requests.codes.not_modified:
+            _LOGGER.debug(f"Items file at {item_file} is up to date.")
+        else:
+            validators = {}
+            # Write atomically, other ewc processes may be reading the file
+            tmp_file = item_file.with_name(f"{item_file.name}.{os.getpid()}.tmp")
+            tmp_file.write_text(response.text)
+            os.replace(tmp_file, item_file)
+            _LOGGER.debug(f"Downloaded to: {item_file}")
+
+        _save_items_metadata(
+            item_file,
+            {
+                "url": url,
+                # A 304 may omit the validators, those of the local copy still hold
+                "etag": response.headers.get("ETag") or validators.get("etag"),
+                "last_modified": response.headers.get("Last-Modified")
+                or validators.get("last_modified"),
+                "checked_at": time.time(),
+            },
+        )
     except requests.Timeout:
         _LOGGER.error("⚠️ Request timed out.")
     except requests.RequestException as e:
         _LOGGER.error(f"❌ Failed to download file: {e}")
 
 
+def _refresh_items_worker(lock_file: str):
+    """Refresh the items file, entry point of the background refresh process."""
+    try:
+        download_items(force=True)
+    finally:
+        Path(lock_file).unlink(missing_ok=True)
+
+
+def refresh_items(ttl_s: Optional[int] = None):
+    """Make the items file available without blocking on the network when possible.
+
+    A missing items file is downloaded synchronously. An existing one older than
+    the TTL is served as is while a detached process revalidates it with a
+    conditional request, so the next invocation picks up the changes.
+
+    :param ttl_s: freshness of the items file in seconds,
+        defaults to EWC_CLI_HUB_ITEMS_TTL.
+    """
+    item_file = ewc_hub_config.EWC_CLI_HUB_ITEMS_PATH
+    ttl_s = ewc_hub_config.EWC_CLI_HUB_ITEMS_TTL if ttl_s is None else ttl_s
+
+    if not item_file.exists():
+        download_items()
+        return
+
+    if items_are_fresh(item_file, ttl_s=ttl_s):
+        _LOGGER.debug(f"✅ Items file at {item_file} is fresh. Skipping refresh.")
+        return
+
+    # Only one refresh at a time, ignore locks left over by killed refreshes
+    lock_file = item_file.with_name(f"{item_file.name}.lock")
+    try:
+        if time.time() - lock_file.stat().st_mtime < _ITEMS_REFRESH_LOCK_TIMEOUT_S:
+            _LOGGER.debug("Items file refresh already in progress.")
+            return
+        lock_file.unlink(missing_ok=True)
+    except FileNotFoundError:
+        pass
+
+    try:
+        os.close(os.open(lock_file, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600))
+    except FileExistsError:
+        return
+
+    _LOGGER.debug(f"Items file at {item_file} is stale, refreshing it in background.")
+    try:
+        subprocess.Popen(
+            [
+                sys.executable,
+                "-c",
+                "import sys; from ewccli.utils import _refresh_items_worker; "
+                "_refresh_items_worker(sys.argv[1])",
+                str(lock_file),
+            ],
+            stdin=subprocess.DEVNULL,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,
+        )
+    except OSError as e:
+        lock_file.unlink(missing_ok=True)
+        _LOGGER.debug(f"Could not start background refresh of items file: {e}")
+
+
 def load_ssh_private_key(encoded_key: Optional[str] = None):
     """Load SSH private key"""
     if encoded_key is None: